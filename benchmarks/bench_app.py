@@ -0,0 +1,33 @@
+""" Full runs of all providers against the local stand-in server.
+"""
+import io
+
+from weatherapp.core.app import App
+
+
+def run_app(*argv):
+    stdout = io.StringIO()
+    App(stdout=stdout).run(list(argv))
+    return stdout.getvalue()
+
+
+def bench_run_cold(benchmark, stub_server):
+    output = benchmark(run_app, '--refresh')
+
+    assert '+11 °C' in output and '+12°' in output
+
+
+def bench_run_warm(benchmark, stub_server):
+    run_app()
+    stub_server.requests.clear()
+
+    output = benchmark(run_app)
+
+    assert '+11 °C' in output and '+12°' in output
+    assert stub_server.requests == []
+
+
+def bench_run_warm_async(benchmark, stub_server):
+    run_app()
+
+    assert '+11 °C' in benchmark(run_app, '--async')
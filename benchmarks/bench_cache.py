@@ -0,0 +1,113 @@
+""" Page cache hits, misses and writes of every cache backend.
+"""
+import argparse
+import random
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from weatherapp.core.plugins import CACHE_BACKENDS
+from weatherapp.core.providers import RP5Provider
+
+# size of the pages served by the weather sites
+FULL_PAGE_SIZE = 200 * 1024
+
+
+@pytest.fixture(params=[backend.name for backend in CACHE_BACKENDS])
+def provider(request, workdir):
+    backend = {spec.name: spec for spec in CACHE_BACKENDS}[request.param]
+    cache = backend.load()()
+    provider = RP5Provider.__new__(RP5Provider)
+    provider.app = SimpleNamespace(
+        options=argparse.Namespace(refresh=False), cache=cache)
+    yield provider
+    cache.close()
+
+
+@pytest.fixture
+def page(read_fixture):
+    return read_fixture('rp5_current.html').encode('utf-8')
+
+
+def bench_get_cache_hit(benchmark, provider, page):
+    provider.save_cache('http://rp5/dnipro', page)
+    provider.app.cache.flush()
+
+    assert benchmark(provider.get_cache, 'http://rp5/dnipro') == page
+
+
+def bench_get_cache_miss(benchmark, provider):
+    assert benchmark(provider.get_cache, 'http://rp5/missing') == b''
+
+
+def bench_save_cache(benchmark, provider, page):
+    benchmark(provider.save_cache, 'http://rp5/dnipro', page,
+              {'ETag': '"1"'})
+
+
+def grow_page(page, size, random):
+    """ Page grown to the given size with its own markup.
+
+    Saved pages are trimmed to the parts the parsers read, while pages
+    of the sites are about a hundred times larger. Lines of the page are
+    repeated in random order with other digits, the way forecast lists
+    repeat, until the page has the size of the site page.
+    """
+
+    def other_digit(match):
+        return b'%d' % random.randrange(10)
+
+    lines = page.splitlines(keepends=True)
+    filler = []
+    grown = len(page)
+    while grown < size:
+        filler.append(re.sub(rb'\d', other_digit, random.choice(lines)))
+        grown += len(filler[-1])
+    end = page.rindex(b'</body>')
+    return page[:end] + b''.join(filler) + page[end:]
+
+
+@pytest.fixture
+def pages(read_fixture):
+    names = ['accu_forecast.html', 'accu_current.html', 'rp5_current.html',
+             'accu_forecast_day.html', 'accu_current_winter.html',
+             'rp5_current_winter.html']
+    rng = random.Random(0)
+    return {f'http://site/{name}': grow_page(
+        read_fixture(name).encode('utf-8'), FULL_PAGE_SIZE, rng)
+        for name in names}
+
+
+def get_footprint(cache):
+    """ Size of stored files and disk space allocated for them.
+    """
+
+    directory = getattr(cache, 'directory', None)
+    if directory is not None:
+        files = list(directory.iterdir())
+    else:
+        files = [path for path in cache.path.parent.iterdir()
+                 if path.name.startswith(cache.path.name)]
+    stats = [path.stat() for path in files]
+    return (sum(stat.st_size for stat in stats),
+            sum(stat.st_blocks * 512 for stat in stats))
+
+
+def bench_disk_footprint(benchmark, provider, pages):
+    """ Hit latency over all saved pages with the space they take.
+    """
+
+    cache = provider.app.cache
+    for url, page in pages.items():
+        provider.save_cache(url, page)
+    cache.flush()
+
+    def read_all():
+        return [provider.get_cache(url) for url in pages]
+
+    assert benchmark(read_all) == list(pages.values())
+    size, allocated = get_footprint(cache)
+    benchmark.extra_info['pages bytes'] = sum(map(len, pages.values()))
+    benchmark.extra_info['stored bytes'] = size
+    benchmark.extra_info['allocated bytes'] = allocated
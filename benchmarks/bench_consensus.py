@@ -0,0 +1,26 @@
+""" Comparison of providers over large batches of locations.
+"""
+import random
+
+import pytest
+
+from weatherapp.core.consensus import compare
+from weatherapp.core.reading import ReadingBatch, WeatherReading
+
+
+@pytest.fixture(params=[100, 10000])
+def batch(request):
+    generator = random.Random(request.param)
+    return ReadingBatch(
+        WeatherReading(provider, f'Location {number}',
+                       temp=generator.uniform(-20, 30),
+                       feels_like=generator.uniform(-25, 30),
+                       wind_speed=generator.uniform(0, 40))
+        for number in range(request.param)
+        for provider in ('AccuWeather', 'RP5'))
+
+
+def bench_compare(benchmark, batch):
+    consensus = benchmark(compare, batch)
+
+    assert len(consensus.locations) * 2 == len(batch)
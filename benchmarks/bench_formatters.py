@@ -0,0 +1,25 @@
+""" Rendering of weather info by output formatters.
+"""
+import io
+
+from weatherapp.core.formatters import CombinedTableFormatter, TableFormatter
+
+WEATHER_INFO = {'cond': 'хмарно', 'temp': '+11 °C', 'feels_like': '+9 °C',
+                'wind': 'Вітер11 км/год, вітер північно-західний'}
+
+
+def bench_table_emit(benchmark):
+    formatter = TableFormatter()
+
+    assert benchmark(formatter.emit, ['RP5', 'Dnipro'], WEATHER_INFO)
+
+
+def bench_combined_table(benchmark):
+    def render():
+        formatter = CombinedTableFormatter(io.StringIO())
+        for number in range(5000):
+            formatter.write('RP5', f'Location {number}', WEATHER_INFO)
+        formatter.end()
+        return formatter.stdout.getvalue()
+
+    assert benchmark(render)
@@ -0,0 +1,48 @@
+""" History store with millions of rows from scheduled polling.
+"""
+import pytest
+
+from weatherapp.core.history import HistoryStore
+from weatherapp.core.reading import WeatherReading
+
+LOCATIONS = 1000
+POLLS = 1000  # a reading of every location every 5 minutes for 3.5 days
+INTERVAL = 300
+
+
+@pytest.fixture(scope='module')
+def history(tmp_path_factory):
+    store = HistoryStore(tmp_path_factory.mktemp('history') / 'history.db')
+    for poll in range(POLLS):
+        store.record(WeatherReading('RP5', f'Location {number}',
+                                    temp=number % 40 - 20,
+                                    timestamp=poll * INTERVAL)
+                     for number in range(LOCATIONS))
+    yield store
+    store.close()
+
+
+def bench_record_run(benchmark, history):
+    """ Recording readings of a run of all locations.
+    """
+
+    moments = iter(range(POLLS * INTERVAL, 10 ** 9, INTERVAL))
+
+    def record():
+        timestamp = next(moments)
+        return history.record(
+            WeatherReading('RP5', f'Location {number}', timestamp=timestamp)
+            for number in range(LOCATIONS))
+
+    assert benchmark(record) == LOCATIONS
+
+
+def bench_query_day(benchmark, history):
+    """ Last day of a location out of a million rows.
+    """
+
+    since = (POLLS - 288) * INTERVAL
+    readings = benchmark(history.query, 'Location 500', since,
+                         POLLS * INTERVAL)
+
+    assert len(readings) == 288
@@ -0,0 +1,33 @@
+""" Extraction of weather info from saved pages by every parser engine.
+"""
+import pytest
+
+from weatherapp.core.config import PARSER_ENGINES
+from weatherapp.core.providers import AccuWeatherProvider, RP5Provider
+
+
+@pytest.mark.parametrize('engine', PARSER_ENGINES)
+def bench_rp5_weather_info(benchmark, engine, create_provider,
+                           read_fixture):
+    provider = create_provider(RP5Provider, engine)
+    content = read_fixture('rp5_current.html')
+
+    assert benchmark(provider.get_weather_info, content)['temp']
+
+
+@pytest.mark.parametrize('engine', PARSER_ENGINES)
+def bench_accu_current_day_url(benchmark, engine, create_provider,
+                               read_fixture):
+    provider = create_provider(AccuWeatherProvider, engine)
+    content = read_fixture('accu_forecast.html')
+
+    assert benchmark(provider.get_current_day_url, content)
+
+
+@pytest.mark.parametrize('engine', PARSER_ENGINES)
+def bench_accu_current_day_info(benchmark, engine, create_provider,
+                                read_fixture):
+    provider = create_provider(AccuWeatherProvider, engine)
+    content = read_fixture('accu_current.html')
+
+    assert benchmark(provider.get_current_day_info, content)['temp']
@@ -0,0 +1,16 @@
+""" Cost of instrumentation with profiling off and on.
+"""
+from weatherapp.core.profiling import NULL_PROFILER, Profiler
+
+
+def span(profiler):
+    with profiler.span('rp5', 'fetch') as stage:
+        stage.add('fetched bytes', 100)
+
+
+def bench_span_disabled(benchmark):
+    benchmark(span, NULL_PROFILER)
+
+
+def bench_span_enabled(benchmark):
+    benchmark(span, Profiler())
@@ -0,0 +1,32 @@
+""" Typed readings of large batch runs.
+"""
+import sys
+
+from weatherapp.core.reading import ReadingBatch, WeatherReading
+
+WEATHER_INFO = {'cond': 'хмарно', 'temp': '+11 °C', 'feels_like': '+9 °C',
+                'wind': 'Вітер11 км/год, вітер північно-західний'}
+SIZE = 10000
+
+
+def bench_from_info(benchmark):
+    reading = benchmark(WeatherReading.from_info, 'RP5', 'Dnipro',
+                        WEATHER_INFO)
+
+    assert reading.temp == 11
+
+
+def bench_batch_append(benchmark):
+    readings = [WeatherReading.from_info('RP5', f'Location {number}',
+                                         WEATHER_INFO)
+                for number in range(SIZE)]
+
+    batch = benchmark(ReadingBatch, readings)
+
+    assert len(batch) == SIZE
+    # numeric columns take 8 bytes per reading instead of a float object
+    numeric = sum(sys.getsizeof(batch.column(name))
+                  for name in ReadingBatch.NUMERIC)
+    dicts = sum(sys.getsizeof(dict(WEATHER_INFO)) for _ in range(SIZE))
+    benchmark.extra_info['numeric columns bytes'] = numeric
+    benchmark.extra_info['weather info dicts bytes'] = dicts
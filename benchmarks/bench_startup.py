@@ -0,0 +1,32 @@
+""" Startup time of the command line application.
+
+Every benchmark starts a new interpreter, compare them with
+``bench_interpreter`` to see the cost of the application itself::
+
+    python -m pytest benchmarks
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+
+def run_python(cwd, *args):
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    subprocess.run([sys.executable, *args], cwd=cwd, env=env, check=True,
+                   stdout=subprocess.DEVNULL)
+
+
+def bench_interpreter(benchmark, tmp_path):
+    benchmark(run_python, tmp_path, '-c', 'pass')
+
+
+def bench_import_app(benchmark, tmp_path):
+    benchmark(run_python, tmp_path, '-c', 'import weatherapp.core.app')
+
+
+def bench_providers_command(benchmark, tmp_path):
+    benchmark(run_python, tmp_path, '-m', 'weatherapp.core.client',
+              'providers', '--local')
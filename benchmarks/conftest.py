@@ -0,0 +1,72 @@
+""" Shared fixtures of the benchmark suite.
+
+Benchmarks use pages saved from the weather sites, the same ones the
+tests use, and a local HTTP stand-in instead of the network.
+"""
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from weatherapp.core import config
+from weatherapp.core.tests.server import StubServer
+
+FIXTURES = Path(__file__).parent.parent / 'weatherapp' / 'core' / 'tests' / \
+    'fixtures'
+ACCU_HOST = b'https://www.accuweather.com'
+ACCU_CURRENT_PATH = '/uk/ua/dnipro/322722/current-weather/322722'
+
+
+@pytest.fixture
+def read_fixture():
+    """ Reads saved page by file name.
+    """
+
+    def read(name):
+        return (FIXTURES / name).read_text(encoding='utf-8')
+    return read
+
+
+@pytest.fixture
+def create_provider():
+    """ Creates provider instance without configuration, using given
+    parser engine.
+    """
+
+    def create(provider_class, engine='lxml'):
+        provider = provider_class.__new__(provider_class)
+        provider.app = SimpleNamespace(options=SimpleNamespace(parser=engine))
+        return provider
+    return create
+
+
+@pytest.fixture
+def workdir(tmp_path):
+    """ Empty current working directory for caches and configuration.
+    """
+
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    yield tmp_path
+    os.chdir(cwd)
+
+
+@pytest.fixture
+def stub_server(workdir):
+    """ Stand-in for both weather sites, configured as the locations of
+    the providers.
+    """
+
+    with StubServer() as server:
+        server.pages = {
+            '/accu': (FIXTURES / 'accu_forecast.html').read_bytes().replace(
+                ACCU_HOST, server.url('').encode()),
+            ACCU_CURRENT_PATH: (FIXTURES / 'accu_current.html').read_bytes(),
+            '/rp5': (FIXTURES / 'rp5_current.html').read_bytes(),
+        }
+        (workdir / config.CONFIG_FILE).write_text(
+            f'[accu]\nname = Dnipro\nurl = {server.url("/accu")}\n'
+            f'[rp5]\nname = Dnipro\nurl = {server.url("/rp5")}\n',
+            encoding='utf-8')
+        yield server
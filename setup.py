@@ -7,13 +7,36 @@ setup(
     description="A simple cli weather aggregator",
     url = "https://github.com/midasinc/weatherapp.core",
     packages=find_namespace_packages(),
+    python_requires='>=3.8',
     entry_points={
-        'console_scripts': 'wfapp=weatherapp.core.app:main'
+        'console_scripts': 'wfapp=weatherapp.core.client:main',
+        'weatherapp.providers': [
+            'accu=weatherapp.core.plugins:ACCU_PROVIDER',
+            'rp5=weatherapp.core.plugins:RP5_PROVIDER',
+        ],
+        'weatherapp.commands': [
+            'compare=weatherapp.core.plugins:COMPARE_COMMAND',
+            'configurate=weatherapp.core.plugins:CONFIGURATE_COMMAND',
+            'history=weatherapp.core.plugins:HISTORY_COMMAND',
+            'locations=weatherapp.core.plugins:LOCATIONS_COMMAND',
+            'providers=weatherapp.core.plugins:PROVIDERS_COMMAND',
+            'schedule=weatherapp.core.plugins:SCHEDULE_COMMAND',
+            'serve=weatherapp.core.plugins:SERVE_COMMAND',
+        ],
+        'weatherapp.formatters': [
+            'table=weatherapp.core.plugins:TABLE_FORMATTER',
+            'json=weatherapp.core.plugins:JSON_FORMATTER',
+            'ndjson=weatherapp.core.plugins:NDJSON_FORMATTER',
+            'csv=weatherapp.core.plugins:CSV_FORMATTER',
+            'combined=weatherapp.core.plugins:COMBINED_FORMATTER',
+        ],
     },
     install_requires=[
+        'aiohttp',
         'requests',
         'bs4',
         'lxml',
+        'numpy',
         'prettytable',
     ],
     classifiers=[
@@ -1,7 +1,13 @@
-from weatherapp.core.abstract.command import Command
-from weatherapp.core.abstract.manager import Manager
-from weatherapp.core.abstract.provider import WeatherProvider
-from weatherapp.core.abstract.formatter import Formatter
+from weatherapp.core.plugins import lazy_exports
 
+_EXPORTS = {
+    'CacheBackend': 'weatherapp.core.abstract.cache',
+    'CacheEntry': 'weatherapp.core.abstract.cache',
+    'Command': 'weatherapp.core.abstract.command',
+    'Manager': 'weatherapp.core.abstract.manager',
+    'WeatherProvider': 'weatherapp.core.abstract.provider',
+    'Formatter': 'weatherapp.core.abstract.formatter',
+}
 
-__all__ = ['Command', 'Manager', 'WeatherProvider', 'Formatter']
\ No newline at end of file
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,105 @@
+import abc
+import time
+from collections import namedtuple
+
+
+class CacheEntry(namedtuple('CacheEntry',
+                            ['value', 'fetched', 'ttl', 'headers'])):
+    """ Cached value together with its metadata.
+
+    :param value: cached data
+    :type value: bytes
+    :param fetched: time the value was stored (in seconds since epoch)
+    :type fetched: float
+    :param ttl: how long value is valid (in seconds)
+    :type ttl: float
+    :param headers: response headers kept with the value, e.g. validators
+    :type headers: dict
+    """
+
+    __slots__ = ()
+
+    def is_valid(self, stale_window=0):
+        """ Check if entry is not expired yet.
+
+        :param stale_window: how long after expiration entry may still be
+                             used (in seconds)
+        :type stale_window: float
+        """
+
+        return time.time() < self.fetched + self.ttl + stale_window
+
+
+class CacheBackend(abc.ABC):
+
+    """ Base abstract class for page cache storages.
+
+    Entries are stored under string keys (page urls) together with the
+    time they were fetched, how long they stay valid and optional
+    response headers. Expired entries are kept for ``retention`` seconds
+    so they still can be revalidated on the server.
+    """
+
+    @abc.abstractmethod
+    def get_entry(self, key):
+        """ Get cached entry even if it is expired.
+
+        :param key: entry key
+        :type key: str
+        :return: cached entry or None if it is missing
+        :rtype: CacheEntry
+        """
+
+    def get(self, key):
+        """ Get valid cached value.
+
+        :param key: entry key
+        :type key: str
+        :return: cached value or None if it is missing or expired
+        :rtype: bytes
+        """
+
+        entry = self.get_entry(key)
+        if entry is None or not entry.is_valid():
+            return None
+        return entry.value
+
+    @abc.abstractmethod
+    def set(self, key, value, ttl=None, headers=None):
+        """ Store value under the key.
+
+        :param key: entry key
+        :type key: str
+        :param value: data to store
+        :type value: bytes
+        :param ttl: how long entry is valid (in seconds), backend default
+                    is used if not provided
+        :type ttl: float
+        :param headers: response headers to keep with the value
+        :type headers: dict
+        """
+
+    @abc.abstractmethod
+    def delete(self, key):
+        """ Remove entry from the cache.
+
+        :param key: entry key
+        :type key: str
+        """
+
+    @abc.abstractmethod
+    def purge(self):
+        """ Remove entries expired longer than retention time ago.
+        """
+
+    def flush(self):
+        """ Write pending changes to the storage.
+        """
+
+    def close(self):
+        """ Flush pending changes, remove expired entries and release
+        the storage.
+        """
+
+        self.flush()
+        self.purge()
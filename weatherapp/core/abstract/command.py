@@ -26,3 +26,15 @@ class Command(abc.ABC):
         """ Invoked by application when the command is run.
             Should be overridden in subclass.
         """
+
+    async def run_async(self, argv):
+        """ Asynchronous version of ``run``.
+
+            Commands without native asynchronous implementation are
+            run in the default executor of the event loop.
+        """
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.run, argv)
@@ -1,13 +1,51 @@
 import abc
+import sys
 
 
 class Formatter(abc.ABC):
 
     """ Base abstract class for formatters.
+
+    Application calls ``begin`` once before the first reading, ``write``
+    for every reading as soon as it is ready and ``end`` after the last
+    one, so formatters may stream output without keeping readings in
+    memory.
+
+    :param stdout: stream for the output
     """
 
-    @abc.abstractmethod
-    def emit(self, column_names, data, stdout):
-        """Format and print data from the iterable source."""
+    def __init__(self, stdout=None):
+        self.stdout = stdout or sys.stdout
+
+    def begin(self):
+        """ Print the beginning of the output.
+        """
+
+    def write(self, title, location, data):
+        """ Print a single reading.
 
+        :param title: provider title
+        :type title: str
+        :param location: location name
+        :type location: str
+        :param data: weather info
+        :type data: dict
+        """
+
+        self.stdout.write(self.emit([title, location], data))
+        self.stdout.write('\n')
+
+    def end(self):
+        """ Print the end of the output.
+        """
+
+    @abc.abstractmethod
+    def emit(self, column_names, data):
+        """Format data of a single reading.
 
+        :param column_names: provider title and location name
+        :type column_names: list
+        :param data: weather info
+        :type data: dict
+        :rtype: str
+        """
@@ -1,14 +1,18 @@
 import abc
-import configparser
+import asyncio
+import functools
 import hashlib
+import inspect
+import json
 import logging
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
-import requests
-
-from weatherapp.core import config
+from weatherapp.core import config, parsers
 from weatherapp.core.abstract.command import Command
+from weatherapp.core.locationindex import LocationIndex
+from weatherapp.core.reading import WeatherReading
 
 
 class WeatherProvider(Command):
@@ -17,13 +21,22 @@ class WeatherProvider(Command):
         Defines behavior for all weather providers.
     """
 
+    # id of the page element which contains all weather info, when set
+    # the location page download stops as soon as the element is received
+    page_section_id = None
+
+    # how long before expiration cached pages are already revalidated
+    # (in seconds), the refresh scheduler sets it to keep the cache hot
+    refresh_lead = 0
+
     def __init__(self, app):
         super().__init__(app)
 
         self.logger = logging.getLogger(__name__)
-        location, url = self._get_configuration()
+        location, url, locations = self._get_configuration()
         self.location = location
         self.url = url
+        self.locations = locations
 
     @abc.abstractmethod
     def get_name(self):
@@ -60,6 +73,178 @@ class WeatherProvider(Command):
         }
         """
 
+    async def get_weather_info_async(self, content):
+        """ Asynchronous version of ``get_weather_info``.
+
+        Providers which fetch additional pages while collecting weather
+        information should override it, by default synchronous method
+        is run in the default executor of the event loop.
+        """
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_weather_info,
+                                          content)
+
+    # number of levels in the browse tree of the site, None if locations
+    # are the pages without further levels
+    browse_depth = None
+
+    def get_browse_root(self):
+        """ Url of the top level of locations browse tree, None if the
+        site has no browsable locations index.
+        """
+
+        return None
+
+    def get_browse_locations(self, url, depth):
+        """ List of (name, url) entries of the browse tree level.
+
+        :param url: url of the level page
+        :type url: str
+        :param depth: level depth, 0 for the top level
+        :type depth: int
+        """
+
+        return []
+
+    def crawl_locations(self):
+        """ Walk the whole browse tree of the site.
+
+        Levels are fetched concurrently by ``--workers`` threads.
+
+        :return: (name, url, path) of every location, path is the tuple
+                 of names of the levels containing the location
+        :rtype: generator
+        """
+
+        if self.get_browse_root() is None:
+            return
+
+        root = ((), 0, self.get_browse_root())
+        with ThreadPoolExecutor(max_workers=self.app.options.workers) \
+                as executor:
+            pending = {executor.submit(self.get_browse_locations,
+                                       root[2], root[1]): root}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, depth, url = pending.pop(future)
+                    try:
+                        children = future.result()
+                    except Exception:
+                        self.logger.warning('Failed to browse %s', url,
+                                            exc_info=self.app.options.debug)
+                        continue
+
+                    if not children and path:
+                        yield path[-1], url, path[:-1]
+                    for name, child_url in children:
+                        child = (path + (name,), depth + 1, child_url)
+                        if depth + 1 == self.browse_depth:
+                            yield name, child_url, path
+                        else:
+                            pending[executor.submit(
+                                self.get_browse_locations,
+                                child_url, depth + 1)] = child
+
+    def configurate_by_name(self, name):
+        """ Configure location found by name in the locations index.
+
+        :param name: location name or its beginning
+        :type name: str
+        """
+
+        index = LocationIndex(self.get_name())
+        if not index.exists():
+            self.stdout.write('Locations index is not built, run: '
+                              f'wfapp locations build {self.get_name()}\n')
+            return
+
+        locations = index.search(name)
+        if not locations:
+            self.stdout.write(f'Location {name} is not found\n')
+            return
+
+        exact = [location for location in locations
+                 if location.key == index.normalize(name)]
+        if len(exact) == 1:
+            location = exact[0]
+        elif len(locations) == 1:
+            location = locations[0]
+        else:
+            for number, location in enumerate(locations, 1):
+                self.stdout.write(
+                    f'{number}. {location.name} ({location.path}) \n')
+            self.stdout.write('\n')
+            location = locations[self.select_index(len(locations))]
+
+        self.save_configuration(self.get_name(), location.name, location.url)
+
+    def get_browse_choice_key(self, url):
+        """ Cache key of the entry chosen by user on the browse level.
+        """
+
+        return f'browse-choice:{self.get_name()}:{url}'
+
+    def prefetch_browse_entries(self, prefetcher, url, entries):
+        """ Start loading next levels of the most likely entries.
+
+        Entry chosen on this level last time goes first, then entries in
+        the listed order.
+
+        :param prefetcher: prefetcher of the browse levels
+        :type prefetcher: prefetch.Prefetcher
+        :param url: url of the listed level
+        :type url: str
+        :param entries: (name, url) entries of the level
+        :type entries: list
+        """
+
+        urls = [entry_url for name, entry_url in entries]
+        last_choice = self.app.cache.get(self.get_browse_choice_key(url))
+        if last_choice and last_choice.decode('utf-8') in urls:
+            urls.insert(0, last_choice.decode('utf-8'))
+        prefetcher.prefetch(urls[:config.PREFETCH_LIMIT])
+
+    def remember_browse_choice(self, url, entry_url):
+        """ Remember entry chosen by user on the browse level.
+        """
+
+        self.app.cache.set(self.get_browse_choice_key(url),
+                           entry_url.encode('utf-8'),
+                           ttl=config.BROWSE_CHOICE_TIME)
+
+    def select_index(self, count, prompt='Please select location: '):
+        """ Ask user to choose one of the numbered entries.
+
+        :param count: number of entries
+        :type count: int
+        :return: index of the selected entry
+        :rtype: int
+        """
+
+        for i in range(3, 0, -1):  # User input validation
+            try:
+                selected_index = int(input(prompt))
+                if not 0 < selected_index <= count:
+                    raise IndexError(selected_index)
+                return selected_index - 1
+            except (IndexError, ValueError) as ex:
+                self.logger.debug(ex)
+                self.stdout.write('\nYou entered a wrong location\n'
+                                  'Depending on the choice of location '
+                                  f'enter a number from 1 to {count}\n'
+                                  f'You have {i - 1} attempts left.\n')
+        self.stdout.write('Attempts have been exhausted,'
+                          'the program will be closed\n')
+        raise SystemExit
+
+    def get_parser_engine(self):
+        """ Engine selected to extract weather info, 'lxml' or 'soup'.
+        """
+
+        return self.app.options.parser
+
     @staticmethod
     def get_configuration_file():
         """ Getting the path to the configuration file
@@ -68,30 +253,21 @@ class WeatherProvider(Command):
         return Path.cwd() / config.CONFIG_FILE
 
     def _get_configuration(self):
-        """ Get configuration from file
-        
-        :return: Return the name of the selected place (city) and url
-        :rtype: tuple
-        """
-        provider = self.get_name()
-        name = self.get_default_location()
-        url = self.get_default_url()
+        """ Get configuration from the configuration store of the app
 
-        parser = configparser.ConfigParser(strict=False, interpolation=None)
+        Locations for batch run are taken from ``<provider>.locations``
+        section of the configuration file or of the file passed with
+        ``--locations`` option.
 
-        try:
-            parser.read(self.get_configuration_file())
-        except configparser.Error:
-            msg = ("\nProviders configuration file is corrupt!\n"
-                   "Reconfigure it. The program will be interrupted.")
-            self.logger.debug(msg)
-            raise SystemExit
-
-        if provider in parser.sections():
-            location_config = parser[provider]
-            name, url = location_config['name'], location_config['url']
+        :return: Return the name of the selected place (city), url and
+                 the list of (name, url) pairs of all locations to run
+        :rtype: tuple
+        """
 
-        return name, url
+        return self.app.configstore.get_provider_config(
+            self.get_name(), self.get_default_location(),
+            self.get_default_url(),
+            getattr(self.app.options, 'locations', None))
 
     def save_configuration(self, provider, name, url):
         """ Save configuration to file
@@ -106,89 +282,328 @@ class WeatherProvider(Command):
         :param type: str
         """
 
-        parser = configparser.ConfigParser(strict=False, interpolation=None)
-        parser.add_section(provider)
+        self.app.configstore.save_location(provider, name, url)
 
-        config_file = self.get_configuration_file()
+    @staticmethod
+    def get_request_headers(cache_entry=None):
+        """ Return custom headers for url requests.
 
-        if config_file.exists():
-            parser.read(config_file)
+        :param cache_entry: expired cache entry of the page, its
+                            validators make the request conditional
+        :type cache_entry: abstract.CacheEntry
+        """
 
-        parser[provider] = {'name': name, 'url': url}
+        headers = {'User-Agent': config.FAKE_MOZILLA_AGENT}
+        if cache_entry is not None:
+            etag = cache_entry.headers.get('ETag')
+            if etag:
+                headers['If-None-Match'] = etag
+            last_modified = cache_entry.headers.get('Last-Modified')
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
 
-        with open(self.get_configuration_file(), 'w') as configfile:
-            parser.write(configfile)
+    def get_cache(self, url):
+        """ Return cache by given url address if any.
+        """
 
-    @staticmethod
-    def get_request_headers():
-        """ Return custom headers for url requests.
+        return self.app.cache.get(url) or b''
+
+    def get_cache_entry(self, url):
+        """ Return cache entry of the page even if it is expired.
+
+        Nothing is returned when ``--refresh`` is requested.
         """
 
-        return {'User-Agent': config.FAKE_MOZILLA_AGENT}
+        if self.app.options.refresh:
+            return None
+        return self.app.cache.get_entry(url)
 
-    @staticmethod
-    def get_url_hash(url):
-        """ Generate url hash.
+    def save_cache(self, url, page_source, headers=None):
+        """ Save page source data to the cache
+
+        :param headers: response headers, validators from them are kept
+                        for conditional requests
+        :type headers: dict
         """
 
-        return hashlib.md5(url.encode('utf-8')).hexdigest()
+        validators = {}
+        for name, value in (headers or {}).items():
+            for validator in config.CACHE_VALIDATORS:
+                if name.lower() == validator.lower():
+                    validators[validator] = value
+        self.app.cache.set(url, page_source, headers=validators)
 
-    @staticmethod
-    def get_cache_directory():
-        """ Path to cache directory
+    def process_page(self, url, cache_entry, page):
+        """ Return page source from the response and update the cache.
+
+        Response 304 Not Modified to a conditional request only renews
+        the expired cache entry.
         """
-        return Path.cwd() / config.CACHE_DIR
+
+        if page.status_code == 304 and cache_entry is not None:
+            self.logger.debug('Page %s is not modified', url)
+            self.app.cache.set(url, cache_entry.value,
+                               headers=cache_entry.headers)
+            return cache_entry.value
+
+        self.save_cache(url, page.content, page.headers)
+        return page.content
+
+    @classmethod
+    @functools.lru_cache()
+    def get_parser_version(cls):
+        """ Fingerprint of the code which produces weather info.
+
+        Hash of the source files of the provider class, its bases and
+        the shared parsing helpers, so parsed results cached by previous
+        version of a parser are never used after the parser is changed.
+        """
+
+        fingerprint = hashlib.md5(Path(parsers.__file__).read_bytes())
+        for klass in cls.__mro__:
+            if issubclass(klass, WeatherProvider):
+                source_file = inspect.getsourcefile(klass)
+                fingerprint.update(Path(source_file).read_bytes())
+        return fingerprint.hexdigest()[:12]
+
+    def get_parsed_cache_key(self, url):
+        """ Cache key of weather info parsed from the page at given url.
+        """
+
+        return f'parsed:{self.get_name()}:{url}:{self.get_parser_version()}'
+
+    def get_stale_window(self):
+        """ How long expired cache may be served (in seconds).
+
+        Background refresh jobs always get up to date data.
+        """
+
+        if self.app.refresher.in_background():
+            return 0
+        return self.app.options.stale_window
+
+    def get_parsed_cache(self, url):
+        """ Return weather info parsed from the page at given url if it is
+        cached and ``--refresh`` is not requested.
+
+        Stale weather info is returned as well while it is refreshed in
+        background.
+        """
+
+        if self.app.options.refresh:
+            return None
+
+        key = self.get_parsed_cache_key(url)
+        cache_entry = self.app.cache.get_entry(key)
+        if cache_entry is None or \
+                not cache_entry.is_valid(self.get_stale_window()):
+            return None
+        if not cache_entry.is_valid():
+            self.app.refresher.submit(key, self.refresh_weather_info, url)
+        return json.loads(cache_entry.value.decode('utf-8'))
+
+    def save_parsed_cache(self, url, weather_info, expires=None):
+        """ Save weather info parsed from the page at given url.
+
+        :param expires: expiration time of the cached page the info was
+                        parsed from, None if the page was just downloaded
+        :type expires: float
+        """
+
+        ttl = None if expires is None else expires - time.time()
+        self.app.cache.set(self.get_parsed_cache_key(url),
+                           json.dumps(weather_info).encode('utf-8'), ttl=ttl)
+
+    def get_served_page(self, url):
+        """ Cache entry of the page ``get_page_source`` is going to
+        serve, None if the page is going to be downloaded.
+        """
+
+        cache_entry = self.get_cache_entry(url)
+        return cache_entry if self.may_serve(cache_entry) else None
+
+    def get_location_name(self, url):
+        """ Name of the configured location at given url.
+        """
+
+        for name, location_url in self.locations:
+            if location_url == url:
+                return name
+        return self.location
+
+    def save_weather_info(self, url, weather_info, page=None):
+        """ Cache weather info parsed from the page at given url and
+        record it in the history.
+
+        Weather info parsed from a cached page, including a stale one,
+        expires together with the page and is recorded with the time the
+        page was fetched, so it never becomes fresher than its page.
+
+        :param page: cache entry of the page the info was parsed from,
+                     None if the page was just downloaded
+        :type page: abstract.CacheEntry
+        """
+
+        if page is None:
+            fetched, expires = time.time(), None
+        else:
+            fetched, expires = page.fetched, page.fetched + page.ttl
+        self.save_parsed_cache(url, weather_info, expires)
+        self.app.record_history([WeatherReading.from_info(
+            self.title, self.get_location_name(url), weather_info,
+            timestamp=fetched)])
+
+    def refresh_weather_info(self, url):
+        """ Collect weather info from the page, cache and record it.
+        """
+
+        page = self.get_served_page(url)
+        content = self.get_page_source(url, self.page_section_id)
+        with self.app.profiler.span(self.name, 'parse'):
+            weather_info = self.get_weather_info(content)
+        self.save_weather_info(url, weather_info, page)
+        return weather_info
+
+    async def refresh_weather_info_async(self, url):
+        """ Asynchronous version of ``refresh_weather_info``.
+        """
+
+        page = self.get_served_page(url)
+        content = await self.get_page_source_async(url, self.page_section_id)
+        with self.app.profiler.span(self.name, 'parse'):
+            weather_info = await self.get_weather_info_async(content)
+        self.save_weather_info(url, weather_info, page)
+        return weather_info
 
     @staticmethod
-    def is_valid(path):
-        """ Check if current cache file is valid
+    def get_section_watcher(section_id):
+        """ Callback which stops the download once the section with given
+        id is received, None if the whole page is needed.
         """
 
-        return (time.time() - path.stat().st_mtime) < config.CACHE_TIME
+        return parsers.SectionWatcher(section_id) if section_id else None
 
-    def get_cache(self, url):
-        """ Return cache by given url address if any.
+    def fetch_page(self, url, cache_entry=None, section_id=None):
+        """ Download the page, conditionally if cache entry is given.
+
+        If section id is given, only the beginning of the page up to the
+        end of the section is downloaded and cached.
         """
 
-        cache = b''
-        url_hash = self.get_url_hash(url)
-        cache_dir = self.get_cache_directory()
-        if cache_dir.exists():
-            cache_path = cache_dir / url_hash
-            if cache_path.exists() and self.is_valid(cache_path):
-                with cache_path.open('rb') as cache_file:
-                    cache = cache_file.read()
-        return cache
+        profiler = self.app.profiler
+        with profiler.span(self.name, 'fetch') as span:
+            page = self.app.transport.get(
+                url, headers=self.get_request_headers(cache_entry),
+                until=self.get_section_watcher(section_id))
+            span.add('fetched bytes', len(page.content))
+        with profiler.span(self.name, 'cache write'):
+            return self.process_page(url, cache_entry, page)
+
+    def may_serve(self, cache_entry):
+        """ Check if the cached page may be served instead of being
+        downloaded.
+
+        Background refresh jobs download pages which are due for
+        refresh themselves instead of scheduling one more job.
+        """
 
-    def save_cache(self, url, page_source):
-        """ Save page source data to file
+        if cache_entry is None:
+            return False
+        if cache_entry.is_valid(-self.refresh_lead):
+            return True
+        return not self.app.refresher.in_background() and \
+            cache_entry.is_valid(self.get_stale_window())
+
+    def serve_cache(self, url, cache_entry, section_id=None):
+        """ Check if the page may be served from cache.
+
+        Stale pages within the stale window are served too and
+        refreshed in background.
         """
-        url_hash = self.get_url_hash(url)
-        cache_dir = self.get_cache_directory()
-        if not cache_dir.exists():
-            cache_dir.mkdir(parents=True)
 
-        with (cache_dir / url_hash).open('wb') as cache_file:
-            cache_file.write(page_source)
+        if not self.may_serve(cache_entry):
+            return False
+        if not cache_entry.is_valid(-self.refresh_lead):
+            self.app.refresher.submit(url, self.fetch_page, url, cache_entry,
+                                      section_id)
+        return True
 
-    def get_page_source(self, url):
+    def get_page_source(self, url, section_id=None):
         """ Returns the contents of the page at the specified URL
+
+        :param section_id: id of the element which contains all needed
+                           data, the rest of the page is not downloaded
+        :type section_id: str
         """
 
-        cache = self.get_cache(url)
-        if cache and not self.app.options.refresh:
-            page_source = cache
+        profiler = self.app.profiler
+        with profiler.span(self.name, 'cache read'):
+            cache_entry = self.get_cache_entry(url)
+        if self.serve_cache(url, cache_entry, section_id):
+            profiler.count(self.name, 'cache hits')
+            page_source = cache_entry.value
         else:
-            page = requests.get(url, headers=self.get_request_headers())
-            page_source = page.content
-            self.save_cache(url, page_source)
+            profiler.count(self.name, 'cache misses')
+            page_source = self.fetch_page(url, cache_entry, section_id)
 
         return page_source.decode('utf-8')
 
+    async def get_page_source_async(self, url, section_id=None):
+        """ Asynchronous version of ``get_page_source``.
+        """
+
+        profiler = self.app.profiler
+        with profiler.span(self.name, 'cache read'):
+            cache_entry = self.get_cache_entry(url)
+        if self.serve_cache(url, cache_entry, section_id):
+            profiler.count(self.name, 'cache hits')
+            page_source = cache_entry.value
+        else:
+            profiler.count(self.name, 'cache misses')
+            with profiler.span(self.name, 'fetch') as span:
+                page = await self.app.async_transport.get(
+                    url, headers=self.get_request_headers(cache_entry),
+                    until=self.get_section_watcher(section_id))
+                span.add('fetched bytes', len(page.content))
+            with profiler.span(self.name, 'cache write'):
+                page_source = self.process_page(url, cache_entry, page)
+
+        return page_source.decode('utf-8')
+
+    def run_location(self, url):
+        """ Weather info of the location at given url
+        """
+
+        with self.app.profiler.span(self.name, 'run'):
+            weather_info = self.get_parsed_cache(url)
+            if weather_info is None:
+                weather_info = self.refresh_weather_info(url)
+            else:
+                self.app.profiler.count(self.name, 'parsed hits')
+        return weather_info
+
+    async def run_location_async(self, url):
+        """ Weather info of the location at given url on the event loop
+        """
+
+        with self.app.profiler.span(self.name, 'run'):
+            weather_info = self.get_parsed_cache(url)
+            if weather_info is None:
+                weather_info = await self.refresh_weather_info_async(url)
+            else:
+                self.app.profiler.count(self.name, 'parsed hits')
+        return weather_info
+
     def run(self, argv):
         """ Run provider
         """
 
-        content = self.get_page_source(self.url)
-        return self.get_weather_info(content)
+        return self.run_location(self.url)
+
+    async def run_async(self, argv):
+        """ Run provider on the event loop
+        """
+
+        return await self.run_location_async(self.url)
 
@@ -3,12 +3,19 @@
 """
 import logging
 import sys
+import time
 from argparse import ArgumentParser
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-from weatherapp.core.formatters import TableFormatter
 from weatherapp.core import config
-from weatherapp.core.commandmanager import CommandManager
-from weatherapp.core.providermanager import ProviderManager
+from weatherapp.core.plugins import CACHE_BACKENDS
+from weatherapp.core.profiling import NULL_PROFILER, Profiler
+from weatherapp.core.reading import ReadingBatch, WeatherReading
+from weatherapp.core.resources import Resources
+
+# single location of a provider to run
+Job = namedtuple('Job', ['provider', 'location', 'url'])
 
 
 class App:
@@ -20,15 +27,97 @@ class App:
                      1: logging.INFO, 
                      2: logging.DEBUG}
 
-    def __init__(self, stdin=None, stdout=None, stderr=None):
+    def __init__(self, stdin=None, stdout=None, stderr=None,
+                 resources=None):
         self.stdin = stdin or sys.stdin
         self.stdout = stdout or sys.stdout
         self.stderr = stderr or sys.stderr
         self.arg_parser = self._arg_parse()
-        self.providermanager = ProviderManager()
-        self.commandmanager = CommandManager()
-        self.formatters = self._load_formatters()
-         
+        self.resources = resources or Resources(self._create_cache)
+        self.providermanager = self.resources.providermanager
+        self.commandmanager = self.resources.commandmanager
+        self.formatters = self.resources.formatters
+        self.cache_backends = self.resources.cache_backends
+        self._async_transport = None
+        self._profiler = None
+        self._formatter = None
+        self._batch = None
+
+    @property
+    def profiler(self):
+        """ Timing of stages enabled with ``--profile`` option.
+        """
+
+        if self._profiler is None:
+            if self.options.profile or self.options.profile_json:
+                self._profiler = Profiler()
+            else:
+                self._profiler = NULL_PROFILER
+        return self._profiler
+
+    @property
+    def configstore(self):
+        """ Configuration files parsed once for all providers.
+        """
+
+        return self.resources.configstore
+
+    @property
+    def rate_limiter(self):
+        """ Per host request limits shared by all transports.
+        """
+
+        return self.resources.rate_limiter
+
+    @property
+    def transport(self):
+        """ HTTP transport shared by all providers of the application.
+        """
+
+        return self.resources.transport
+
+    @property
+    def cache(self):
+        """ Page cache storage selected with ``--cache`` option.
+        """
+
+        return self.resources.cache
+
+    def _create_cache(self):
+        return self.cache_backends[self.options.cache].load()()
+
+    @property
+    def refresher(self):
+        """ Background refresher of stale cache entries.
+        """
+
+        return self.resources.refresher
+
+    @property
+    def history(self):
+        """ Store of readings of all runs.
+        """
+
+        return self.resources.history
+
+    @property
+    def async_transport(self):
+        """ HTTP transport for providers running on the event loop.
+        """
+
+        if self._async_transport is None:
+            from weatherapp.core.transport import AsyncHttpTransport
+
+            self._async_transport = AsyncHttpTransport(
+                rate_limiter=self.rate_limiter)
+        return self._async_transport
+
+    def close(self):
+        """ Release resources held by the application.
+        """
+
+        self.resources.close()
+
     @staticmethod
     def _arg_parse():
         """ Initialize argument parser
@@ -47,6 +136,51 @@ class App:
                                 help='Output format, defaults to table',
                                 action='store',
                                 default='table')
+        arg_parser.add_argument('-p', '--parser',
+                                help='Engine to extract weather info, '
+                                     f'defaults to {config.PARSER_ENGINE}',
+                                choices=config.PARSER_ENGINES,
+                                default=config.PARSER_ENGINE)
+        arg_parser.add_argument('-s', '--stale-window',
+                                help='How long expired cache is served '
+                                     'while it is refreshed in background '
+                                     '(in seconds), 0 disables it',
+                                type=float,
+                                default=config.CACHE_STALE_TIME)
+        arg_parser.add_argument('-c', '--cache',
+                                help='Cache storage, defaults to '
+                                     f'{config.CACHE_BACKEND}',
+                                choices=[backend.name for backend
+                                         in CACHE_BACKENDS],
+                                default=config.CACHE_BACKEND)
+        arg_parser.add_argument('-w', '--workers',
+                                help='How many providers may run at the '
+                                     'same time',
+                                type=int,
+                                default=config.DEFAULT_WORKERS)
+        arg_parser.add_argument('-t', '--timeout',
+                                help='Deadline for each provider (in '
+                                     'seconds), 0 disables it',
+                                type=float,
+                                default=config.PROVIDER_TIMEOUT)
+        arg_parser.add_argument('-l', '--locations',
+                                help='File with locations of providers '
+                                     'to run in batch')
+        arg_parser.add_argument('-a', '--async',
+                                help='Run providers on the event loop',
+                                action='store_true',
+                                dest='use_async')
+        arg_parser.add_argument('--profile',
+                                help='Print time of every stage by '
+                                     'provider',
+                                action='store_true')
+        arg_parser.add_argument('--profile-json',
+                                help='Save time of every stage by provider '
+                                     'to the file as JSON',
+                                metavar='FILE')
+        arg_parser.add_argument('--local',
+                                help='Run here even if daemon is running',
+                                action='store_true')
         arg_parser.add_argument('-v', '--verbose',
                                 help='Increase verbosity of output',
                                 action='count',
@@ -69,19 +203,34 @@ class App:
         console.setFormatter(formatter)
         root_logger.addHandler(console)
 
-    @staticmethod
-    def _load_formatters():
-        return {'table': TableFormatter}
+    def start_output(self):
+        """ Create formatter selected with ``--formatter`` option and
+        print the beginning of the output.
+        """
+
+        name = self.options.formatter
+        formatter = self.formatters.get(name)
+        if formatter is None:
+            self.logger.error("Unknown formatter %s, table is used", name)
+            formatter = self.formatters['table']
+        self._formatter = formatter(self.stdout)
+        self._formatter.begin()
+
+    def finish_output(self):
+        """ Print the end of the output, if it was started.
+        """
+
+        if self._formatter is not None:
+            self._formatter.end()
+            self._formatter = None
 
     def produce_output(self, title, location, data):
         """ Print results.
         """
 
-        formatter = self.formatters.get(self.options.formatter, 'table')()
-        columns = [title, location]
-
-        self.stdout.write(formatter.emit(columns, data))
-        self.stdout.write('\n')
+        if self._formatter is None:
+            self.start_output()
+        self._formatter.write(title, location, data)
 
     def run_command(self, name, argv):
         """ Run command
@@ -102,22 +251,235 @@ class App:
 
         provider = self.providermanager.get(name)
         if provider:
-            provider = provider(self)
-            self.produce_output(provider.title,
-                                provider.location,
-                                provider.run(argv))
+            self._run_providers([provider(self)], argv)
 
     def run_providers(self, argv):
         """ Execute all available providers.
         """
 
-        for name, provider in self.providermanager:
-            provider = provider(self)
-            self.produce_output(provider.title,
-                                provider.location,
-                                provider.run(argv))
+        self._run_providers(self.get_providers(), argv)
+
+    def get_providers(self, names=None):
+        """ Providers with given names, all providers by default.
+
+        :param names: provider names
+        :type names: list
+        :raises ValueError: if a provider is unknown
+        :rtype: list of abstract.WeatherProvider
+        """
+
+        if not names:
+            return [provider(self) for name, provider in self.providermanager]
+        providers = []
+        for name in names:
+            provider = self.providermanager.get(name)
+            if provider is None:
+                raise ValueError(f'Unknown provider {name}')
+            providers.append(provider(self))
+        return providers
+
+    def _run_providers(self, providers, argv):
+        """ Run all locations of providers and print their results.
+        """
+
+        self.start_output()
+        try:
+            self.run_jobs(self.get_jobs(providers))
+        finally:
+            self.finish_output()
+
+    def collect_readings(self, providers):
+        """ Run all locations of providers without printing results.
+
+        Readings are kept only by this method, runs which print results
+        stream them without keeping them in memory.
+
+        :return: readings of all locations which did not fail
+        :rtype: reading.ReadingBatch
+        """
+
+        batch = self._batch = ReadingBatch()
+        try:
+            self.run_jobs(self.get_jobs(providers))
+        finally:
+            self._batch = None
+        return batch
+
+    @staticmethod
+    def get_jobs(providers):
+        """ Job for every location of providers.
+        """
+
+        return [Job(provider, location, url) for provider in providers
+                for location, url in provider.locations]
+
+    def run_jobs(self, jobs):
+        """ Run jobs in a thread pool or on the event loop.
+        """
+
+        if self.options.use_async:
+            import asyncio
+
+            asyncio.run(self.run_concurrently_async(jobs))
+        else:
+            self.run_concurrently(jobs)
+
+    def record_history(self, readings):
+        """ Add readings to the history, failure is only reported.
+
+        Providers record weather info when they fetch or refresh it,
+        readings served from the parsed cache are not recorded again.
+
+        :param readings: iterable of reading.WeatherReading
+        """
+
+        try:
+            self.history.record(readings)
+        except Exception:
+            self.logger.error("Failed to record readings in history",
+                              exc_info=self.options.debug)
+
+    def run_concurrently(self, jobs):
+        """ Run jobs in a thread pool and print results as they come.
+
+        At most ``--workers`` locations are processed at the same time.
+        Every job has its own ``--timeout`` deadline counted from the
+        moment it actually starts, so a slow site only delays its own
+        output. Jobs which miss the deadline or fail are reported and
+        skipped.
+
+        :param jobs: provider locations to run
+        :type jobs: list of Job
+        """
+
+        timeout = self.options.timeout or None
+        started = {}
+
+        def run_job(index, job):
+            started[index] = time.monotonic()
+            return job.provider.run_location(job.url)
+
+        executor = ThreadPoolExecutor(max_workers=max(1, self.options.workers))
+        pending = {executor.submit(run_job, index, job): (index, job)
+                   for index, job in enumerate(jobs)}
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=self._next_deadline(
+                    pending, started, timeout), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, job = pending.pop(future)
+                    try:
+                        data = future.result()
+                    except Exception as error:
+                        self._produce_job_output(job, error=error)
+                    else:
+                        self._produce_job_output(job, data)
+
+                now = time.monotonic()
+                for future, (index, job) in list(pending.items()):
+                    start = started.get(index)
+                    if timeout and start is not None and now - start >= timeout:
+                        del pending[future]
+                        future.cancel()
+                        self._produce_job_output(job, error=TimeoutError())
+        finally:
+            executor.shutdown(wait=False)
 
+    async def run_concurrently_async(self, jobs):
+        """ Run jobs on the event loop and print results as they come.
 
+        Event loop driver for ``WeatherProvider.run_location_async``,
+        follows the same ``--workers`` limit and ``--timeout`` deadlines
+        as ``run_concurrently`` but needs only a single thread.
+
+        :param jobs: provider locations to run
+        :type jobs: list of Job
+        """
+
+        import asyncio
+
+        timeout = self.options.timeout or None
+        semaphore = asyncio.Semaphore(max(1, self.options.workers))
+
+        async def run_job(job):
+            async with semaphore:
+                try:
+                    data = await asyncio.wait_for(
+                        job.provider.run_location_async(job.url), timeout)
+                except Exception as error:
+                    return job, None, error
+                return job, data, None
+
+        try:
+            for result in asyncio.as_completed(
+                    [run_job(job) for job in jobs]):
+                job, data, error = await result
+                self._produce_job_output(job, data, error)
+        finally:
+            if self._async_transport is not None:
+                await self._async_transport.close()
+                self._async_transport = None
+
+    @staticmethod
+    def _next_deadline(pending, started, timeout):
+        """ Seconds left until the closest deadline of running jobs.
+        """
+
+        if not timeout:
+            return None
+
+        deadlines = [started[index] + timeout
+                     for index, job in pending.values() if index in started]
+        if not deadlines:
+            return timeout
+        return max(0, min(deadlines) - time.monotonic())
+
+    @staticmethod
+    def is_timeout(error):
+        """ Check if the job failed because it missed its deadline.
+        """
+
+        if isinstance(error, TimeoutError):
+            return True
+        # asyncio is imported only when providers run on the event loop
+        asyncio = sys.modules.get('asyncio')
+        return asyncio is not None and isinstance(error,
+                                                  asyncio.TimeoutError)
+
+    def _produce_job_output(self, job, data=None, error=None):
+        """ Print result of finished job or report its error.
+        """
+
+        provider = job.provider
+        if self.is_timeout(error):
+            self.logger.error("Provider %s missed its deadline of %s seconds "
+                              "for %s", provider.name, self.options.timeout,
+                              job.location)
+        elif error is not None:
+            msg = "Error during provider: %s run for %s"
+            if self.options.debug:
+                self.logger.error(msg, provider.name, job.location,
+                                  exc_info=error)
+            else:
+                self.logger.error(msg, provider.name, job.location)
+        else:
+            with self.profiler.span(provider.name, 'output'):
+                if self._batch is not None:
+                    self._batch.append(WeatherReading.from_info(
+                        provider.title, job.location, data))
+                else:
+                    self.produce_output(provider.title, job.location, data)
+
+    def report_profile(self):
+        """ Print collected stage times and save them if requested.
+        """
+
+        if not self.profiler.enabled:
+            return
+        if self.options.profile:
+            self.stderr.write(self.profiler.format_report())
+        if self.options.profile_json:
+            self.profiler.write_json(self.options.profile_json)
 
     def run(self, argv):
         """ Run application.
@@ -129,16 +491,20 @@ class App:
         self.configure_logging()
 
         command_name = self.options.command
-        
-        if not command_name:
-            # run all providers
-            return self.run_providers(remaining_args)
 
-        if command_name in self.commandmanager:
-            return self.run_command(command_name, remaining_args)
+        try:
+            if not command_name:
+                # run all providers
+                return self.run_providers(remaining_args)
+
+            if command_name in self.commandmanager:
+                return self.run_command(command_name, remaining_args)
 
-        if command_name in self.providermanager:
-            return self.run_provider(command_name, remaining_args)
+            if command_name in self.providermanager:
+                return self.run_provider(command_name, remaining_args)
+        finally:
+            self.report_profile()
+            self.close()
 
 
 def main(argv=sys.argv[1:]):
@@ -0,0 +1,11 @@
+from weatherapp.core.plugins import lazy_exports
+
+_EXPORTS = {
+    'FileCache': 'weatherapp.core.caches.file',
+    'MemoryCache': 'weatherapp.core.caches.memory',
+    'SQLiteCache': 'weatherapp.core.caches.sqlite',
+    'ZlibFileCache': 'weatherapp.core.caches.file',
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,184 @@
+import hashlib
+import json
+import mmap
+import os
+import time
+import zlib
+from pathlib import Path
+
+from weatherapp.core import config
+from weatherapp.core.abstract import CacheBackend, CacheEntry
+
+
+class FileCache(CacheBackend):
+    """ Cache storage with one file per entry named by the key hash.
+
+    Every file starts with a single line of JSON metadata followed by
+    the cached value. Modification time of the file is set to the
+    moment it may be purged, so ``purge`` does not need to read files.
+
+    :param directory: cache directory, defaults to one in current
+                      working directory
+    :type directory: pathlib.Path
+    :param ttl: default time to live of entries (in seconds)
+    :type ttl: float
+    :param retention: how long expired entries are kept (in seconds)
+    :type retention: float
+    """
+
+    name = 'file'
+
+    # compression of written values, every file records its own, so
+    # files written with and without compression are read by both
+    encoding = None
+
+    def __init__(self, directory=None, ttl=config.CACHE_TIME,
+                 retention=config.CACHE_RETENTION):
+        self.directory = directory or Path.cwd() / config.CACHE_DIR
+        self.ttl = ttl
+        self.retention = retention
+
+    @staticmethod
+    def get_key_hash(key):
+        """ Generate key hash.
+        """
+
+        return hashlib.md5(key.encode('utf-8')).hexdigest()
+
+    def get_path(self, key):
+        """ Path to the entry file.
+        """
+
+        return self.directory / self.get_key_hash(key)
+
+    def get_entry(self, key):
+        """ Read entry file if any.
+        """
+
+        try:
+            with self.get_path(key).open('rb') as cache_file:
+                return self.read_entry(cache_file)
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError, zlib.error):
+            # empty file or file written by older version of the
+            # application
+            return None
+
+    def read_entry(self, cache_file):
+        """ Entry from the open entry file.
+        """
+
+        metadata = cache_file.readline()
+        return self.create_entry(metadata, cache_file.read())
+
+    def create_entry(self, metadata, data):
+        """ Entry from the metadata line and the stored data.
+
+        :param metadata: JSON metadata line
+        :type metadata: bytes
+        :param data: stored data
+        :type data: bytes or memoryview
+        :rtype: abstract.CacheEntry
+        """
+
+        metadata = json.loads(metadata.decode('utf-8'))
+        value = self.decode(data, metadata.get('encoding'))
+        return CacheEntry(value, metadata['fetched'], metadata['ttl'],
+                          metadata['headers'])
+
+    @staticmethod
+    def decode(data, encoding):
+        """ Value from the stored data.
+
+        :param data: stored data
+        :type data: bytes or memoryview
+        :param encoding: compression of the data, if any
+        :type encoding: str
+        :rtype: bytes
+        """
+
+        if encoding == 'zlib':
+            return zlib.decompress(data)
+        if encoding is not None:
+            raise ValueError(f'Unknown encoding {encoding}')
+        return bytes(data)
+
+    def encode(self, value):
+        """ Data to store for the value.
+        """
+
+        if self.encoding == 'zlib':
+            return zlib.compress(value, config.CACHE_COMPRESSION_LEVEL)
+        return value
+
+    def set(self, key, value, ttl=None, headers=None):
+        """ Save value with its metadata to the entry file.
+        """
+
+        if not self.directory.exists():
+            self.directory.mkdir(parents=True)
+
+        now = time.time()
+        ttl = self.ttl if ttl is None else ttl
+        metadata = {'fetched': now, 'ttl': ttl, 'headers': headers or {}}
+        if self.encoding is not None:
+            metadata['encoding'] = self.encoding
+
+        path = self.get_path(key)
+        with path.open('wb') as cache_file:
+            cache_file.write(json.dumps(metadata).encode('utf-8') + b'\n')
+            cache_file.write(self.encode(value))
+
+        purge_time = now + ttl + self.retention
+        os.utime(path, (purge_time, purge_time))
+
+    def delete(self, key):
+        """ Remove the entry file.
+        """
+
+        try:
+            self.get_path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def purge(self):
+        """ Remove entry files which outlived retention time.
+        """
+
+        if not self.directory.exists():
+            return
+
+        now = time.time()
+        for path in self.directory.iterdir():
+            try:
+                if path.is_file() and path.stat().st_mtime <= now:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class ZlibFileCache(FileCache):
+    """ Cache storage with one zlib compressed file per entry.
+
+    Pages take several times less disk space for a little more time
+    spent on every hit. Files are read through memory map, so the
+    compressed data is decompressed from the mapped pages without being
+    read into a buffer first.
+    """
+
+    name = 'zlib'
+    encoding = 'zlib'
+
+    def read_entry(self, cache_file):
+        """ Entry from the open entry file read through memory map.
+        """
+
+        with mmap.mmap(cache_file.fileno(), 0,
+                       access=mmap.ACCESS_READ) as content, \
+                memoryview(content) as view:
+            start = content.find(b'\n') + 1
+            # slices are released explicitly, the map can not be closed
+            # while they are referenced, e.g. by a traceback
+            with view[:start] as metadata, view[start:] as data:
+                return self.create_entry(metadata.tobytes(), data)
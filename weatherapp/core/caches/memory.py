@@ -0,0 +1,102 @@
+import threading
+import time
+from collections import OrderedDict
+
+from weatherapp.core import config
+from weatherapp.core.abstract import CacheBackend, CacheEntry
+
+
+class MemoryCache(CacheBackend):
+    """ In-memory layer in front of another cache storage.
+
+    Keeps recently used entries in a dictionary, so a long running
+    process answers repeated lookups without touching the disk. Writes
+    go through to the wrapped storage, misses are read from it.
+
+    :param backend: wrapped persistent storage
+    :type backend: CacheBackend
+    :param max_entries: how many entries are kept in memory, least
+                        recently used ones are dropped first
+    :type max_entries: int
+    """
+
+    name = 'memory'
+
+    def __init__(self, backend, max_entries=config.DAEMON_MEMORY_SIZE):
+        self.backend = backend
+        self.ttl = backend.ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def retention(self):
+        """ How long expired entries are kept by the wrapped storage.
+        """
+
+        return self.backend.retention
+
+    @retention.setter
+    def retention(self, value):
+        self.backend.retention = value
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_entry(self, key):
+        """ Get entry from memory or from the wrapped storage.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = self.backend.get_entry(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def set(self, key, value, ttl=None, headers=None):
+        """ Store entry in memory and in the wrapped storage.
+        """
+
+        ttl = self.ttl if ttl is None else ttl
+        self.backend.set(key, value, ttl, headers)
+        self._remember(key, CacheEntry(value, time.time(), ttl,
+                                       headers or {}))
+
+    def delete(self, key):
+        """ Remove entry from memory and from the wrapped storage.
+        """
+
+        with self._lock:
+            self._entries.pop(key, None)
+        self.backend.delete(key)
+
+    def purge(self):
+        """ Drop expired entries from memory and purge the wrapped
+        storage.
+        """
+
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if not entry.is_valid():
+                    del self._entries[key]
+        self.backend.purge()
+
+    def flush(self):
+        self.backend.flush()
+
+    def close(self):
+        """ Close the wrapped storage.
+        """
+
+        with self._lock:
+            self._entries.clear()
+        self.backend.close()
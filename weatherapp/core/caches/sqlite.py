@@ -0,0 +1,185 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from weatherapp.core import config
+from weatherapp.core.abstract import CacheBackend, CacheEntry
+
+
+class SQLiteCache(CacheBackend):
+    """ Single file cache storage in SQLite database.
+
+    Keeps key, fetch time, time to live, last access time, size, body
+    and response headers of every entry. Database works in WAL mode,
+    writes and access time updates are buffered and committed in
+    batches. Least recently used entries are evicted when total size
+    exceeds the cap.
+
+    :param path: database file, defaults to one in current working
+                 directory
+    :type path: pathlib.Path
+    :param ttl: default time to live of entries (in seconds)
+    :type ttl: float
+    :param retention: how long expired entries are kept (in seconds)
+    :type retention: float
+    :param max_size: total size of bodies to keep (in bytes)
+    :type max_size: int
+    :param batch_size: how many pending writes trigger commit
+    :type batch_size: int
+    """
+
+    name = 'sqlite'
+
+    SCHEMA_VERSION = 2
+    SCHEMA = """
+        DROP TABLE IF EXISTS cache;
+        CREATE TABLE cache (
+            key TEXT PRIMARY KEY,
+            fetched REAL NOT NULL,
+            ttl REAL NOT NULL,
+            accessed REAL NOT NULL,
+            size INTEGER NOT NULL,
+            body BLOB NOT NULL,
+            headers TEXT NOT NULL
+        );
+        CREATE INDEX cache_accessed ON cache (accessed);
+    """
+
+    def __init__(self, path=None, ttl=config.CACHE_TIME,
+                 retention=config.CACHE_RETENTION,
+                 max_size=config.CACHE_MAX_SIZE,
+                 batch_size=config.CACHE_BATCH_SIZE):
+        self.path = path or Path.cwd() / config.CACHE_DB
+        self.ttl = ttl
+        self.retention = retention
+        self.max_size = max_size
+        self.batch_size = batch_size
+
+        self._lock = threading.RLock()
+        self._pending = {}
+        self._accessed = {}
+        self._connection = None
+
+    @property
+    def connection(self):
+        """ Database connection opened on first use.
+        """
+
+        if self._connection is None:
+            connection = sqlite3.connect(str(self.path),
+                                         check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            version, = connection.execute('PRAGMA user_version').fetchone()
+            if version != self.SCHEMA_VERSION:
+                # cache content is disposable, so it is simply recreated
+                connection.executescript(self.SCHEMA)
+                connection.execute(
+                    f'PRAGMA user_version={self.SCHEMA_VERSION}')
+            self._connection = connection
+        return self._connection
+
+    def get_entry(self, key):
+        """ Return cached entry if any.
+        """
+
+        with self._lock:
+            row = self._pending.get(key)
+            if row is None:
+                row = self.connection.execute(
+                    'SELECT key, fetched, ttl, accessed, size, body, headers '
+                    'FROM cache WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+
+            self._accessed[key] = time.time()
+            key, fetched, ttl, accessed, size, body, headers = row
+            return CacheEntry(body, fetched, ttl, json.loads(headers))
+
+    def set(self, key, value, ttl=None, headers=None):
+        """ Buffer entry write, commit buffer when it is full.
+        """
+
+        now = time.time()
+        ttl = self.ttl if ttl is None else ttl
+        headers = json.dumps(headers or {})
+        with self._lock:
+            self._pending[key] = (key, now, ttl, now, len(value), value,
+                                  headers)
+            self._accessed.pop(key, None)
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def delete(self, key):
+        """ Remove entry from the database.
+        """
+
+        with self._lock:
+            self._pending.pop(key, None)
+            self._accessed.pop(key, None)
+            with self.connection:
+                self.connection.execute('DELETE FROM cache WHERE key = ?',
+                                        (key,))
+
+    def purge(self):
+        """ Remove entries which outlived retention time.
+        """
+
+        with self._lock, self.connection:
+            self.connection.execute(
+                'DELETE FROM cache WHERE fetched + ttl + ? <= ?',
+                (self.retention, time.time()))
+
+    def flush(self):
+        """ Commit buffered writes and access times, then evict least
+        recently used entries over the size cap.
+        """
+
+        with self._lock:
+            if not (self._pending or self._accessed):
+                return
+
+            with self.connection:
+                self.connection.executemany(
+                    'INSERT OR REPLACE INTO cache '
+                    '(key, fetched, ttl, accessed, size, body, headers) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)', self._pending.values())
+                self.connection.executemany(
+                    'UPDATE cache SET accessed = ? WHERE key = ?',
+                    [(accessed, key)
+                     for key, accessed in self._accessed.items()])
+                self._evict()
+            self._pending.clear()
+            self._accessed.clear()
+
+    def _evict(self):
+        """ Remove least recently used entries until total size of the
+        rest fits the cap.
+        """
+
+        total, = self.connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM cache').fetchone()
+        if total <= self.max_size:
+            return
+
+        evicted = []
+        for key, size in self.connection.execute(
+                'SELECT key, size FROM cache ORDER BY accessed'):
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+        self.connection.executemany('DELETE FROM cache WHERE key = ?',
+                                    evicted)
+
+    def close(self):
+        """ Commit pending changes and close the database.
+        """
+
+        with self._lock:
+            super().close()
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,89 @@
+""" Thin client forwarding command line to a running daemon.
+
+Imports only the standard library, so a call answered by the daemon
+does not pay for loading providers, parsers and HTTP libraries.
+"""
+import http.client
+import json
+import sys
+from pathlib import Path
+
+from weatherapp.core import config
+
+# commands which need local terminal or run for a long time
+LOCAL_COMMANDS = ('serve', 'schedule', 'configurate', 'locations')
+
+
+def get_daemon_file():
+    """ Path to the address file of the daemon of current directory.
+    """
+
+    return Path.cwd() / config.DAEMON_FILE
+
+
+def get_daemon_address():
+    """ Address and access token of the running daemon.
+
+    :return: host, port and token or None if no daemon was started
+    :rtype: tuple
+    """
+
+    try:
+        address = json.loads(get_daemon_file().read_text(encoding='utf-8'))
+        return address['host'], int(address['port']), address['token']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def forward(argv, stdout):
+    """ Run command line in the daemon and print its output.
+
+    :param argv: list of passed arguments
+    :param stdout: stream for the output
+    :return: False if command has to run locally, because it can not be
+             forwarded, e.g. it reads or writes files, or no daemon
+             answered
+    :rtype: bool
+    """
+
+    if '--local' in argv or any(name in argv for name in LOCAL_COMMANDS):
+        return False
+
+    address = get_daemon_address()
+    if address is None:
+        return False
+
+    host, port, token = address
+    connection = http.client.HTTPConnection(
+        host, port, timeout=config.DAEMON_CLIENT_TIMEOUT)
+    try:
+        connection.request('POST', '/run', json.dumps({'argv': argv}),
+                           {'Content-Type': 'application/json',
+                            'Authorization': f'Bearer {token}'})
+        response = connection.getresponse()
+        if response.status != 200:
+            return False
+        output = json.loads(response.read().decode('utf-8'))['output']
+    except (OSError, http.client.HTTPException, ValueError, KeyError):
+        return False
+    finally:
+        connection.close()
+
+    stdout.write(output)
+    return True
+
+
+def main(argv=sys.argv[1:]):
+    """ Main entry point, runs application locally when daemon is not
+    available.
+    """
+
+    if forward(argv, sys.stdout):
+        return None
+
+    from weatherapp.core.app import main as run_locally
+    return run_locally(argv)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
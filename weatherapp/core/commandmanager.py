@@ -1,31 +1,50 @@
-from weatherapp.core.commands import Configurate, Providers
-
 from weatherapp.core import abstract
+from weatherapp.core.plugins import COMMANDS_GROUP, PluginSpec
+from weatherapp.core.plugins import builtin_plugins, discover_plugins
 
 
 class CommandManager(abstract.Manager):
     """ Manager for app commands.
+
+    Commands are registered by their specs and imported on first use.
+    Commands of other packages are discovered through entry points only
+    when a name is not found among registered ones or all commands are
+    listed.
     """
 
+    group = COMMANDS_GROUP
+
     def __init__(self):
         self._commands = {}
+        self._discovered = False
         self._load_commands()
 
     def add(self, name, command):
         """ Registers command under specified name.
         :param name: command name
         :type name: str
-        :param command: command class
-        :type command: abstract.Command
+        :param command: command class or its spec
+        :type command: abstract.Command or plugins.PluginSpec
         """
 
         self._commands[name] = command
 
     def _load_commands(self):
-        """Load all external (from an entrypoints) commands."""
+        """ Register built-in commands.
+        """
 
-        for command in [Configurate, Providers]:
-            self.add(command.name, command)
+        for spec in builtin_plugins(self.group):
+            self.add(spec.name, spec)
+
+    def discover(self):
+        """ Register commands of installed packages from entry points.
+        """
+
+        if self._discovered:
+            return
+        self._discovered = True
+        for spec in discover_plugins(self.group):
+            self._commands.setdefault(spec.name, spec)
 
     def get(self, name):
         """ Gets command from command registry.
@@ -36,14 +55,44 @@ class CommandManager(abstract.Manager):
         :type name: str
         """
 
-        return self._commands.get(name, None)
+        if name not in self:
+            return None
+        command = self._commands[name]
+        if isinstance(command, PluginSpec):
+            command = self._commands[name] = command.load()
+        return command
+
+    def get_spec(self, name):
+        """ Gets metadata of the command without importing it.
+        :param name: command name
+        :type name: str
+        :rtype: plugins.PluginSpec
+        """
+
+        if name not in self:
+            return None
+        return PluginSpec.of(name, self._commands[name])
+
+    def specs(self):
+        """ Metadata of all commands, none of them is imported.
+        """
+
+        self.discover()
+        for name, command in list(self._commands.items()):
+            yield PluginSpec.of(name, command)
 
     def __getitem__(self, name):
-        return self._commands[name]
+        command = self.get(name)
+        if command is None:
+            raise KeyError(name)
+        return command
 
     def __contains__(self, name):
+        if name not in self._commands:
+            self.discover()
         return name in self._commands
 
     def __iter__(self):
-        for key, value in self._commands.items():
-            yield (key, value)
+        self.discover()
+        for name in list(self._commands):
+            yield (name, self.get(name))
@@ -1,2 +1,14 @@
-from weatherapp.core.commands.config import Configurate
-from weatherapp.core.commands.providers import Providers
\ No newline at end of file
+from weatherapp.core.plugins import lazy_exports
+
+_EXPORTS = {
+    'Compare': 'weatherapp.core.commands.compare',
+    'Configurate': 'weatherapp.core.commands.config',
+    'History': 'weatherapp.core.commands.history',
+    'Locations': 'weatherapp.core.commands.locations',
+    'Providers': 'weatherapp.core.commands.providers',
+    'Schedule': 'weatherapp.core.commands.schedule',
+    'Serve': 'weatherapp.core.commands.serve',
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,67 @@
+import math
+
+from weatherapp.core.abstract import Command
+from weatherapp.core.formatters.combined import CombinedTableFormatter
+
+
+class ComparisonTable(CombinedTableFormatter):
+    """ Table with a row per location and mean and spread of every
+    compared field.
+    """
+
+    columns = ('location', 'provider', 'temp', 'temp_spread', 'feels_like',
+               'feels_like_spread', 'wind_speed', 'wind_speed_spread',
+               'disagree')
+    titles = {'location': 'Location', 'provider': 'Readings',
+              'temp': 'Temperature, °C', 'temp_spread': 'Spread',
+              'feels_like': 'Feels like, °C', 'feels_like_spread': 'Spread',
+              'wind_speed': 'Wind, km/h', 'wind_speed_spread': 'Spread',
+              'disagree': 'Disagree on'}
+
+
+# names of compared fields in the list of disagreements
+FIELD_NAMES = {'temp': 'temperature', 'feels_like': 'feels like',
+               'wind_speed': 'wind'}
+
+
+def format_value(value):
+    """ Value rounded to tenths, empty if it is unknown.
+    """
+
+    return '' if math.isnan(value) else f'{value:.1f}'
+
+
+class Compare(Command):
+    """ Compare weather of the same locations from all providers.
+    """
+
+    name = 'compare'
+
+    def get_parser(self):
+        parser = super().get_parser()
+        parser.add_argument('providers', help="Provider names, all "
+                                              "providers by default",
+                            nargs='*')
+        return parser
+
+    def run(self, argv):
+        """ Run command.
+        """
+
+        from weatherapp.core.consensus import FIELDS, compare
+
+        parsed_args = self.get_parser().parse_args(argv)
+        providers = self.app.get_providers(parsed_args.providers)
+
+        consensus = compare(self.app.collect_readings(providers))
+        table = ComparisonTable(self.app.stdout)
+        for index, location in enumerate(consensus.locations):
+            data = {'disagree': ', '.join(
+                FIELD_NAMES[name] for name, disagree
+                in zip(FIELDS, consensus.disagree[index]) if disagree)}
+            for name, mean, spread in zip(FIELDS, consensus.mean[index],
+                                          consensus.spread[index]):
+                data[name] = format_value(mean)
+                data[f'{name}_spread'] = format_value(spread)
+            table.write(str(consensus.counts[index]), location, data)
+        table.end()
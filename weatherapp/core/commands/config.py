@@ -10,6 +10,8 @@ class Configurate(Command):
     def get_parser(self):
         parser = super().get_parser()
         parser.add_argument('provider', help="Provider name")
+        parser.add_argument('--name', help="Location name to find in the "
+                                           "locations index")
         return parser
 
     def run(self, argv):
@@ -19,4 +21,8 @@ class Configurate(Command):
         parsed_args = self.get_parser().parse_args(argv)
         provider_name = parsed_args.provider
         provider_factory = self.app.providermanager.get(provider_name)
-        provider_factory(self.app).configurate()
+        provider = provider_factory(self.app)
+        if parsed_args.name:
+            provider.configurate_by_name(parsed_args.name)
+        else:
+            provider.configurate()
@@ -0,0 +1,52 @@
+import time
+
+from weatherapp.core import config
+from weatherapp.core.abstract import Command
+from weatherapp.core.formatters.combined import CombinedTableFormatter
+from weatherapp.core.history import parse_time
+
+
+class HistoryTable(CombinedTableFormatter):
+    """ Table with a row per recorded reading.
+    """
+
+    columns = ('time', 'provider') + config.OUTPUT_FIELDS
+    titles = dict(config.OUTPUT_TITLES, time='Time')
+
+
+class History(Command):
+    """ Print recorded readings of a location.
+    """
+
+    name = 'history'
+
+    def get_parser(self):
+        parser = super().get_parser()
+        parser.add_argument('location', help="Location name", nargs='+')
+        parser.add_argument('-s', '--since', type=parse_time,
+                            help="Start as date and time, e.g. 2019-03-25 "
+                                 "or '2019-03-25 12:00', or as time ago, "
+                                 "e.g. 30m, 12h, 7d or 2w")
+        parser.add_argument('-u', '--until', type=parse_time,
+                            help="End, in the same format")
+        return parser
+
+    def run(self, argv):
+        """ Run command.
+        """
+
+        parsed_args = self.get_parser().parse_args(argv)
+        location = ' '.join(parsed_args.location)
+        readings = self.app.history.query(location, parsed_args.since,
+                                          parsed_args.until)
+        if not len(readings):
+            self.app.stdout.write(f'No readings of {location}\n')
+            return
+
+        table = HistoryTable(self.app.stdout)
+        for reading in readings:
+            moment = time.strftime('%Y-%m-%d %H:%M',
+                                   time.localtime(reading.timestamp))
+            table.write(reading.provider, reading.location,
+                        dict(reading.as_info(), time=moment))
+        table.end()
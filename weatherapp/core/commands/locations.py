@@ -0,0 +1,41 @@
+from weatherapp.core.abstract import Command
+from weatherapp.core.locationindex import LocationIndex
+
+
+class Locations(Command):
+    """ Build and search the locations index of weather providers.
+    """
+
+    name = 'locations'
+
+    def get_parser(self):
+        parser = super().get_parser()
+        parser.add_argument('action', help="Action", choices=['build',
+                                                              'search'])
+        parser.add_argument('provider', help="Provider name")
+        parser.add_argument('query', help="Location name to search",
+                            nargs='?', default='')
+        return parser
+
+    def run(self, argv):
+        """ Run command.
+        """
+
+        parsed_args = self.get_parser().parse_args(argv)
+        provider_name = parsed_args.provider
+        provider = self.app.providermanager.get(provider_name)(self.app)
+        index = LocationIndex(provider_name)
+
+        if parsed_args.action == 'build':
+            if provider.get_browse_root() is None:
+                self.app.stdout.write(f'{provider.title} has no browsable '
+                                      'locations index\n')
+                return
+            count = index.build(provider.crawl_locations())
+            self.app.stdout.write(f'{count} locations of {provider.title} '
+                                  'are indexed\n')
+            return
+
+        for location in index.search(parsed_args.query):
+            self.app.stdout.write(
+                f'{location.name} ({location.path}): {location.url}\n')
@@ -12,5 +12,5 @@ class Providers(Command):
     def run(self, argv):
         """ Run command.
         """
-        for name, provider in self.app.providermanager:
-            self.app.stdout.write(f'{provider.title}: {name}\n')
+        for spec in self.app.providermanager.specs():
+            self.app.stdout.write(f'{spec.title}: {spec.name}\n')
@@ -0,0 +1,39 @@
+import signal
+
+from weatherapp.core.abstract import Command
+from weatherapp.core.commands.serve import interrupt
+
+
+class Schedule(Command):
+    """ Keep weather info of configured locations refreshed.
+    """
+
+    name = 'schedule'
+
+    def get_parser(self):
+        parser = super().get_parser()
+        parser.add_argument('providers', help="Provider names, all "
+                                              "providers by default",
+                            nargs='*')
+        return parser
+
+    def run(self, argv):
+        """ Run command.
+        """
+
+        from weatherapp.core.scheduler import RefreshScheduler
+
+        parsed_args = self.get_parser().parse_args(argv)
+        providers = self.app.get_providers(parsed_args.providers)
+
+        scheduler = RefreshScheduler(self.app, providers)
+        signal.signal(signal.SIGTERM, interrupt)
+        self.app.stdout.write(f'Refreshing {len(scheduler.jobs)} locations, '
+                              'press Ctrl+C to stop\n')
+        self.app.stdout.flush()
+        try:
+            scheduler.run()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            scheduler.stop()
@@ -0,0 +1,61 @@
+import signal
+import threading
+
+from weatherapp.core import config
+from weatherapp.core.abstract import Command
+from weatherapp.core.client import get_daemon_file
+
+
+def interrupt(signum, frame):
+    """ Stop long running command on termination like on Ctrl+C.
+    """
+
+    raise KeyboardInterrupt
+
+
+class Serve(Command):
+    """ Run weather daemon answering local clients.
+    """
+
+    name = 'serve'
+
+    def get_parser(self):
+        parser = super().get_parser()
+        parser.add_argument('--host', help="Interface to listen on",
+                            default=config.DAEMON_HOST)
+        parser.add_argument('--port', help="Port to listen on",
+                            type=int, default=config.DAEMON_PORT)
+        parser.add_argument('--schedule', help="Keep configured locations "
+                                               "refreshed in background",
+                            action='store_true')
+        return parser
+
+    def run(self, argv):
+        """ Run command.
+        """
+
+        from weatherapp.core.daemon import WeatherDaemon
+        from weatherapp.core.scheduler import RefreshScheduler
+
+        parsed_args = self.get_parser().parse_args(argv)
+        server = WeatherDaemon(self.app, parsed_args.host, parsed_args.port)
+        scheduler = None
+        if parsed_args.schedule:
+            providers = [provider(self.app) for name, provider
+                         in self.app.providermanager]
+            scheduler = RefreshScheduler(self.app, providers)
+            threading.Thread(target=scheduler.run, daemon=True).start()
+
+        signal.signal(signal.SIGTERM, interrupt)
+        server.publish(get_daemon_file())
+        host, port = server.server_address[:2]
+        self.app.stdout.write(f'Serving weather on http://{host}:{port}\n')
+        self.app.stdout.flush()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if scheduler is not None:
+                scheduler.stop()
+            server.server_close()
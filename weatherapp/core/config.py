@@ -6,12 +6,84 @@ DEFAULT_MESSAGE_FORMAT = (
 # Fake user agent for weather sites requests
 FAKE_MOZILLA_AGENT = 'Mozilla/5.0 (X11; Ubuntu; Linux x86_64)'
 
+# Concurrent providers execution settings
+DEFAULT_WORKERS = 4  # how many providers may run at the same time
+PROVIDER_TIMEOUT = 30  # deadline for a single provider (in seconds)
+
+# HTTP transport settings
+HTTP_POOL_SIZE = 10  # kept-alive connections per host
+HTTP_CONNECT_TIMEOUT = 5  # time to establish connection (in seconds)
+HTTP_READ_TIMEOUT = 20  # time to wait for server response (in seconds)
+HTTP_CHUNK_SIZE = 16 * 1024  # size of streamed body chunks (in bytes)
+HOST_RATE_LIMITS = {  # requests per second and burst size by host, shared
+    'accuweather.com': (1, 4),  # by all providers, subdomains included
+    'rp5.ua': (1, 4),
+}
+HTTP_RATE_LIMIT = None  # limit of other hosts, None disables it
+
+# Output settings
+OUTPUT_FIELDS = ('cond', 'temp', 'feels_like', 'wind')  # weather info fields
+                                                     # in order of columns
+COMPARE_THRESHOLDS = {'temp': 3, 'feels_like': 3,
+                      'wind_speed': 10}  # spread of values (°C, km/h)
+                                         # providers disagree on
+OUTPUT_TITLES = {'provider': 'Provider', 'location': 'Location',
+                 'cond': 'Condition', 'temp': 'Temperature',
+                 'feels_like': 'Feels like', 'wind': 'Wind'}  # column headers
+
+# Parser settings
+PARSER_ENGINES = ('lxml', 'soup')  # engines to extract weather info
+PARSER_ENGINE = 'lxml'  # default engine
+
 # Configuration settings
 CONFIG_FILE = '.weatherapp.ini'  # configuration file name
+LOCATIONS_SECTION = '{}.locations'  # section with provider batch locations
+
+# Locations index settings
+LOCATIONS_INDEX_DIR = '.wappindex'  # locations index directory name
+LOCATIONS_SEARCH_LIMIT = 20  # maximum number of found locations
+LOCATIONS_FUZZY_CANDIDATES = 1000  # names around the query compared by
+                                  # fuzzy lookup
+
+# Configuration browse prefetch settings
+PREFETCH_WORKERS = 4  # threads loading next browse levels
+PREFETCH_LIMIT = 10  # how many entries of the level are prefetched
+BROWSE_CHOICE_TIME = 365 * 24 * 60 * 60  # how long choices of the user are
+                                         # remembered (in seconds)
 
 # Cache settings
+CACHE_BACKEND = 'sqlite'  # default cache storage, 'sqlite', 'file' or
+                          # 'zlib'
 CACHE_DIR = '.wappcache'  # cache directory name
+CACHE_DB = '.wappcache.sqlite'  # cache database file name
 CACHE_TIME = 300  # how long cache files are valid (in seconds)
+CACHE_STALE_TIME = 600  # how long expired entries are served while they are
+                        # refreshed in background (in seconds)
+REFRESH_WORKERS = 2  # background refresh threads
+CACHE_RETENTION = 24 * 60 * 60  # how long expired entries are kept for
+                                # revalidation (in seconds)
+CACHE_VALIDATORS = ('ETag', 'Last-Modified')  # headers kept for revalidation
+CACHE_MAX_SIZE = 50 * 1024 * 1024  # cache database size cap (in bytes)
+CACHE_BATCH_SIZE = 16  # how many writes are committed at once
+CACHE_COMPRESSION_LEVEL = 6  # zlib level of compressed cache files
+
+# History settings
+HISTORY_DB = '.wapphistory.sqlite'  # database file of recorded readings
+
+# Refresh scheduler settings
+SCHEDULE_LEAD = 30  # how long before expiration locations are refreshed
+                    # (in seconds)
+SCHEDULE_JITTER = 60  # random spread of refresh times (in seconds)
+SCHEDULE_RETRY_TIME = 60  # delay before failed refresh is retried
+                          # (in seconds)
+
+# Daemon settings
+DAEMON_HOST = '127.0.0.1'  # daemon accepts only local connections
+DAEMON_PORT = 8765  # default daemon port, 0 picks a free one
+DAEMON_FILE = '.wappd'  # file with address of the daemon running in
+                        # current working directory
+DAEMON_MEMORY_SIZE = 1024  # how many cache entries daemon keeps in memory
+DAEMON_CLIENT_TIMEOUT = 60  # how long client waits for daemon (in seconds)
 
 # AccuWeather provider related configuration
 ACCU_PROVIDER_NAME = 'accu'  # provider id
@@ -21,6 +93,8 @@ DEFAULT_ACCU_LOCATION_NAME = 'Dnipro'
 DEFAULT_ACCU_LOCATION_URL = (
     'https://www.accuweather.com/uk/ua/dnipro/322722/weather-forecast/322722')
 ACCU_BROWSE_LOCATIONS = 'https://www.accuweather.com/uk/browse-locations'
+# how long location to current day page url mapping is valid (in seconds)
+ACCU_CURRENT_DAY_URL_TIME = 7 * 24 * 60 * 60
 
 # rp5.ua provider related configuration
 RP5_PROVIDER_NAME = 'rp5'  # provider id
@@ -0,0 +1,188 @@
+""" Configuration of providers shared by the whole application.
+"""
+import configparser
+import contextlib
+import logging
+import os
+import stat
+import tempfile
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+from weatherapp.core import config
+
+# selected location of a provider and all its locations for batch run
+ProviderConfig = namedtuple('ProviderConfig', ['location', 'url',
+                                               'locations'])
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """ Exclusive lock of the file between processes.
+
+    :param path: lock file, created if missing
+    :type path: pathlib.Path
+    """
+
+    with open(path, 'a+b') as lock_file:
+        if os.name == 'nt':
+            import msvcrt
+
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class ConfigStore:
+    """ Parsed configuration files of the application.
+
+    Every file is parsed once and parsed result is reused until the file
+    is changed on disk, so many providers and locations created in one
+    run, or by the daemon, do not read it again. Changes are written to
+    a temporary file which then replaces the configuration file, under a
+    lock shared with other processes, so the file is never truncated.
+
+    :param path: configuration file, defaults to one in current working
+                 directory
+    :type path: pathlib.Path
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, path=None):
+        self.path = path or Path.cwd() / config.CONFIG_FILE
+        self._parsed = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _get_stamp(path):
+        try:
+            path_stat = os.stat(path)
+        except OSError:
+            return None
+        return path_stat.st_mtime_ns, path_stat.st_size
+
+    def _parse(self, paths, keep_case=False):
+        parser = configparser.ConfigParser(strict=False, interpolation=None)
+        if keep_case:
+            parser.optionxform = str
+
+        try:
+            parser.read(paths, encoding='utf-8')
+        except configparser.Error:
+            msg = ("\nProviders configuration file is corrupt!\n"
+                   "Reconfigure it. The program will be interrupted.")
+            self.logger.debug(msg)
+            raise SystemExit
+        return parser
+
+    def read(self, *extra_paths, keep_case=False):
+        """ Parsed configuration, options of extra files override the
+        configuration file ones. Returned parser must not be changed.
+
+        Option names are case-insensitive unless ``keep_case`` is set,
+        which is needed only for sections keyed by location names.
+
+        :param extra_paths: other files to read, e.g. batch locations
+        :param keep_case: keep option names as they are written
+        :type keep_case: bool
+        :rtype: configparser.ConfigParser
+        """
+
+        paths = (str(self.path),) + tuple(str(path) for path in extra_paths)
+        stamps = tuple(self._get_stamp(path) for path in paths)
+        key = paths, keep_case
+        with self._lock:
+            parsed = self._parsed.get(key)
+            if parsed is None or parsed[0] != stamps:
+                parsed = self._parsed[key] = (stamps,
+                                              self._parse(paths, keep_case))
+            return parsed[1]
+
+    def get_provider_config(self, provider, location, url,
+                            locations_file=None):
+        """ Configuration of the provider.
+
+        Locations for batch run are taken from ``<provider>.locations``
+        section of the configuration file or of the locations file.
+
+        :param provider: provider name
+        :type provider: str
+        :param location: default location name
+        :type location: str
+        :param url: default location url
+        :type url: str
+        :param locations_file: file with batch locations
+        :type locations_file: str
+        :rtype: ProviderConfig
+        """
+
+        extra_paths = [locations_file] if locations_file else []
+        parser = self.read(*extra_paths)
+
+        if parser.has_section(provider):
+            location_config = parser[provider]
+            location, url = location_config['name'], location_config['url']
+
+        # location names are option names, their case is kept for output
+        locations_section = config.LOCATIONS_SECTION.format(provider)
+        parser = self.read(*extra_paths, keep_case=True)
+        if parser.has_section(locations_section):
+            locations = list(parser[locations_section].items())
+        else:
+            locations = [(location, url)]
+
+        return ProviderConfig(location, url, locations)
+
+    def save_location(self, provider, location, url):
+        """ Save selected location of the provider.
+
+        The file is read again under the lock, so changes made by other
+        processes are kept.
+
+        :param provider: provider name
+        :type provider: str
+        :param location: location name
+        :type location: str
+        :param url: location url
+        :type url: str
+        """
+
+        with self._lock, file_lock(self.path.with_name(
+                self.path.name + '.lock')):
+            # locations sections are written back as they are
+            parser = self._parse([str(self.path)], keep_case=True)
+            parser[provider] = {'name': location, 'url': url}
+            self._write(parser)
+            self._parsed.clear()
+
+    def _write(self, parser):
+        descriptor, temp_path = tempfile.mkstemp(
+            dir=str(self.path.parent), prefix=self.path.name, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as temp_file:
+                parser.write(temp_file)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            try:
+                mode = stat.S_IMODE(os.stat(self.path).st_mode)
+            except OSError:
+                mode = 0o644
+            os.chmod(temp_path, mode)
+            os.replace(temp_path, str(self.path))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
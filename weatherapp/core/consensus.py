@@ -0,0 +1,94 @@
+""" Agreement of providers on weather of the same locations.
+
+Readings of all providers are grouped by location name and every field
+is aggregated for all groups at once with NumPy, so comparing thousands
+of locations takes a few array operations instead of a Python loop.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from weatherapp.core import config
+from weatherapp.core.locationindex import LocationIndex
+
+# numeric fields of readings which are compared
+FIELDS = ('temp', 'feels_like', 'wind_speed')
+
+KMH_PER_MPH = 1.609344
+
+Consensus = namedtuple('Consensus', ['locations', 'counts', 'mean',
+                                     'spread', 'disagree'])
+Consensus.__doc__ = """ Comparison of providers for every location.
+
+Arrays have a row per location and a column per field of ``FIELDS``,
+values are in metric units.
+
+:param locations: location names
+:param counts: number of readings of every location
+:param mean: mean values
+:param spread: difference between the highest and the lowest value
+:param disagree: True where the spread exceeds its threshold
+"""
+
+
+def get_values(batch):
+    """ Numeric fields of the batch in metric units.
+
+    :type batch: reading.ReadingBatch
+    :return: array with a row per reading and a column per field
+    :rtype: numpy.ndarray
+    """
+
+    values = np.column_stack([np.frombuffer(batch.column(name))
+                              for name in FIELDS])
+    imperial = np.asarray(batch.column('units')) == 'imperial'
+    if imperial.any():
+        values[imperial, :2] = (values[imperial, :2] - 32) * 5 / 9
+        values[imperial, 2] *= KMH_PER_MPH
+    return values
+
+
+def compare(batch, thresholds=None):
+    """ Compare readings of the same locations.
+
+    Locations are matched by name ignoring case and extra spaces. Missing
+    values are left out, a field without values in all readings of a
+    location has NaN mean and spread.
+
+    :param batch: readings of all providers
+    :type batch: reading.ReadingBatch
+    :param thresholds: spread of every field providers disagree on,
+                       ``config.COMPARE_THRESHOLDS`` by default
+    :type thresholds: dict
+    :rtype: Consensus
+    """
+
+    thresholds = thresholds or config.COMPARE_THRESHOLDS
+    if not len(batch):
+        empty = np.empty((0, len(FIELDS)))
+        return Consensus([], np.empty(0, dtype=int), empty, empty,
+                         empty.astype(bool))
+
+    names = batch.column('location')
+    keys = np.asarray([LocationIndex.normalize(name) for name in names])
+    _, first, inverse, counts = np.unique(
+        keys, return_index=True, return_inverse=True, return_counts=True)
+
+    # readings of every location become a contiguous run of rows
+    values = get_values(batch)[np.argsort(inverse, kind='stable')]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    present = ~np.isnan(values)
+    totals = np.add.reduceat(np.where(present, values, 0), starts)
+    numbers = np.add.reduceat(present, starts)
+    with np.errstate(invalid='ignore'):
+        mean = totals / numbers
+    # fmax and fmin skip NaN unless all values are NaN
+    spread = (np.fmax.reduceat(values, starts) -
+              np.fmin.reduceat(values, starts))
+    limits = np.array([thresholds[name] for name in FIELDS])
+    with np.errstate(invalid='ignore'):
+        disagree = spread > limits
+
+    return Consensus([names[index] for index in first], counts, mean,
+                     spread, disagree)
@@ -0,0 +1,239 @@
+""" Long running weather server answering requests of local clients.
+"""
+import hmac
+import io
+import json
+import logging
+import os
+import secrets
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from weatherapp.core import config
+from weatherapp.core.app import App
+from weatherapp.core.caches import MemoryCache
+from weatherapp.core.client import LOCAL_COMMANDS
+
+# options reading or writing files, which the daemon would access with
+# its own permissions
+FILE_OPTIONS = ('locations', 'profile_json')
+
+
+class RequestApp(App):
+    """ Application answering a single request of the daemon.
+
+    Shares resources of the daemon application, so managers, cache,
+    transport and background refresher stay warm between requests.
+    Options are parsed from every request on its own.
+
+    :param daemon_app: application of the daemon
+    :type daemon_app: App
+    :param stdout: stream for the output of the request
+    :param collect: keep results in ``readings`` instead of printing
+    :type collect: bool
+    """
+
+    def __init__(self, daemon_app, stdout, collect=False):
+        # no interactive input in the daemon
+        super().__init__(stdin=io.StringIO(), stdout=stdout, stderr=stdout,
+                         resources=daemon_app.resources)
+        self.readings = [] if collect else None
+
+    def configure_logging(self):
+        """ Logging is configured once by the daemon.
+        """
+
+    def close(self):
+        """ Shared resources are released by the daemon.
+        """
+
+    def run_command(self, name, argv):
+        if name in LOCAL_COMMANDS:
+            self.logger.error("Command %s can not run in the daemon", name)
+            return
+        super().run_command(name, argv)
+
+    def _produce_job_output(self, job, data=None, error=None):
+        if self.readings is None:
+            return super()._produce_job_output(job, data, error)
+
+        reading = {'provider': job.provider.name,
+                   'title': job.provider.title,
+                   'location': job.location}
+        if self.is_timeout(error):
+            reading['error'] = 'timeout'
+        elif error is not None:
+            reading['error'] = str(error) or type(error).__name__
+        else:
+            reading['data'] = data
+        self.readings.append(reading)
+        return None
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """ JSON API of the daemon.
+
+    ``GET /weather`` and ``GET /weather/<provider>`` return readings of
+    all locations, ``?refresh`` bypasses caches. ``POST /run`` with
+    ``{"argv": [...]}`` runs a command line and returns its output.
+    Requests need ``Authorization: Bearer <token>`` header with the token
+    from the daemon file, which only its owner may read.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    logger = logging.getLogger(__name__)
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def authorized(self):
+        """ Check the request carries the token of the daemon.
+        """
+
+        expected = f'Bearer {self.server.token}'.encode('latin-1')
+        header = self.headers.get('Authorization', '').encode('latin-1')
+        return hmac.compare_digest(header, expected)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/ping':
+            return self.send_json(200, {'pid': os.getpid()})
+        if not self.authorized():
+            return self.send_json(401, {'error': 'Unauthorized'})
+
+        if url.path != '/weather' and not url.path.startswith('/weather/'):
+            return self.send_json(404, {'error': 'Not found'})
+
+        provider = url.path[len('/weather/'):]
+        if provider and provider not in self.server.app.providermanager:
+            return self.send_json(404, {'error': f'Unknown provider '
+                                                 f'{provider}'})
+
+        argv = [provider] if provider else []
+        if 'refresh' in parse_qs(url.query, keep_blank_values=True):
+            argv.append('--refresh')
+        try:
+            readings = self.server.get_weather(argv)
+        except Exception:
+            self.logger.exception("Error during request %s", self.path)
+            return self.send_json(500, {'error': 'Internal error'})
+        return self.send_json(200, {'readings': readings})
+
+    def do_POST(self):
+        if urlsplit(self.path).path != '/run':
+            return self.send_json(404, {'error': 'Not found'})
+        if not self.authorized():
+            return self.send_json(401, {'error': 'Unauthorized'})
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            argv = json.loads(self.rfile.read(length).decode('utf-8'))['argv']
+            if not all(isinstance(arg, str) for arg in argv):
+                raise TypeError(argv)
+        except (ValueError, KeyError, TypeError):
+            return self.send_json(400, {'error': 'Bad request'})
+        if not self.server.allows(argv):
+            return self.send_json(403, {'error': 'Command has to run '
+                                                 'locally'})
+
+        try:
+            output = self.server.run(argv)
+        except Exception:
+            self.logger.exception("Error during request %s", argv)
+            return self.send_json(500, {'error': 'Internal error'})
+        return self.send_json(200, {'output': output})
+
+    def log_message(self, format, *args):
+        self.logger.debug(format, *args)
+
+
+class WeatherDaemon(ThreadingHTTPServer):
+    """ Local HTTP server keeping the application warm between calls.
+
+    Address of the server and a random access token are written to the
+    daemon file of current working directory, where thin clients look
+    for them. Only the owner of the daemon may read the file.
+
+    :param app: application owning shared resources of the daemon
+    :type app: App
+    :param host: interface to listen on
+    :type host: str
+    :param port: port to listen on, 0 picks a free one
+    :type port: int
+    """
+
+    daemon_threads = True
+
+    def __init__(self, app, host=config.DAEMON_HOST, port=config.DAEMON_PORT):
+        super().__init__((host, port), DaemonRequestHandler)
+        self.app = app
+        if not isinstance(app.cache, MemoryCache):
+            app.resources.cache = MemoryCache(app.cache)
+        self.daemon_file = None
+        self.token = secrets.token_urlsafe()
+
+    def allows(self, argv):
+        """ Check the command line may run in the daemon.
+
+        Commands which read or write files given in options run locally
+        with permissions and working directory of the user.
+        """
+
+        try:
+            options, _ = self.app.arg_parser.parse_known_args(argv)
+        except SystemExit:
+            return False
+        return not any(getattr(options, name) for name in FILE_OPTIONS)
+
+    def run(self, argv):
+        """ Run command line like the application does.
+
+        :return: printed output
+        :rtype: str
+        """
+
+        stdout = io.StringIO()
+        RequestApp(self.app, stdout).run(argv)
+        return stdout.getvalue()
+
+    def get_weather(self, argv):
+        """ Run providers and collect their results.
+
+        :return: readings of all locations
+        :rtype: list of dict
+        """
+
+        app = RequestApp(self.app, io.StringIO(), collect=True)
+        app.run(argv)
+        return app.readings
+
+    def publish(self, path):
+        """ Write address and token of the server for clients.
+        """
+
+        host, port = self.server_address[:2]
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        # created readable by the owner only, the token is a secret
+        descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                             0o600)
+        with open(descriptor, 'w', encoding='utf-8') as daemon_file:
+            json.dump({'host': host, 'port': port, 'pid': os.getpid(),
+                       'token': self.token}, daemon_file)
+        self.daemon_file = path
+
+    def server_close(self):
+        super().server_close()
+        if self.daemon_file is not None:
+            try:
+                self.daemon_file.unlink()
+            except FileNotFoundError:
+                pass
+            self.daemon_file = None
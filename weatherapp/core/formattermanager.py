@@ -0,0 +1,9 @@
+from weatherapp.core import commandmanager
+from weatherapp.core.plugins import FORMATTERS_GROUP
+
+
+class FormatterManager(commandmanager.CommandManager):
+    """ Discovers registered output formatters and loads them.
+    """
+
+    group = FORMATTERS_GROUP
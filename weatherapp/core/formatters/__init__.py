@@ -1,2 +1,12 @@
-from weatherapp.core.formatters.table import TableFormatter
+from weatherapp.core.plugins import lazy_exports
 
+_EXPORTS = {
+    'CombinedTableFormatter': 'weatherapp.core.formatters.combined',
+    'CSVFormatter': 'weatherapp.core.formatters.structured',
+    'JSONFormatter': 'weatherapp.core.formatters.structured',
+    'NDJSONFormatter': 'weatherapp.core.formatters.structured',
+    'TableFormatter': 'weatherapp.core.formatters.table',
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,76 @@
+""" Single table of readings of all providers and locations.
+"""
+import io
+
+from weatherapp.core import config
+from weatherapp.core.abstract import Formatter
+
+
+class CombinedTableFormatter(Formatter):
+    """ Table with a row per location and a column per weather field.
+
+    Rows are collected until the end of the run, because column widths
+    depend on every row. Widths are counted while rows are added and the
+    table is written line by line, so rendering takes linear time.
+    """
+
+    columns = ('provider', 'location') + config.OUTPUT_FIELDS
+    titles = config.OUTPUT_TITLES
+
+    def __init__(self, stdout=None):
+        super().__init__(stdout)
+        self.rows = []
+        self.widths = [0] * len(self.columns)
+
+    def write(self, title, location, data):
+        row = self.get_row([title, location], data)
+        self.widths = [max(width, len(value))
+                       for width, value in zip(self.widths, row)]
+        self.rows.append(row)
+
+    def get_row(self, column_names, data):
+        """ Values of a reading in order of columns.
+        """
+
+        title, location = column_names
+        values = {'provider': title, 'location': location, **data}
+        return [str(values.get(column) or '') for column in self.columns]
+
+    def end(self):
+        if not self.rows:
+            return
+
+        header = [self.titles.get(column, column)
+                  for column in self.columns]
+        widths = [max(width, len(title))
+                  for width, title in zip(self.widths, header)]
+        # columns empty in every row are not shown
+        shown = [index for index, width in enumerate(self.widths) if width]
+
+        border = '+' + '+'.join('-' * (widths[index] + 2)
+                                for index in shown) + '+\n'
+        write = self.stdout.write
+        write(border)
+        write(self.format_line(header, widths, shown))
+        write(border)
+        for row in self.rows:
+            write(self.format_line(row, widths, shown))
+        write(border)
+        self.rows = []
+
+    @staticmethod
+    def format_line(values, widths, shown):
+        """ Line of the table with left aligned values.
+        """
+
+        return '| ' + ' | '.join(values[index].ljust(widths[index])
+                                 for index in shown) + ' |\n'
+
+    def emit(self, column_names, data):
+        """ Table of a single reading.
+        """
+
+        formatter = type(self)(io.StringIO())
+        formatter.write(*column_names, data)
+        formatter.end()
+        return formatter.stdout.getvalue().rstrip('\n')
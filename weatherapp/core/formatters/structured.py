@@ -0,0 +1,75 @@
+""" Machine readable formatters for pipelines.
+
+Every reading is written and flushed as soon as it is ready, nothing is
+kept in memory between readings.
+"""
+import csv
+import io
+import json
+
+from weatherapp.core import config
+from weatherapp.core.abstract import Formatter
+
+
+class NDJSONFormatter(Formatter):
+    """ One JSON object per line.
+    """
+
+    @staticmethod
+    def get_record(column_names, data):
+        """ Reading as a flat dictionary.
+        """
+
+        title, location = column_names
+        return {'provider': title, 'location': location, **data}
+
+    def emit(self, column_names, data):
+        return json.dumps(self.get_record(column_names, data),
+                          ensure_ascii=False)
+
+    def write(self, title, location, data):
+        super().write(title, location, data)
+        self.stdout.flush()
+
+
+class JSONFormatter(NDJSONFormatter):
+    """ Single JSON array of readings.
+    """
+
+    def __init__(self, stdout=None):
+        super().__init__(stdout)
+        self._separator = '\n'
+
+    def begin(self):
+        self.stdout.write('[')
+
+    def write(self, title, location, data):
+        self.stdout.write(self._separator)
+        self.stdout.write(self.emit([title, location], data))
+        self.stdout.flush()
+        self._separator = ',\n'
+
+    def end(self):
+        self.stdout.write(']\n' if self._separator == '\n' else '\n]\n')
+
+
+class CSVFormatter(Formatter):
+    """ Comma separated values with a header line.
+    """
+
+    columns = ('provider', 'location') + config.OUTPUT_FIELDS
+
+    def begin(self):
+        self.stdout.write(','.join(self.columns) + '\n')
+
+    def emit(self, column_names, data):
+        title, location = column_names
+        line = io.StringIO()
+        writer = csv.DictWriter(line, self.columns, extrasaction='ignore',
+                                lineterminator='')
+        writer.writerow({'provider': title, 'location': location, **data})
+        return line.getvalue()
+
+    def write(self, title, location, data):
+        super().write(title, location, data)
+        self.stdout.flush()
@@ -0,0 +1,150 @@
+""" Append only history of weather readings.
+"""
+import re
+import sqlite3
+import threading
+import time
+from argparse import ArgumentTypeError
+from datetime import datetime
+from pathlib import Path
+
+from weatherapp.core import config
+from weatherapp.core.locationindex import LocationIndex
+from weatherapp.core.reading import ReadingBatch, WeatherReading
+
+DURATION = re.compile(r'(\d+)([mhdw])')
+DURATION_UNITS = {'m': 60, 'h': 60 * 60, 'd': 24 * 60 * 60,
+                  'w': 7 * 24 * 60 * 60}
+
+
+def parse_time(value, now=None):
+    """ Moment given as local date and time or as time ago.
+
+    :param value: ISO date or date and time, e.g. '2019-03-25' or
+                  '2019-03-25 12:00', or time ago, e.g. '30m', '12h',
+                  '7d' or '2w'
+    :type value: str
+    :return: seconds since the epoch
+    :rtype: float
+    """
+
+    match = DURATION.fullmatch(value.strip())
+    if match:
+        number, unit = match.groups()
+        now = time.time() if now is None else now
+        return now - int(number) * DURATION_UNITS[unit]
+    try:
+        return datetime.fromisoformat(value.strip()).timestamp()
+    except ValueError:
+        raise ArgumentTypeError(f'invalid time: {value}') from None
+
+
+class HistoryStore:
+    """ Readings of all runs in SQLite database.
+
+    Rows are clustered by normalized location name and time of the
+    reading, so a range query of one location reads only its rows in
+    time order however many rows are stored.
+
+    :param path: database file, defaults to one in current working
+                 directory
+    :type path: pathlib.Path
+    """
+
+    SCHEMA_VERSION = 1
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS readings (
+            key TEXT NOT NULL,
+            timestamp REAL NOT NULL,
+            provider TEXT NOT NULL,
+            location TEXT NOT NULL,
+            cond TEXT,
+            temp REAL,
+            feels_like REAL,
+            wind TEXT,
+            wind_speed REAL,
+            units TEXT NOT NULL,
+            PRIMARY KEY (key, timestamp, provider)
+        ) WITHOUT ROWID;
+    """
+    FIELDS = ('provider', 'location', 'cond', 'temp', 'feels_like', 'wind',
+              'wind_speed', 'units', 'timestamp')
+    INSERT = (f'INSERT OR REPLACE INTO readings (key, {", ".join(FIELDS)}) '
+              f'VALUES ({", ".join("?" * (len(FIELDS) + 1))})')
+    SELECT = (f'SELECT {", ".join(FIELDS)} FROM readings '
+              'WHERE key = ? AND timestamp >= ? AND timestamp < ? '
+              'ORDER BY timestamp, provider')
+
+    def __init__(self, path=None):
+        self.path = path or Path.cwd() / config.HISTORY_DB
+        self._lock = threading.Lock()
+        self._connection = None
+
+    @property
+    def connection(self):
+        """ Database connection opened on first use.
+        """
+
+        if self._connection is None:
+            connection = sqlite3.connect(str(self.path),
+                                         check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            version, = connection.execute('PRAGMA user_version').fetchone()
+            if version != self.SCHEMA_VERSION:
+                with connection:
+                    connection.executescript(self.SCHEMA)
+                    connection.execute(
+                        f'PRAGMA user_version={self.SCHEMA_VERSION}')
+            self._connection = connection
+        return self._connection
+
+    def record(self, readings):
+        """ Append readings in a single transaction.
+
+        :param readings: iterable of reading.WeatherReading
+        :return: number of recorded readings
+        :rtype: int
+        """
+
+        rows = [(LocationIndex.normalize(reading.location),) +
+                tuple(getattr(reading, name) for name in self.FIELDS)
+                for reading in readings]
+        if not rows:
+            return 0
+
+        with self._lock, self.connection:
+            self.connection.executemany(self.INSERT, rows)
+        return len(rows)
+
+    def query(self, location, since=None, until=None):
+        """ Readings of the location in time order.
+
+        :param location: location name, case and extra spaces are ignored
+        :type location: str
+        :param since: start time, seconds since the epoch
+        :type since: float
+        :param until: end time (exclusive), seconds since the epoch
+        :type until: float
+        :rtype: reading.ReadingBatch
+        """
+
+        if not self.path.exists():
+            return ReadingBatch()
+
+        since = float('-inf') if since is None else since
+        until = float('inf') if until is None else until
+        with self._lock:
+            rows = self.connection.execute(
+                self.SELECT, (LocationIndex.normalize(location), since,
+                              until)).fetchall()
+        return ReadingBatch(WeatherReading(*row) for row in rows)
+
+    def close(self):
+        """ Close the database.
+        """
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,185 @@
+""" On-disk index of provider locations with prefix and fuzzy lookup.
+"""
+import difflib
+import mmap
+import os
+from collections import namedtuple
+from pathlib import Path
+
+from weatherapp.core import config
+
+# indexed location, path is the chain of browse level names leading to it
+Location = namedtuple('Location', ['key', 'name', 'url', 'path'])
+
+
+class LocationIndex:
+    """ Sorted array of provider locations stored in a text file.
+
+    Every line of the file holds normalized name, name, url and browse
+    path of one location separated by tabs, lines are sorted by the
+    normalized name, so prefix lookup is a binary search over the file.
+
+    :param provider: provider id
+    :type provider: str
+    :param directory: index directory, defaults to one in current
+                      working directory
+    :type directory: pathlib.Path
+    """
+
+    PATH_SEPARATOR = ' / '
+
+    def __init__(self, provider, directory=None):
+        self.provider = provider
+        self.directory = directory or Path.cwd() / config.LOCATIONS_INDEX_DIR
+
+    @property
+    def path(self):
+        """ Index file of the provider.
+        """
+
+        return self.directory / f'{self.provider}.tsv'
+
+    def exists(self):
+        return self.path.exists()
+
+    @staticmethod
+    def normalize(name):
+        """ Key used for lookup.
+        """
+
+        return ' '.join(name.split()).casefold()
+
+    def build(self, locations):
+        """ Write index of given locations replacing the previous one.
+
+        :param locations: iterable of (name, url, path) tuples
+        :type locations: iterable
+        :return: number of indexed locations
+        :rtype: int
+        """
+
+        entries = sorted(
+            Location(self.normalize(name), name, url,
+                     self.PATH_SEPARATOR.join(path))
+            for name, url, path in locations)
+
+        if not self.directory.exists():
+            self.directory.mkdir(parents=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with tmp_path.open('w', encoding='utf-8') as index_file:
+            for entry in entries:
+                index_file.write('\t'.join(
+                    ' '.join(field.split()) for field in entry) + '\n')
+        os.replace(tmp_path, self.path)
+
+        return len(entries)
+
+    @staticmethod
+    def _line_key(data, start):
+        """ Encoded key of the line starting at the position.
+        """
+
+        return data[start:data.find(b'\t', start)]
+
+    @staticmethod
+    def _read_line(data, start):
+        """ Location of the line starting at the position and start of
+        the next line.
+        """
+
+        end = data.find(b'\n', start)
+        if end < 0:
+            end = len(data)
+        return Location(*data[start:end].decode('utf-8').split('\t')), end + 1
+
+    def _bisect(self, data, key):
+        """ Start of the first line with key not less than given one.
+
+        UTF-8 keeps the order of characters, so encoded keys are compared
+        in the order the lines were sorted in.
+        """
+
+        low, high = 0, len(data)
+        while low < high:
+            start = data.rfind(b'\n', 0, (low + high) // 2) + 1
+            if self._line_key(data, start) < key:
+                end = data.find(b'\n', start)
+                low = len(data) if end < 0 else end + 1
+            else:
+                high = start
+        return low
+
+    def _neighbours(self, data, position, first):
+        """ Locations around the position with keys starting with the
+        same character, in index order.
+        """
+
+        half = config.LOCATIONS_FUZZY_CANDIDATES // 2
+        before = []
+        start = position
+        while start > 0 and len(before) < half:
+            start = data.rfind(b'\n', 0, start - 1) + 1
+            if not self._line_key(data, start).startswith(first):
+                break
+            before.append(start)
+
+        neighbours = [self._read_line(data, start)[0]
+                      for start in reversed(before)]
+        start = position
+        while start < len(data) and len(neighbours) < len(before) + half:
+            if not self._line_key(data, start).startswith(first):
+                break
+            entry, start = self._read_line(data, start)
+            neighbours.append(entry)
+        return neighbours
+
+    def search(self, query, limit=config.LOCATIONS_SEARCH_LIMIT):
+        """ Find locations by name.
+
+        Exact matches go first, then names starting with the query. When
+        there are none, the closest of the names around the query which
+        start with its first character are looked up.
+
+        The index file is memory mapped and searched in place, it is not
+        read into memory.
+
+        :param query: location name or its beginning
+        :type query: str
+        :param limit: maximum number of results
+        :type limit: int
+        :rtype: list of Location
+        """
+
+        key = self.normalize(query)
+        with self.path.open('rb') as index_file:
+            if not os.fstat(index_file.fileno()).st_size:
+                return []
+            with mmap.mmap(index_file.fileno(), 0,
+                           access=mmap.ACCESS_READ) as data:
+                return self._search(data, key, limit)
+
+    def _search(self, data, key, limit):
+        """ Find locations by normalized name in the mapped index.
+        """
+
+        encoded = key.encode('utf-8')
+        position = self._bisect(data, encoded)
+        found = []
+        start = position
+        while start < len(data) and len(found) < limit:
+            if not self._line_key(data, start).startswith(encoded):
+                break
+            entry, start = self._read_line(data, start)
+            found.append(entry)
+        if found or not key:
+            return sorted(found, key=lambda entry: entry.key != key)
+
+        neighbours = self._neighbours(data, position,
+                                      key[0].encode('utf-8'))
+        close_keys = difflib.get_close_matches(
+            key, {entry.key for entry in neighbours}, n=limit)
+        rank = {close_key: number
+                for number, close_key in enumerate(close_keys)}
+        found = sorted((entry for entry in neighbours if entry.key in rank),
+                       key=lambda entry: rank[entry.key])
+        return found[:limit]
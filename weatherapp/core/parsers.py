@@ -0,0 +1,67 @@
+""" Helpers for the lxml based parser engine.
+
+Providers precompile their XPath expressions with ``lxml.etree.XPath``
+once on import and run them against the tree from ``parse_html``.
+"""
+from lxml import etree, html
+
+
+def has_class(name):
+    """ XPath predicate matching elements which have given class, the
+    same way as ``class_`` argument of BeautifulSoup ``find`` does.
+
+    :param name: class name
+    :type name: str
+    :rtype: str
+    """
+
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+def parse_html(page_content):
+    """ Build lxml tree of the page.
+
+    :param page_content: page source
+    :type page_content: str
+    :rtype: lxml.html.HtmlElement
+    """
+
+    return html.document_fromstring(page_content)
+
+
+def get_text(elements):
+    """ Text of the first element found by XPath expression, if any.
+
+    :param elements: result of XPath expression
+    :type elements: list
+    :rtype: str
+    """
+
+    return elements[0].text_content() if elements else None
+
+
+class SectionWatcher:
+    """ Incremental parser telling when a section of the page is received.
+
+    Fed with chunks of the page as they arrive, can be used as ``until``
+    callback of the transport to stop the download early.
+
+    :param section_id: id of the element which contains all needed data
+    :type section_id: str
+    """
+
+    def __init__(self, section_id):
+        self.section_id = section_id
+        self.complete = False
+        self._parser = etree.HTMLPullParser(events=('end',),
+                                            encoding='utf-8')
+
+    def __call__(self, chunk):
+        """ Feed the chunk, return True when the section is closed.
+        """
+
+        self._parser.feed(chunk)
+        for event, element in self._parser.read_events():
+            if element.get('id') == self.section_id:
+                self.complete = True
+        return self.complete
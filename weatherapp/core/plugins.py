@@ -0,0 +1,179 @@
+""" Registry of providers, commands and formatters.
+
+Plugins are described by lightweight specs, so their names and titles
+are known without importing the implementing modules. Plugins are
+registered with entry points of the ``weatherapp.providers``,
+``weatherapp.commands`` and ``weatherapp.formatters`` groups, built-in
+ones by this package and the rest by other packages. An entry point may
+refer either to a ``PluginSpec`` or to the plugin class itself.
+Built-in specs are also listed here for source trees which are not
+installed and so have no entry points.
+"""
+import importlib
+import sys
+from collections import namedtuple
+
+PROVIDERS_GROUP = 'weatherapp.providers'
+COMMANDS_GROUP = 'weatherapp.commands'
+FORMATTERS_GROUP = 'weatherapp.formatters'
+DISTRIBUTION = 'weatherapp.core'
+
+
+class PluginSpec(namedtuple('PluginSpec', ['name', 'title', 'target'])):
+    """ Plugin metadata.
+
+    :param name: name the plugin is registered under
+    :type name: str
+    :param title: human readable title
+    :type title: str
+    :param target: plugin class or its ``module:attribute`` path
+    """
+
+    __slots__ = ()
+
+    def load(self):
+        """ Import the plugin class.
+        """
+
+        if not isinstance(self.target, str):
+            return self.target
+        module_name, _, attribute = self.target.partition(':')
+        return getattr(importlib.import_module(module_name), attribute)
+
+    @classmethod
+    def of(cls, name, plugin):
+        """ Spec of the plugin registered as a spec or as a class.
+        """
+
+        if isinstance(plugin, cls):
+            return plugin
+        return cls(name, getattr(plugin, 'title', name), plugin)
+
+
+ACCU_PROVIDER = PluginSpec(
+    'accu', 'AccuWeather',
+    'weatherapp.core.providers.accuweather:AccuWeatherProvider')
+RP5_PROVIDER = PluginSpec('rp5', 'RP5',
+                          'weatherapp.core.providers.rp5:RP5Provider')
+
+COMPARE_COMMAND = PluginSpec(
+    'compare', 'Compare providers on the same locations',
+    'weatherapp.core.commands.compare:Compare')
+CONFIGURATE_COMMAND = PluginSpec(
+    'configurate', 'Select location of a provider',
+    'weatherapp.core.commands.config:Configurate')
+HISTORY_COMMAND = PluginSpec(
+    'history', 'Show recorded readings of a location',
+    'weatherapp.core.commands.history:History')
+LOCATIONS_COMMAND = PluginSpec(
+    'locations', 'Build and search locations index',
+    'weatherapp.core.commands.locations:Locations')
+PROVIDERS_COMMAND = PluginSpec(
+    'providers', 'List providers',
+    'weatherapp.core.commands.providers:Providers')
+SCHEDULE_COMMAND = PluginSpec(
+    'schedule', 'Keep configured locations refreshed',
+    'weatherapp.core.commands.schedule:Schedule')
+SERVE_COMMAND = PluginSpec('serve', 'Run weather daemon',
+                           'weatherapp.core.commands.serve:Serve')
+
+TABLE_FORMATTER = PluginSpec('table', 'Table',
+                             'weatherapp.core.formatters.table:TableFormatter')
+JSON_FORMATTER = PluginSpec(
+    'json', 'JSON array', 'weatherapp.core.formatters.structured:JSONFormatter')
+NDJSON_FORMATTER = PluginSpec(
+    'ndjson', 'JSON object per line',
+    'weatherapp.core.formatters.structured:NDJSONFormatter')
+CSV_FORMATTER = PluginSpec(
+    'csv', 'Comma separated values',
+    'weatherapp.core.formatters.structured:CSVFormatter')
+COMBINED_FORMATTER = PluginSpec(
+    'combined', 'Single table of all locations',
+    'weatherapp.core.formatters.combined:CombinedTableFormatter')
+
+BUILTIN_PLUGINS = {
+    PROVIDERS_GROUP: [ACCU_PROVIDER, RP5_PROVIDER],
+    COMMANDS_GROUP: [COMPARE_COMMAND, CONFIGURATE_COMMAND, HISTORY_COMMAND,
+                     LOCATIONS_COMMAND, PROVIDERS_COMMAND, SCHEDULE_COMMAND,
+                     SERVE_COMMAND],
+    FORMATTERS_GROUP: [TABLE_FORMATTER, JSON_FORMATTER, NDJSON_FORMATTER,
+                       CSV_FORMATTER, COMBINED_FORMATTER],
+}
+
+CACHE_BACKENDS = [
+    PluginSpec('file', 'One file per page',
+               'weatherapp.core.caches.file:FileCache'),
+    PluginSpec('sqlite', 'SQLite database',
+               'weatherapp.core.caches.sqlite:SQLiteCache'),
+    PluginSpec('zlib', 'One compressed file per page',
+               'weatherapp.core.caches.file:ZlibFileCache'),
+]
+
+
+def get_entry_points(group):
+    """ Entry points of installed packages in the group.
+    """
+
+    from importlib import metadata
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        return entry_points.select(group=group)
+    return entry_points.get(group, [])
+
+
+def builtin_plugins(group):
+    """ Specs of plugins registered with entry points of this package.
+
+    Only metadata of this package is read, other installed packages are
+    not scanned. Specs of ``BUILTIN_PLUGINS`` are used when the package
+    is not installed.
+
+    :param group: entry point group
+    :type group: str
+    :rtype: list of PluginSpec
+    """
+
+    from importlib import metadata
+
+    try:
+        distribution = metadata.distribution(DISTRIBUTION)
+    except metadata.PackageNotFoundError:
+        return BUILTIN_PLUGINS[group]
+    return [PluginSpec.of(entry_point.name, entry_point.load())
+            for entry_point in distribution.entry_points
+            if entry_point.group == group]
+
+
+def discover_plugins(group):
+    """ Specs of plugins registered with entry points.
+
+    :param group: entry point group
+    :type group: str
+    :rtype: list of PluginSpec
+    """
+
+    return [PluginSpec.of(entry_point.name, entry_point.load())
+            for entry_point in get_entry_points(group)]
+
+
+def lazy_exports(package, exports):
+    """ Module ``__getattr__`` (PEP 562) of the package which imports
+    exported names from their modules on first access.
+
+    :param package: package name
+    :type package: str
+    :param exports: module names by exported names
+    :type exports: dict
+    """
+
+    def __getattr__(name):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(
+                f'module {package!r} has no attribute {name!r}')
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
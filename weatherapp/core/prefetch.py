@@ -0,0 +1,72 @@
+""" Background prefetch of browse levels during interactive configuration.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from weatherapp.core import config
+
+
+class Prefetcher:
+    """ Loads and parses browse levels while the user is choosing.
+
+    Levels are loaded by a bounded pool of worker threads in the order
+    they were submitted. Pages of levels which were prefetched but not
+    used are removed from the cache.
+
+    :param load: callable which returns parsed level by its url
+    :type load: callable
+    :param cache: application cache storage
+    :type cache: abstract.CacheBackend
+    :param workers: number of worker threads
+    :type workers: int
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, load, cache, workers=config.PREFETCH_WORKERS):
+        self.load = load
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._futures = {}
+
+    def prefetch(self, urls):
+        """ Schedule loading of levels, most likely ones first.
+
+        :param urls: urls of levels
+        :type urls: list
+        """
+
+        for url in urls:
+            if url not in self._futures:
+                self._futures[url] = self._executor.submit(self.load, url)
+
+    def get(self, url):
+        """ Parsed level, waits for its prefetch if it is running.
+        """
+
+        future = self._futures.pop(url, None)
+        if future is None or future.cancel():
+            return self.load(url)
+        return future.result()
+
+    def discard(self):
+        """ Cancel pending prefetches and drop unused levels from cache.
+        """
+
+        for url, future in self._futures.items():
+            if not future.cancel():
+                future.add_done_callback(
+                    lambda future, url=url: self.cache.delete(url))
+        self._futures.clear()
+
+    def close(self):
+        """ Discard unused levels and stop worker threads.
+
+        Running prefetches are not waited for, they finish in background
+        and their levels are removed from cache.
+        """
+
+        # Pending prefetches are cancelled by discard, which keeps this
+        # working without cancel_futures of newer Pythons.
+        self.discard()
+        self._executor.shutdown(wait=False)
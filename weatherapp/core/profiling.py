@@ -0,0 +1,180 @@
+""" Timing of application stages.
+
+Code is instrumented with spans of the profiler owned by the
+application::
+
+    with self.app.profiler.span(self.name, 'fetch') as span:
+        page = self.app.transport.get(url)
+        span.add('fetched bytes', len(page.content))
+
+When profiling is off the application has ``NULL_PROFILER``, whose
+spans are a single shared object doing nothing.
+"""
+import json
+import threading
+import time
+
+
+class NullSpan:
+    """ Span which measures nothing.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def add(self, counter, value=1):
+        """ Increase counter of the span owner.
+        """
+
+
+class NullProfiler:
+    """ Profiler used when profiling is off.
+    """
+
+    enabled = False
+    _span = NullSpan()
+
+    def span(self, owner, stage):
+        """ Measure time of the stage.
+
+        :param owner: who the time is accounted to, e.g. provider name
+        :type owner: str
+        :param stage: stage name
+        :type stage: str
+        :rtype: context manager
+        """
+
+        return self._span
+
+    def count(self, owner, counter, value=1):
+        """ Increase counter of the owner.
+        """
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class Span:
+    """ Measures wall time from entering to leaving the block.
+    """
+
+    __slots__ = ('profiler', 'owner', 'stage', 'started')
+
+    def __init__(self, profiler, owner, stage):
+        self.profiler = profiler
+        self.owner = owner
+        self.stage = stage
+        self.started = None
+
+    def __enter__(self):
+        self.started = self.profiler.clock()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.owner, self.stage,
+                             self.profiler.clock() - self.started)
+        return False
+
+    def add(self, counter, value=1):
+        """ Increase counter of the span owner.
+        """
+
+        self.profiler.count(self.owner, counter, value)
+
+
+class Profiler:
+    """ Collects time of stages and counters by owner.
+
+    :param clock: time source
+    :type clock: callable
+    """
+
+    enabled = True
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self._stages = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def span(self, owner, stage):
+        """ Measure time of the stage.
+
+        :param owner: who the time is accounted to, e.g. provider name
+        :type owner: str
+        :param stage: stage name
+        :type stage: str
+        :rtype: Span
+        """
+
+        return Span(self, owner, stage)
+
+    def record(self, owner, stage, elapsed):
+        """ Account elapsed time of the stage to the owner.
+
+        :param elapsed: stage time (in seconds)
+        :type elapsed: float
+        """
+
+        with self._lock:
+            stats = self._stages.setdefault(owner, {}).setdefault(
+                stage, {'calls': 0, 'total': 0.0, 'max': 0.0})
+            stats['calls'] += 1
+            stats['total'] += elapsed
+            stats['max'] = max(stats['max'], elapsed)
+
+    def count(self, owner, counter, value=1):
+        """ Increase counter of the owner.
+        """
+
+        with self._lock:
+            counters = self._counters.setdefault(owner, {})
+            counters[counter] = counters.get(counter, 0) + value
+
+    def report(self):
+        """ Collected stages and counters.
+
+        :return: ``{owner: {'stages': {stage: {'calls', 'total', 'max'}},
+                 'counters': {counter: value}}}``, times are in seconds
+        :rtype: dict
+        """
+
+        with self._lock:
+            owners = sorted(set(self._stages) | set(self._counters))
+            return {owner: {'stages': {stage: dict(stats) for stage, stats
+                                       in self._stages.get(owner,
+                                                           {}).items()},
+                            'counters': dict(self._counters.get(owner, {}))}
+                    for owner in owners}
+
+    def format_report(self):
+        """ Report as text, one block per owner.
+
+        :rtype: str
+        """
+
+        lines = []
+        for owner, report in self.report().items():
+            lines.append(f'Profile of {owner}:')
+            lines.append(f'  {"stage":<16}{"calls":>7}{"total ms":>12}'
+                         f'{"max ms":>10}')
+            for stage, stats in sorted(report['stages'].items(),
+                                       key=lambda item: -item[1]['total']):
+                lines.append(f'  {stage:<16}{stats["calls"]:>7}'
+                             f'{stats["total"] * 1000:>12.1f}'
+                             f'{stats["max"] * 1000:>10.1f}')
+            for counter, value in sorted(report['counters'].items()):
+                lines.append(f'  {counter:<16}{value:>7}')
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path):
+        """ Save report to the file as JSON.
+        """
+
+        with open(path, 'w', encoding='utf-8') as report_file:
+            json.dump(self.report(), report_file, indent=2)
@@ -1,14 +1,9 @@
 from weatherapp.core import commandmanager
-from weatherapp.core.providers import AccuWeatherProvider, RP5Provider
+from weatherapp.core.plugins import PROVIDERS_GROUP
 
 
 class ProviderManager(commandmanager.CommandManager):
     """ Discovers registered providers and loads them.
     """
 
-    def _load_commands(self):
-        """ Loads all existing providers.
-        """
-
-        for provider in [AccuWeatherProvider, RP5Provider]:
-            self.add(provider.name, provider)
+    group = PROVIDERS_GROUP
@@ -1,2 +1,9 @@
-from weatherapp.core.providers.accuweather import AccuWeatherProvider
-from weatherapp.core.providers.rp5 import RP5Provider
\ No newline at end of file
+from weatherapp.core.plugins import lazy_exports
+
+_EXPORTS = {
+    'AccuWeatherProvider': 'weatherapp.core.providers.accuweather',
+    'RP5Provider': 'weatherapp.core.providers.rp5',
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
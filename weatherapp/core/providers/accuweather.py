@@ -4,12 +4,25 @@ import sys
 from urllib.parse import quote
 
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from weatherapp.core import config
 from weatherapp.core.abstract import WeatherProvider
+from weatherapp.core.parsers import get_text, has_class, parse_html
+from weatherapp.core.prefetch import Prefetcher
 
 logger = logging.getLogger(__name__)
 
+# precompiled expressions of the lxml parser engine
+CURRENT_DAY_URL = etree.XPath(
+    '(//li[contains(@class, "day current first cl") or '
+    'contains(@class, "night current first cl")]//a)[1]/@href')
+DETAIL_NOW = etree.XPath('//div[@id="detail-now"]')
+CONDITION = etree.XPath(f'.//span[{has_class("cond")}]')
+TEMPERATURE = etree.XPath(f'.//span[{has_class("large-temp")}]')
+FEELS_LIKE = etree.XPath(f'.//span[{has_class("small-temp")}]')
+WIND = etree.XPath(f'.//li[{has_class("wind")}]')
+
 
 class AccuWeatherProvider(WeatherProvider):
     """ Weather provider for AccuWeather site.
@@ -28,34 +41,39 @@ class AccuWeatherProvider(WeatherProvider):
 
     def configurate(self):
         """Creating a configuration
+
+        While the user reads the list, next levels of the listed
+        locations are loaded in background.
         """
         provider = self.name
-        locations = self.get_accu_locations(config.ACCU_BROWSE_LOCATIONS)
-        while locations:
-            for index, location in enumerate(locations):
-                self.stdout.write(f'{index + 1}. {location[0]} \n')
-            self.stdout.write('\n')
-            for i in range(3, 0, -1):  # User input validation
-                try:
-                    selected_index = int(input('Please select location: '))
-                    location = locations[selected_index - 1]
-                    break
-                except (IndexError, ValueError) as ex:
-                    self.logger.debug(ex)
-                    self.stdout.write('\nYou entered a wrong location\n'
-                          'Depending on the choice of location enter a number'
-
-                          f' from 1 to {len(locations)}\n\n'
-                          f'You have {i - 1} attempts left.')
-                    if not (i - 1):
-                        self.stdout.write('Attempts have been exhausted,'
-                              'the program will be closed\n\n')
-                        raise SystemExit
-
-            locations = self.get_accu_locations(location[1])
+        prefetcher = Prefetcher(self.get_accu_locations, self.app.cache)
+        try:
+            locations_url = config.ACCU_BROWSE_LOCATIONS
+            locations = self.get_accu_locations(locations_url)
+            while locations:
+                for index, location in enumerate(locations):
+                    self.stdout.write(f'{index + 1}. {location[0]} \n')
+                self.stdout.write('\n')
+                self.prefetch_browse_entries(prefetcher, locations_url,
+                                             locations)
+
+                location = locations[self.select_index(len(locations))]
+                self.remember_browse_choice(locations_url, location[1])
+
+                locations_url = location[1]
+                locations = prefetcher.get(locations_url)
+                prefetcher.discard()
+        finally:
+            prefetcher.close()
 
         self.save_configuration(provider, *location)
 
+    def get_browse_root(self):
+        return config.ACCU_BROWSE_LOCATIONS
+
+    def get_browse_locations(self, url, depth):
+        return self.get_accu_locations(url)
+
     def get_accu_locations(self, locations_url):
         """Getting a list of cities for ACCU provider 
         """
@@ -69,35 +87,175 @@ class AccuWeatherProvider(WeatherProvider):
             locations.append((location, url))
         return locations
 
+    def get_current_day_url_key(self, url):
+        """ Cache key of the current day page url of the location.
+        """
+        return f'current-day-url:{self.name}:{url}'
+
+    def get_cached_current_day_url(self, url):
+        """ Current day page url of the location remembered by previous
+        runs, if any.
+        """
+        if self.app.options.refresh:
+            return None
+        current_day_url = self.app.cache.get(self.get_current_day_url_key(url))
+        return current_day_url.decode('utf-8') if current_day_url else None
+
+    def save_current_day_url(self, url, current_day_url):
+        """ Remember current day page url of the location.
+        """
+        self.app.cache.set(self.get_current_day_url_key(url),
+                           current_day_url.encode('utf-8'),
+                           ttl=config.ACCU_CURRENT_DAY_URL_TIME)
+
+    def forget_current_day_url(self, url, current_day_url):
+        """ Drop remembered current day page url of the location together
+        with the page cached from it.
+        """
+        self.app.cache.delete(self.get_current_day_url_key(url))
+        self.app.cache.delete(current_day_url)
+
+    def refresh_current_day_info(self, url, current_day_url):
+        """ Collect weather info from the current day page, cache and
+        record it.
+        """
+        page = self.get_served_page(current_day_url)
+        page_content = self.get_page_source(current_day_url)
+        with self.app.profiler.span(self.name, 'parse'):
+            weather_info = self.get_current_day_info(page_content)
+        self.save_weather_info(url, weather_info, page)
+        return weather_info
+
+    async def refresh_current_day_info_async(self, url, current_day_url):
+        """ Asynchronous version of ``refresh_current_day_info``.
+        """
+        page = self.get_served_page(current_day_url)
+        page_content = await self.get_page_source_async(current_day_url)
+        with self.app.profiler.span(self.name, 'parse'):
+            weather_info = self.get_current_day_info(page_content)
+        self.save_weather_info(url, weather_info, page)
+        return weather_info
+
+    def refresh_weather_info(self, url):
+        """ Collect weather info of the location and cache it.
+
+        The forecast page is fetched only to find the current day page
+        url, which is remembered for a long time, so warm runs go to
+        the current day page directly. If the remembered page can not
+        be read any more, it is found on the forecast page again.
+        """
+        current_day_url = self.get_cached_current_day_url(url)
+        if current_day_url is not None:
+            try:
+                return self.refresh_current_day_info(url, current_day_url)
+            except Exception:
+                self.logger.debug('Remembered page %s failed',
+                                  current_day_url, exc_info=True)
+                self.forget_current_day_url(url, current_day_url)
+
+        page_content = self.get_page_source(url)
+        with self.app.profiler.span(self.name, 'parse'):
+            current_day_url = self.get_current_day_url(page_content)
+        self.save_current_day_url(url, current_day_url)
+        return self.refresh_current_day_info(url, current_day_url)
+
+    async def refresh_weather_info_async(self, url):
+        """ Asynchronous version of ``refresh_weather_info``.
+        """
+        current_day_url = self.get_cached_current_day_url(url)
+        if current_day_url is not None:
+            try:
+                return await self.refresh_current_day_info_async(
+                    url, current_day_url)
+            except Exception:
+                self.logger.debug('Remembered page %s failed',
+                                  current_day_url, exc_info=True)
+                self.forget_current_day_url(url, current_day_url)
+
+        page_content = await self.get_page_source_async(url)
+        with self.app.profiler.span(self.name, 'parse'):
+            current_day_url = self.get_current_day_url(page_content)
+        self.save_current_day_url(url, current_day_url)
+        return await self.refresh_current_day_info_async(url, current_day_url)
+
     def get_weather_info(self, page_content):
         """ Receiving the current weather data
         """
+        weather_info = {}
+        current_day_url = self.get_current_day_url(page_content)
+        if current_day_url:
+            current_day_page = self.get_page_source(current_day_url)
+            if current_day_page:
+                weather_info = self.get_current_day_info(current_day_page)
+        return weather_info
+
+    async def get_weather_info_async(self, page_content):
+        """ Receiving the current weather data on the event loop
+        """
+        weather_info = {}
+        current_day_url = self.get_current_day_url(page_content)
+        if current_day_url:
+            current_day_page = \
+                await self.get_page_source_async(current_day_url)
+            if current_day_page:
+                weather_info = self.get_current_day_info(current_day_page)
+        return weather_info
+
+    def get_current_day_url(self, page_content):
+        """ Url of the current day page found on the forecast page
+        """
+        if self.get_parser_engine() == 'lxml':
+            return CURRENT_DAY_URL(parse_html(page_content))[0]
+
         city_page = BeautifulSoup(page_content, "lxml")
         current_day_section = city_page.find(
             'li', class_=re.compile('(day|night) current first cl'))
+        return current_day_section.find('a').attrs['href']
+
+    def get_current_day_info(self, page_content):
+        """ Weather data from the current day page
+        """
+        if self.get_parser_engine() == 'lxml':
+            return self._get_current_day_info_lxml(page_content)
+
+        current_day = BeautifulSoup(page_content, "lxml")
+        weather_details = current_day.find('div', attrs={'id': 'detail-now'})
 
         weather_info = {}
-        current_day_url = current_day_section.find('a').attrs['href']
-        if current_day_url:
-            current_day_page = self.get_page_source(current_day_url)
-            if current_day_page:
-                current_day = \
-                    BeautifulSoup(current_day_page, "lxml")
-                weather_details = \
-                    current_day.find('div', attrs={'id': 'detail-now'})
-                condition = weather_details.find('span', class_='cond')
-                if condition:
-                    weather_info['cond'] = condition.text
-                temp = weather_details.find('span', class_='large-temp')
-                if temp:
-                    weather_info['temp'] = temp.text
-                feal_temp = weather_details.find('span', class_='small-temp')
-                if feal_temp:
-                    weather_info['feal_temp'] = feal_temp.text.replace(
-                        'RealFeel® ', '')
-                wind_info = weather_details.find_all('li', class_='wind')
-                if wind_info:
-                    weather_info['wind'] = \
-                        ' '.join(map(lambda t: t.text.strip(), wind_info))
+        condition = weather_details.find('span', class_='cond')
+        if condition:
+            weather_info['cond'] = condition.text
+        temp = weather_details.find('span', class_='large-temp')
+        if temp:
+            weather_info['temp'] = temp.text
+        feels_like = weather_details.find('span', class_='small-temp')
+        if feels_like:
+            weather_info['feels_like'] = feels_like.text.replace(
+                'RealFeel® ', '')
+        wind_info = weather_details.find_all('li', class_='wind')
+        if wind_info:
+            weather_info['wind'] = \
+                ' '.join(map(lambda t: t.text.strip(), wind_info))
         return weather_info
 
+    @staticmethod
+    def _get_current_day_info_lxml(page_content):
+        """ Weather data from the current day page using lxml engine
+        """
+        weather_details = DETAIL_NOW(parse_html(page_content))[0]
+
+        weather_info = {}
+        condition = get_text(CONDITION(weather_details))
+        if condition:
+            weather_info['cond'] = condition
+        temp = get_text(TEMPERATURE(weather_details))
+        if temp:
+            weather_info['temp'] = temp
+        feels_like = get_text(FEELS_LIKE(weather_details))
+        if feels_like:
+            weather_info['feels_like'] = feels_like.replace('RealFeel® ', '')
+        wind_info = WIND(weather_details)
+        if wind_info:
+            weather_info['wind'] = ' '.join(
+                wind.text_content().strip() for wind in wind_info)
+        return weather_info
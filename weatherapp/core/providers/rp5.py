@@ -4,12 +4,23 @@ import sys
 from urllib.parse import quote
 
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from weatherapp.core import config
 from weatherapp.core.abstract import WeatherProvider
+from weatherapp.core.parsers import get_text, has_class, parse_html
+from weatherapp.core.prefetch import Prefetcher
 
 logger = logging.getLogger(__name__)
 
+# precompiled expressions of the lxml parser engine
+ARCHIVE_STRING = etree.XPath('//div[@id="archiveString"]')
+CONDITION = etree.XPath(f'.//span[{has_class("wv_0")}]/preceding::text()[1]')
+TEMPERATURE = etree.XPath(f'.//span[{has_class("t_0")}]')
+FEELS_LIKE = etree.XPath(f'.//div[{has_class("TempStr")}]')
+ARCHIVE_INFO = etree.XPath(f'.//div[{has_class("ArchiveInfo")}]')
+WIND_VELOCITY = etree.XPath(f'.//span[{has_class("wv_1")}]')
+
 
 class RP5Provider(WeatherProvider):
     """ Weather provider for RP5 site.
@@ -17,6 +28,8 @@ class RP5Provider(WeatherProvider):
 
     name = config.RP5_PROVIDER_NAME
     title = config.RP5_PROVIDER_TITLE
+    page_section_id = 'archiveString'
+    browse_depth = 2
 
     def get_name(self):
         return self.name
@@ -29,53 +42,45 @@ class RP5Provider(WeatherProvider):
 
     def configurate(self):
         """Creating a configuration
+
+        While the user reads the list of countries, cities of the
+        listed countries are loaded in background.
         """
 
         provider = self.name
 
         browse_locations = config.RP5_BROWSE_LOCATIONS
-        countries = self.get_rp5_countries(browse_locations)
-        for index, country in enumerate(countries):
-            self.stdout.write(f'{index + 1}. {country[0]} \n')
-        self.stdout.write('\n')
-        for i in range(3, 0, -1):  # User input validation
-            try:
-                selected_index = int(input('Please select location: '))
-                country = countries[selected_index - 1]
-                break
-            except (IndexError, ValueError) as ex:
-                self.logger.debug(ex)
-                self.stdout.write('\nYou entered a wrong location\n'
-                      'Depending on the choice of location enter a number'
-                      f' from 1 to {len(countries)}\n'
-                      f'You have {i - 1} attempts left.\n')
-                if not (i - 1):
-                    self.stdout.write('Attempts have been exhausted,'
-                          'the program will be closed\n')
-                    raise SystemExit
-
-        cities = self.get_rp5_cities(country[1])
+        prefetcher = Prefetcher(self.get_rp5_cities, self.app.cache)
+        try:
+            countries = self.get_rp5_countries(browse_locations)
+            for index, country in enumerate(countries):
+                self.stdout.write(f'{index + 1}. {country[0]} \n')
+            self.stdout.write('\n')
+            self.prefetch_browse_entries(prefetcher, browse_locations,
+                                         countries)
+
+            country = countries[self.select_index(len(countries))]
+            self.remember_browse_choice(browse_locations, country[1])
+            cities = prefetcher.get(country[1])
+        finally:
+            prefetcher.close()
+
         for index, city in enumerate(cities):
             self.stdout.write(f'{index + 1}. {city[0]} \n')
         self.stdout.write('\n')
-        for i in range(3, 0, -1):  # User input validation
-            try:
-                selected_index = int(input('Please select city: '))
-                location = cities[selected_index - 1]
-                break
-            except (IndexError, ValueError) as ex:
-                self.logger.debug(ex)
-                self.stdout.write('\nYou entered a wrong location\n'
-                      'Depending on the choice of location enter a number'
-                      f' from 1 to {len(cities)}\n'
-                      f'You have {i - 1} attempts left.\n')
-                if not (i - 1):
-                    self.stdout.write('Attempts have been exhausted,'
-                          'the program will be closed\n')
-                    raise SystemExit
+        location = cities[self.select_index(len(cities),
+                                            'Please select city: ')]
 
         self.save_configuration(provider, *location)
 
+    def get_browse_root(self):
+        return config.RP5_BROWSE_LOCATIONS
+
+    def get_browse_locations(self, url, depth):
+        if depth == 0:
+            return self.get_rp5_countries(url)
+        return self.get_rp5_cities(url)
+
     def get_rp5_countries(self, locations_url):
         """Getting a list of countries for RP5 provider 
         """
@@ -108,6 +113,9 @@ class RP5Provider(WeatherProvider):
     def get_weather_info(self, page_content):
         """ Receiving the current weather data
         """
+        if self.get_parser_engine() == 'lxml':
+            return self._get_weather_info_lxml(page_content)
+
         city_page = BeautifulSoup(page_content, "lxml")
         current_day_section = city_page.find(
             'div', attrs={'id': 'archiveString'})
@@ -120,9 +128,9 @@ class RP5Provider(WeatherProvider):
         temp = current_day_section.find('span', class_='t_0')
         if temp:
             weather_info_rp5['temp'] = temp.text
-        feal_temp = current_day_section.find('div', class_='TempStr')
-        if feal_temp:
-            weather_info_rp5['feal_temp'] = feal_temp.text
+        feels_like = current_day_section.find('div', class_='TempStr')
+        if feels_like:
+            weather_info_rp5['feels_like'] = feels_like.text
         # TODO: Improve the selection of information in the section "Wind"
         wind_info_section = str(
             current_day_section.find('div',
@@ -135,3 +143,34 @@ class RP5Provider(WeatherProvider):
             weather_info_rp5['wind'] = \
                 'Вітер' + wind_velocity + ', ' + wind_direction
         return weather_info_rp5
+
+    @staticmethod
+    def _get_weather_info_lxml(page_content):
+        """ Receiving the current weather data using lxml engine
+        """
+        current_day_section = ARCHIVE_STRING(parse_html(page_content))[0]
+        weather_info_rp5 = {}
+        condition = CONDITION(current_day_section)
+        if condition:
+            condition = str(condition[0]).split(', ')
+            weather_info_rp5['cond'] = condition[1]
+        temp = get_text(TEMPERATURE(current_day_section))
+        if temp:
+            weather_info_rp5['temp'] = temp
+        feels_like = get_text(FEELS_LIKE(current_day_section))
+        if feels_like:
+            weather_info_rp5['feels_like'] = feels_like
+        wind_info_section = get_text(
+            ARCHIVE_INFO(current_day_section)).split(', ')
+        wind_velocity = get_text(WIND_VELOCITY(current_day_section)).replace(
+            '(', '').replace(')', '')
+        wind_direction = wind_info_section[4]
+        if wind_velocity and wind_direction:
+            weather_info_rp5['wind'] = \
+                'Вітер' + wind_velocity + ', ' + wind_direction
+        return weather_info_rp5
+
+    async def get_weather_info_async(self, page_content):
+        """ Receiving the current weather data on the event loop
+        """
+        return self.get_weather_info(page_content)
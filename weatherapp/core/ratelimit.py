@@ -0,0 +1,107 @@
+""" Politeness limits of requests to weather sites.
+"""
+import threading
+import time
+from urllib.parse import urlsplit
+
+from weatherapp.core import config
+
+
+class TokenBucket:
+    """ Token bucket rate limit.
+
+    Allows bursts of up to ``burst`` requests, then ``rate`` requests
+    per second. Tokens may be reserved ahead, callers are served in
+    order of their reservations.
+
+    :param rate: tokens added per second
+    :type rate: float
+    :param burst: bucket capacity
+    :type burst: int
+    :param clock: monotonic time source
+    :type clock: callable
+    """
+
+    def __init__(self, rate, burst, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """ Take a token.
+
+        :return: how long to wait before the token may be used
+                 (in seconds)
+        :rtype: float
+        """
+
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens +
+                               (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class HostRateLimiter:
+    """ Token buckets of hosts shared by all providers and transports
+    of the application.
+
+    Host limit applies to its subdomains too. Hosts without own limit
+    share the default one, if any.
+
+    :param limits: requests per second and burst size by host
+    :type limits: dict
+    :param default: limit of other hosts, None disables it
+    :type default: tuple
+    """
+
+    def __init__(self, limits=config.HOST_RATE_LIMITS,
+                 default=config.HTTP_RATE_LIMIT):
+        self.limits = limits
+        self.default = default
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def get_limit_key(self, host):
+        """ Host the limit of which applies to the given host.
+        """
+
+        for key in self.limits:
+            if host == key or host.endswith('.' + key):
+                return key
+        return None
+
+    def get_bucket(self, url):
+        """ Token bucket for the host of the url, None if not limited.
+        """
+
+        host = urlsplit(url).hostname or ''
+        key = self.get_limit_key(host)
+        limit = self.limits[key] if key is not None else self.default
+        if limit is None:
+            return None
+
+        key = key or host
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(*limit)
+            return bucket
+
+    def reserve(self, url):
+        """ Take a token for request to the url.
+
+        :return: how long to wait before sending the request
+                 (in seconds)
+        :rtype: float
+        """
+
+        bucket = self.get_bucket(url)
+        return bucket.reserve() if bucket is not None else 0.0
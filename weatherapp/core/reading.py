@@ -0,0 +1,192 @@
+""" Typed weather readings.
+
+Providers extract weather info from pages as text exactly as sites show
+it. ``WeatherReading`` keeps numbers parsed from the text once, so
+aggregation, sorting and storage do not parse strings again, and
+``ReadingBatch`` keeps readings of a run in columns of typed arrays.
+"""
+import math
+import re
+import time
+from array import array
+
+NUMBER = re.compile(r'[-+−]?\d+(?:[.,]\d+)?')
+
+# temperature symbol of the units system
+TEMPERATURE_SYMBOLS = {'metric': '°C', 'imperial': '°F'}
+
+
+def parse_number(text):
+    """ First number in the text, None if there is no number.
+
+    :param text: value as shown on the site, e.g. '+12°' or
+                 'Вітер11 км/год'
+    :type text: str
+    :rtype: float
+    """
+
+    match = NUMBER.search(text or '')
+    if match is None:
+        return None
+    return float(match.group().replace('−', '-').replace(',', '.'))
+
+
+def get_units(weather_info):
+    """ Units system of weather info, 'metric' unless imperial units
+    are shown.
+    """
+
+    if '°F' in (weather_info.get('temp') or '') or \
+            'mph' in (weather_info.get('wind') or ''):
+        return 'imperial'
+    return 'metric'
+
+
+def format_temperature(value, units):
+    """ Temperature with its sign and symbol, e.g. '+12 °C'.
+    """
+
+    sign = '+' if value > 0 else ''
+    return f'{sign}{value:g} {TEMPERATURE_SYMBOLS[units]}'
+
+
+class WeatherReading:
+    """ Weather of a location at a moment.
+
+    :param provider: provider title
+    :param location: location name
+    :param cond: weather condition
+    :param temp: temperature
+    :type temp: float
+    :param feels_like: feels like temperature
+    :type feels_like: float
+    :param wind: wind as shown on the site
+    :param wind_speed: wind speed, km/h or mph depending on units
+    :type wind_speed: float
+    :param units: 'metric' or 'imperial'
+    :param timestamp: time of the reading, seconds since the epoch
+    :type timestamp: float
+    """
+
+    __slots__ = ('provider', 'location', 'cond', 'temp', 'feels_like',
+                 'wind', 'wind_speed', 'units', 'timestamp')
+
+    def __init__(self, provider, location, cond=None, temp=None,
+                 feels_like=None, wind=None, wind_speed=None,
+                 units='metric', timestamp=None):
+        self.provider = provider
+        self.location = location
+        self.cond = cond
+        self.temp = temp
+        self.feels_like = feels_like
+        self.wind = wind
+        self.wind_speed = wind_speed
+        self.units = units
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    @classmethod
+    def from_info(cls, provider, location, weather_info, timestamp=None):
+        """ Reading from weather info collected by provider.
+
+        :param weather_info: weather info in the format of
+                             ``WeatherProvider.get_weather_info``
+        :type weather_info: dict
+        """
+
+        return cls(provider, location,
+                   cond=weather_info.get('cond'),
+                   temp=parse_number(weather_info.get('temp')),
+                   feels_like=parse_number(weather_info.get('feels_like')),
+                   wind=weather_info.get('wind'),
+                   wind_speed=parse_number(weather_info.get('wind')),
+                   units=get_units(weather_info), timestamp=timestamp)
+
+    def as_info(self):
+        """ Weather info for output, fields without values are omitted.
+
+        :rtype: dict
+        """
+
+        info = {}
+        if self.cond:
+            info['cond'] = self.cond
+        if self.temp is not None:
+            info['temp'] = format_temperature(self.temp, self.units)
+        if self.feels_like is not None:
+            info['feels_like'] = format_temperature(self.feels_like,
+                                                    self.units)
+        if self.wind:
+            info['wind'] = self.wind
+        return info
+
+    def __eq__(self, other):
+        if not isinstance(other, WeatherReading):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name)
+                   for name in self.__slots__)
+
+    def __repr__(self):
+        return (f'{type(self).__name__}({self.provider!r}, '
+                f'{self.location!r}, temp={self.temp!r}, '
+                f'feels_like={self.feels_like!r}, '
+                f'wind_speed={self.wind_speed!r}, units={self.units!r})')
+
+
+class ReadingBatch:
+    """ Readings kept column by column.
+
+    Numeric fields are stored in arrays of doubles with NaN for missing
+    values, so a batch of many locations takes a fraction of the memory
+    of reading objects and its columns can be aggregated directly.
+    """
+
+    NUMERIC = ('temp', 'feels_like', 'wind_speed', 'timestamp')
+    TEXT = ('provider', 'location', 'cond', 'wind', 'units')
+
+    def __init__(self, readings=()):
+        self.columns = {name: array('d') for name in self.NUMERIC}
+        self.columns.update((name, []) for name in self.TEXT)
+        self.extend(readings)
+
+    def append(self, reading):
+        """ Add reading to the end of the batch.
+
+        :type reading: WeatherReading
+        """
+
+        for name in self.NUMERIC:
+            value = getattr(reading, name)
+            self.columns[name].append(math.nan if value is None else value)
+        for name in self.TEXT:
+            self.columns[name].append(getattr(reading, name))
+
+    def extend(self, readings):
+        """ Add readings to the end of the batch.
+        """
+
+        for reading in readings:
+            self.append(reading)
+
+    def column(self, name):
+        """ Values of the field of all readings.
+
+        :param name: field name of ``WeatherReading``
+        :type name: str
+        :rtype: array.array or list
+        """
+
+        return self.columns[name]
+
+    def __len__(self):
+        return len(self.columns['timestamp'])
+
+    def __getitem__(self, index):
+        fields = {name: self.columns[name][index] for name in self.TEXT}
+        for name in self.NUMERIC:
+            value = self.columns[name][index]
+            fields[name] = None if math.isnan(value) else value
+        return WeatherReading(**fields)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
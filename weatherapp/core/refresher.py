@@ -0,0 +1,113 @@
+""" Background refresh of stale cache entries.
+"""
+import logging
+import queue
+import threading
+from concurrent.futures import Future, wait
+
+from weatherapp.core import config
+
+
+class BackgroundRefresher:
+    """ Runs cache refresh jobs in worker threads.
+
+    Only one job per key is in flight at a time, repeated submissions of
+    the same key return the running job. Worker threads are daemon
+    threads, so a run which served stale data exits without waiting for
+    its refresh, an unfinished refresh is done again by the next run.
+
+    :param workers: number of worker threads
+    :type workers: int
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, workers=config.REFRESH_WORKERS):
+        self.workers = workers
+        self._jobs = queue.SimpleQueue()
+        self._threads = []
+        self._closed = False
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._local = threading.local()
+
+    def submit(self, key, func, *args):
+        """ Schedule refresh job unless one for the key is running.
+
+        :param key: refreshed cache key
+        :type key: str
+        :param func: callable which refreshes the entry
+        :type func: callable
+        :return: future of the job
+        :rtype: concurrent.futures.Future
+        """
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is None:
+                self.logger.debug('Refreshing %s in background', key)
+                future = Future()
+                self._in_flight[key] = future
+                self._jobs.put((future, key, func, args))
+                # threads are started on first use, most runs refresh
+                # nothing
+                if len(self._threads) < self.workers:
+                    thread = threading.Thread(target=self._work,
+                                              daemon=True)
+                    thread.start()
+                    self._threads.append(thread)
+            return future
+
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, key, func, args = job
+            if future.set_running_or_notify_cancel():
+                future.set_result(self._run(key, func, *args))
+
+    def _run(self, key, func, *args):
+        self._local.active = True
+        try:
+            return func(*args)
+        except Exception:
+            # resources of a closed application are gone, the refresh is
+            # done again by the next run
+            log = self.logger.debug if self._closed else self.logger.warning
+            log('Background refresh of %s failed', key, exc_info=True)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def in_background(self):
+        """ Check if called from refresh job.
+        """
+
+        return getattr(self._local, 'active', False)
+
+    def wait(self):
+        """ Wait until all jobs, including ones scheduled by other jobs,
+        are finished.
+        """
+
+        while True:
+            with self._lock:
+                futures = list(self._in_flight.values())
+            if not futures:
+                return
+            wait(futures)
+
+    def close(self):
+        """ Cancel jobs which have not started and stop worker threads
+        without waiting for running jobs.
+        """
+
+        with self._lock:
+            self._closed = True
+            for key, future in list(self._in_flight.items()):
+                if future.cancel():
+                    del self._in_flight[key]
+            for _ in self._threads:
+                self._jobs.put(None)
+            self._threads = []
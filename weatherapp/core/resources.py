@@ -0,0 +1,133 @@
+""" Resources shared by all providers and commands of the application.
+"""
+import threading
+
+from weatherapp.core.commandmanager import CommandManager
+from weatherapp.core.formattermanager import FormatterManager
+from weatherapp.core.plugins import CACHE_BACKENDS
+from weatherapp.core.providermanager import ProviderManager
+from weatherapp.core.ratelimit import HostRateLimiter
+
+
+class Resources:
+    """ Managers, caches and connections of the application.
+
+    A daemon keeps one instance for all requests, so they stay warm
+    between requests. Resources are created on first use, which may
+    happen in worker threads at the same time, so their creation is
+    locked.
+
+    :param create_cache: callable which creates the page cache storage
+    :type create_cache: callable
+    """
+
+    def __init__(self, create_cache):
+        self.providermanager = ProviderManager()
+        self.commandmanager = CommandManager()
+        self.formatters = FormatterManager()
+        self.cache_backends = {backend.name: backend
+                               for backend in CACHE_BACKENDS}
+        self._create_cache = create_cache
+        self._cache = None
+        self._refresher = None
+        self._transport = None
+        self._rate_limiter = None
+        self._configstore = None
+        self._history = None
+        self._lock = threading.RLock()
+
+    @property
+    def configstore(self):
+        """ Configuration files parsed once for all providers.
+        """
+
+        if self._configstore is None:
+            from weatherapp.core.configstore import ConfigStore
+
+            with self._lock:
+                if self._configstore is None:
+                    self._configstore = ConfigStore()
+        return self._configstore
+
+    @property
+    def rate_limiter(self):
+        """ Per host request limits shared by all transports.
+        """
+
+        if self._rate_limiter is None:
+            with self._lock:
+                if self._rate_limiter is None:
+                    self._rate_limiter = HostRateLimiter()
+        return self._rate_limiter
+
+    @property
+    def transport(self):
+        """ HTTP transport shared by all providers.
+        """
+
+        if self._transport is None:
+            from weatherapp.core.transport import HttpTransport
+
+            with self._lock:
+                if self._transport is None:
+                    self._transport = HttpTransport(
+                        rate_limiter=self.rate_limiter)
+        return self._transport
+
+    @property
+    def cache(self):
+        """ Page cache storage.
+        """
+
+        if self._cache is None:
+            with self._lock:
+                if self._cache is None:
+                    self._cache = self._create_cache()
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache):
+        self._cache = cache
+
+    @property
+    def refresher(self):
+        """ Background refresher of stale cache entries.
+        """
+
+        if self._refresher is None:
+            from weatherapp.core.refresher import BackgroundRefresher
+
+            with self._lock:
+                if self._refresher is None:
+                    self._refresher = BackgroundRefresher()
+        return self._refresher
+
+    @property
+    def history(self):
+        """ Store of readings of all runs.
+        """
+
+        if self._history is None:
+            from weatherapp.core.history import HistoryStore
+
+            with self._lock:
+                if self._history is None:
+                    self._history = HistoryStore()
+        return self._history
+
+    def close(self):
+        """ Release created resources.
+        """
+
+        if self._refresher is not None:
+            self._refresher.close()
+            self._refresher = None
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+        if self._history is not None:
+            self._history.close()
+            self._history = None
@@ -0,0 +1,154 @@
+""" Refresh of configured locations ahead of their cache expiration.
+"""
+import heapq
+import logging
+import random
+import threading
+import time
+
+from weatherapp.core import config
+from weatherapp.core.app import Job
+
+
+class RefreshScheduler:
+    """ Keeps weather info of provider locations in cache up to date.
+
+    Every location is refreshed shortly before its cached weather info
+    expires. Refresh times are spread with random jitter, so locations
+    cached at the same moment are not requested in a burst. Refresh
+    jobs run in the background refresher of the application, requests
+    follow per host limits of its transport.
+
+    :param app: application owning cache, transport and refresher
+    :type app: App
+    :param providers: providers whose locations are refreshed
+    :type providers: list of WeatherProvider
+    :param lead: how long before expiration locations are refreshed
+                 (in seconds)
+    :type lead: float
+    :param jitter: upper bound of random shift of refresh time towards
+                   the past (in seconds)
+    :type jitter: float
+    :param retry: delay before failed refresh is retried (in seconds)
+    :type retry: float
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, app, providers, lead=config.SCHEDULE_LEAD,
+                 jitter=config.SCHEDULE_JITTER,
+                 retry=config.SCHEDULE_RETRY_TIME):
+        self.app = app
+        self.lead = lead
+        self.jitter = jitter
+        self.retry = retry
+        self.jobs = [Job(provider, location, url) for provider in providers
+                     for location, url in provider.locations]
+        for provider in providers:
+            # pages cached together with weather info are due as well
+            provider.refresh_lead = lead + jitter
+
+        self._queue = []
+        self._condition = threading.Condition()
+        self._stopped = False
+        now = time.time()
+        for index in range(len(self.jobs)):
+            self.schedule(index, now)
+
+    def get_expiration(self, job):
+        """ Time cached weather info of the job expires, None if it is
+        not cached.
+        """
+
+        entry = self.app.cache.get_entry(
+            job.provider.get_parsed_cache_key(job.url))
+        if entry is None:
+            return None
+        return entry.fetched + entry.ttl
+
+    def schedule(self, index, now, delay=None):
+        """ Queue next refresh of the job.
+
+        :param index: job index
+        :type index: int
+        :param now: current time (in seconds since epoch)
+        :type now: float
+        :param delay: refresh after this delay instead of before
+                      expiration (in seconds)
+        :type delay: float
+        """
+
+        if delay is not None:
+            due = now + delay + random.uniform(0, self.jitter)
+        else:
+            expiration = self.get_expiration(self.jobs[index])
+            if expiration is None:
+                due = now + random.uniform(0, self.jitter)
+            else:
+                due = expiration - self.lead - random.uniform(0, self.jitter)
+
+        with self._condition:
+            heapq.heappush(self._queue, (due, index))
+            self._condition.notify()
+
+    def get_delay(self, now):
+        """ Seconds left until the closest refresh, None if nothing is
+        queued.
+        """
+
+        if not self._queue:
+            return None
+        return max(0, self._queue[0][0] - now)
+
+    def run_pending(self, now=None):
+        """ Start refresh of all due jobs.
+
+        :return: started refresh jobs
+        :rtype: list of concurrent.futures.Future
+        """
+
+        now = time.time() if now is None else now
+        futures = []
+        with self._condition:
+            while self._queue and self._queue[0][0] <= now:
+                _, index = heapq.heappop(self._queue)
+                futures.append(self.refresh(index))
+        return futures
+
+    def refresh(self, index):
+        """ Refresh the job in background, next refresh is queued when it
+        is finished.
+        """
+
+        job = self.jobs[index]
+        key = 'schedule:' + job.provider.get_parsed_cache_key(job.url)
+        return self.app.refresher.submit(key, self._refresh, index)
+
+    def _refresh(self, index):
+        job = self.jobs[index]
+        self.logger.debug('Scheduled refresh of %s %s', job.provider.name,
+                          job.location)
+        try:
+            weather_info = job.provider.refresh_weather_info(job.url)
+        except Exception:
+            self.schedule(index, time.time(), delay=self.retry)
+            raise
+        self.schedule(index, time.time())
+        return weather_info
+
+    def run(self):
+        """ Refresh jobs as they become due until stopped.
+        """
+
+        with self._condition:
+            while not self._stopped:
+                self.run_pending()
+                self._condition.wait(self.get_delay(time.time()))
+
+    def stop(self):
+        """ Stop ``run`` loop.
+        """
+
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
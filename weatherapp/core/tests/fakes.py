@@ -0,0 +1,29 @@
+""" Stand-in application for unit tests of providers """
+
+import argparse
+from pathlib import Path
+from types import SimpleNamespace
+
+from weatherapp.core.caches import FileCache
+from weatherapp.core.configstore import ConfigStore
+from weatherapp.core.profiling import NULL_PROFILER
+from weatherapp.core.refresher import BackgroundRefresher
+
+
+def create_app(directory, **attributes):
+    """ Application with only the resources providers use.
+
+    :param directory: directory of the page cache
+    :type directory: str
+    :param attributes: attributes to add or replace
+    """
+
+    app = SimpleNamespace(
+        options=argparse.Namespace(refresh=False, stale_window=60),
+        cache=FileCache(Path(directory)),
+        refresher=BackgroundRefresher(),
+        configstore=ConfigStore(),
+        profiler=NULL_PROFILER,
+        record_history=lambda readings: None)
+    vars(app).update(attributes)
+    return app
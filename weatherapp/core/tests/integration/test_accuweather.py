@@ -0,0 +1,115 @@
+""" Integration tests for AccuWeather provider """
+
+import asyncio
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from weatherapp.core.app import App
+from weatherapp.core.providers import AccuWeatherProvider
+from weatherapp.core.tests.server import StubServer
+
+FIXTURES = Path(__file__).parent.parent / 'fixtures'
+ACCU_HOST = b'https://www.accuweather.com'
+ACCU_CURRENT_PATH = '/uk/ua/dnipro/322722/current-weather/322722'
+
+
+class AccuWeatherTestCase(unittest.TestCase):
+
+    """ Test AccuWeather provider against stand-in server.
+    """
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+        self.app = App(stdout=io.StringIO())
+        self.app.options = App._arg_parse().parse_args(['-s', '0'])
+        self.server = StubServer().__enter__()
+        self.server.pages = {
+            '/accu': (FIXTURES / 'accu_forecast.html').read_bytes().replace(
+                ACCU_HOST, self.server.url('').encode()),
+            ACCU_CURRENT_PATH: (FIXTURES / 'accu_current.html').read_bytes(),
+        }
+        self.provider = AccuWeatherProvider(self.app)
+        self.provider.url = self.server.url('/accu')
+
+    def tearDown(self):
+        self.server.__exit__()
+        self.app.close()
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def requested_paths(self):
+        return [path for path, headers, client in self.server.requests]
+
+    def forget_pages(self):
+        """ Drop cached weather info and pages, current day url stays """
+
+        for key in [self.provider.get_parsed_cache_key(self.provider.url),
+                    self.provider.url, self.server.url(ACCU_CURRENT_PATH)]:
+            self.app.cache.delete(key)
+        self.server.requests.clear()
+
+    def test_run(self):
+        """ Test forecast and current day pages are fetched.
+        """
+
+        weather_info = self.provider.run([])
+
+        self.assertEqual(weather_info['temp'], '+12°')
+        self.assertEqual(self.requested_paths(), ['/accu', ACCU_CURRENT_PATH])
+
+    def test_current_day_url_remembered(self):
+        """ Test warm run goes to current day page in one hop.
+        """
+
+        self.provider.run([])
+        self.forget_pages()
+
+        weather_info = self.provider.run([])
+
+        self.assertEqual(weather_info['temp'], '+12°')
+        self.assertEqual(self.requested_paths(), [ACCU_CURRENT_PATH])
+
+    def test_remembered_url_gone(self):
+        """ Test forecast page is used again when remembered page is gone.
+        """
+
+        self.provider.save_current_day_url(self.provider.url,
+                                           self.server.url('/gone'))
+
+        weather_info = self.provider.run([])
+
+        self.assertEqual(weather_info['temp'], '+12°')
+        self.assertEqual(self.requested_paths(),
+                         ['/gone', '/accu', ACCU_CURRENT_PATH])
+        self.forget_pages()
+        self.provider.run([])
+        self.assertEqual(self.requested_paths(), [ACCU_CURRENT_PATH])
+
+    def test_remembered_url_gone_async(self):
+        """ Test asynchronous run falls back to forecast page too.
+        """
+
+        self.provider.save_current_day_url(self.provider.url,
+                                           self.server.url('/gone'))
+
+        async def main():
+            try:
+                return await self.provider.run_async([])
+            finally:
+                await self.app.async_transport.close()
+
+        weather_info = asyncio.run(main())
+
+        self.assertEqual(weather_info['temp'], '+12°')
+        self.assertEqual(self.requested_paths(),
+                         ['/gone', '/accu', ACCU_CURRENT_PATH])
+
+
+if __name__ == '__main__':
+    unittest.main()
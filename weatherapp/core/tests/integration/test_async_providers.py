@@ -0,0 +1,82 @@
+""" Integration tests for asynchronous providers API """
+
+import asyncio
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from weatherapp.core.app import App, Job
+from weatherapp.core.providers import AccuWeatherProvider, RP5Provider
+from weatherapp.core.tests.server import AsyncStubServer
+
+FIXTURES = Path(__file__).parent.parent / 'fixtures'
+ACCU_HOST = 'https://www.accuweather.com'
+ACCU_CURRENT_PATH = '/uk/ua/dnipro/322722/current-weather/322722'
+
+
+class AsyncProvidersTestCase(unittest.TestCase):
+
+    """ Test providers running on the event loop.
+    """
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+        self.stdout = io.StringIO()
+        self.app = App(stdout=self.stdout)
+        self.app.options = App._arg_parse().parse_args(['--async'])
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def run_providers(self, pages, providers):
+        """ Run providers against stand-in server serving given pages.
+        """
+
+        async def main():
+            async with AsyncStubServer() as server:
+                for path, body in pages.items():
+                    server.pages[path] = body.replace(
+                        ACCU_HOST.encode(), server.url('').encode())
+                await self.app.run_concurrently_async(
+                    [Job(provider, provider.location, server.url(path))
+                     for path, provider in providers.items()])
+                return server.requests
+
+        return asyncio.run(main())
+
+    def test_rp5_run_async(self):
+        """ Test RP5 provider fetches and parses page on the event loop.
+        """
+
+        page = (FIXTURES / 'rp5_current.html').read_bytes()
+        self.run_providers({'/rp5': page}, {'/rp5': RP5Provider(self.app)})
+
+        output = self.stdout.getvalue()
+        self.assertIn('+11 °C', output)
+        self.assertIn('хмарно', output)
+
+    def test_accu_run_async(self):
+        """ Test AccuWeather second hop is fetched asynchronously.
+        """
+
+        pages = {
+            '/accu': (FIXTURES / 'accu_forecast.html').read_bytes(),
+            ACCU_CURRENT_PATH: (FIXTURES / 'accu_current.html').read_bytes(),
+        }
+        requests = self.run_providers(
+            pages, {'/accu': AccuWeatherProvider(self.app)})
+
+        self.assertEqual(requests, ['/accu', ACCU_CURRENT_PATH])
+        output = self.stdout.getvalue()
+        self.assertIn('+12°', output)
+        self.assertIn('ПнЗ 11 км/год', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+""" Integration tests for batch run of many locations """
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from weatherapp.core import config
+from weatherapp.core.app import App
+from weatherapp.core.tests.server import StubServer
+
+FIXTURES = Path(__file__).parent.parent / 'fixtures'
+
+
+class BatchTestCase(unittest.TestCase):
+
+    """ Test provider locations are run in one invocation.
+    """
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        self.stdout = io.StringIO()
+
+        self.server = StubServer({
+            '/dnipro': (FIXTURES / 'rp5_current.html').read_bytes(),
+            '/kyiv': (FIXTURES / 'rp5_current_winter.html').read_bytes(),
+        }).__enter__()
+
+    def tearDown(self):
+        self.server.__exit__()
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def write_locations(self, path):
+        Path(path).write_text(
+            '[rp5.locations]\n'
+            f'Dnipro = {self.server.url("/dnipro")}\n'
+            f'Kyiv = {self.server.url("/kyiv")}\n', encoding='utf-8')
+
+    def assert_all_locations(self):
+        output = self.stdout.getvalue()
+        self.assertIn('Dnipro', output)
+        self.assertIn('+11 °C', output)
+        self.assertIn('Kyiv', output)
+        self.assertIn('-3 °C', output)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_locations_file(self):
+        """ Test locations passed with --locations option.
+        """
+
+        self.write_locations('cities.ini')
+        App(stdout=self.stdout).run(['rp5', '--locations', 'cities.ini'])
+
+        self.assert_all_locations()
+
+    def test_configuration_file(self):
+        """ Test locations from configuration file section.
+        """
+
+        self.write_locations(config.CONFIG_FILE)
+        App(stdout=self.stdout).run(['rp5', '--async'])
+
+        self.assert_all_locations()
+
+    def test_ndjson_output(self):
+        """ Test every location is a line of JSON.
+        """
+
+        self.write_locations('cities.ini')
+        App(stdout=self.stdout).run(['rp5', '-l', 'cities.ini',
+                                     '-f', 'ndjson'])
+
+        readings = [json.loads(line)
+                    for line in self.stdout.getvalue().splitlines()]
+        self.assertEqual(sorted((reading['location'], reading['temp'])
+                                for reading in readings),
+                         [('Dnipro', '+11 °C'), ('Kyiv', '-3 °C')])
+
+    def test_combined_output(self):
+        """ Test all locations are rows of one table.
+        """
+
+        self.write_locations('cities.ini')
+        App(stdout=self.stdout).run(['rp5', '-l', 'cities.ini',
+                                     '-f', 'combined'])
+
+        self.assert_all_locations()
+        self.assertEqual(self.stdout.getvalue().count('| Location '), 1)
+
+    def test_compare(self):
+        """ Test providers are compared on the same locations.
+        """
+
+        accu_current = '/uk/ua/dnipro/322722/current-weather/322722'
+        self.server.pages['/accu'] = (
+            FIXTURES / 'accu_forecast.html').read_bytes().replace(
+                b'https://www.accuweather.com', self.server.url('').encode())
+        self.server.pages[accu_current] = (
+            FIXTURES / 'accu_current.html').read_bytes()
+        self.write_locations('cities.ini')
+        with open('cities.ini', 'a', encoding='utf-8') as locations:
+            locations.write(f'[accu.locations]\n'
+                            f'Dnipro = {self.server.url("/accu")}\n')
+
+        App(stdout=self.stdout).run(['compare', 'accu', 'rp5',
+                                     '-l', 'cities.ini'])
+
+        lines = self.stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 6)
+        self.assertRegex(lines[3], r'^\| Dnipro +\| 2 +\| 11\.5 +\| 1\.0 ')
+        self.assertRegex(lines[4], r'^\| Kyiv +\| 1 +\| -3\.0 +\| 0\.0 ')
+
+    def test_history(self):
+        """ Test readings are recorded once, when they are fetched.
+        """
+
+        self.write_locations('cities.ini')
+        for _ in range(2):
+            App(stdout=io.StringIO()).run(['rp5', '-l', 'cities.ini'])
+        App(stdout=self.stdout).run(['history', 'kyiv', '--since', '1h'])
+
+        lines = self.stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertIn('| RP5 ', lines[3])
+        self.assertIn('-3 °C', lines[3])
+
+    def test_unknown_formatter(self):
+        """ Test unknown formatter falls back to table.
+        """
+
+        self.write_locations('cities.ini')
+        with self.assertLogs('weatherapp.core.app', 'ERROR'):
+            App(stdout=self.stdout).run(['rp5', '-l', 'cities.ini',
+                                         '-f', 'yaml'])
+
+        self.assert_all_locations()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+""" Integration tests for the weather daemon and its thin client """
+
+import http.client
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from weatherapp.core import client, config
+from weatherapp.core.app import App
+from weatherapp.core.daemon import WeatherDaemon
+from weatherapp.core.tests.server import StubServer
+
+FIXTURES = Path(__file__).parent.parent / 'fixtures'
+
+
+class DaemonTestCase(unittest.TestCase):
+
+    """ Test requests are answered by a running daemon.
+    """
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+        self.server = StubServer({
+            '/dnipro': (FIXTURES / 'rp5_current.html').read_bytes(),
+        }).__enter__()
+        Path(config.CONFIG_FILE).write_text(
+            '[rp5.locations]\n'
+            f'Dnipro = {self.server.url("/dnipro")}\n', encoding='utf-8')
+
+        self.app = App(stdout=io.StringIO())
+        self.app.options, _ = self.app.arg_parser.parse_known_args([])
+        self.daemon = WeatherDaemon(self.app, port=0)
+        self.daemon.publish(client.get_daemon_file())
+        self.thread = threading.Thread(target=self.daemon.serve_forever,
+                                       args=(0.05,), daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.daemon.shutdown()
+        self.daemon.server_close()
+        self.app.close()
+        self.server.__exit__()
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def request(self, method, path, body=None, token=''):
+        headers = {}
+        if token is not None:
+            headers['Authorization'] = \
+                f'Bearer {token or self.daemon.token}'
+        connection = http.client.HTTPConnection(*self.daemon.server_address)
+        try:
+            connection.request(method, path, body, headers)
+            response = connection.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            connection.close()
+
+    def test_forward(self):
+        """ Test client prints output of command run in the daemon.
+        """
+
+        for _ in range(2):
+            stdout = io.StringIO()
+            self.assertTrue(client.forward(['rp5'], stdout))
+            self.assertIn('+11 °C', stdout.getvalue())
+
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_weather(self):
+        """ Test readings of provider locations as JSON.
+        """
+
+        status, payload = self.request('GET', '/weather/rp5')
+
+        self.assertEqual(status, 200)
+        reading, = payload['readings']
+        self.assertEqual(reading['location'], 'Dnipro')
+        self.assertEqual(reading['data']['temp'], '+11 °C')
+
+    def test_unknown_provider(self):
+        """ Test unknown provider is not found.
+        """
+
+        status, _ = self.request('GET', '/weather/unknown')
+        self.assertEqual(status, 404)
+
+    def test_bad_request(self):
+        """ Test run request without argv is rejected.
+        """
+
+        status, _ = self.request('POST', '/run', '{}')
+        self.assertEqual(status, 400)
+
+    def test_unauthorized(self):
+        """ Test requests without the token of the daemon are rejected.
+        """
+
+        status, _ = self.request('GET', '/weather/rp5', token='guess')
+        self.assertEqual(status, 401)
+        status, _ = self.request('POST', '/run', '{"argv": ["rp5"]}',
+                                 token=None)
+        self.assertEqual(status, 401)
+        self.assertEqual(client.get_daemon_file().stat().st_mode & 0o777,
+                         0o600)
+
+    def test_file_options_run_locally(self):
+        """ Test daemon does not read or write files given in options.
+        """
+
+        for argv in (['rp5', '--profile-json', 'profile.json'],
+                     ['-l', 'cities.ini'], ['--locations=cities.ini'],
+                     ['--prof=profile.json']):
+            with self.subTest(argv=argv):
+                status, _ = self.request('POST', '/run',
+                                         json.dumps({'argv': argv}))
+                self.assertEqual(status, 403)
+                self.assertFalse(client.forward(argv, io.StringIO()))
+        self.assertFalse(os.path.exists('profile.json'))
+
+    def test_run_locally(self):
+        """ Test commands which are not forwarded to the daemon.
+        """
+
+        stdout = io.StringIO()
+        self.assertFalse(client.forward(['rp5', '--local'], stdout))
+        self.assertFalse(client.forward(['configurate', 'rp5'], stdout))
+        self.assertEqual(stdout.getvalue(), '')
+
+    def test_no_daemon(self):
+        """ Test client falls back when daemon file is gone.
+        """
+
+        self.daemon.server_close()
+
+        self.assertFalse(client.get_daemon_file().exists())
+        self.assertFalse(client.forward(['rp5'], io.StringIO()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+""" Integration tests for locations index commands """
+
+import configparser
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from weatherapp.core import config
+from weatherapp.core.app import App
+from weatherapp.core.tests.server import StubServer
+
+
+def browse_page(server, *entries):
+    """ AccuWeather browse level page with given (name, path) entries.
+    """
+
+    items = ''.join(f'<li class="drilldown cl"><a href="{server.url(path)}">'
+                    f'<em>{name}</em></a></li>' for name, path in entries)
+    return f'<html><body><ul>{items}</ul></body></html>'.encode('utf-8')
+
+
+class LocationsTestCase(unittest.TestCase):
+
+    """ Test locations index build and lookup.
+    """
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        self.stdout = io.StringIO()
+
+        self.server = StubServer().__enter__()
+        server = self.server
+        self.server.pages = {
+            '/browse': browse_page(server, ('Ukraine', '/ua'),
+                                   ('Poland', '/pl')),
+            '/ua': browse_page(server, ('Dnipro', '/dnipro'),
+                               ('Kyiv', '/kyiv')),
+            '/pl': browse_page(server, ('Krakow', '/krakow')),
+            '/dnipro': b'<html><body>forecast</body></html>',
+            '/kyiv': b'<html><body>forecast</body></html>',
+            '/krakow': b'<html><body>forecast</body></html>',
+        }
+        self.browse_locations = config.ACCU_BROWSE_LOCATIONS
+        config.ACCU_BROWSE_LOCATIONS = self.server.url('/browse')
+
+    def tearDown(self):
+        config.ACCU_BROWSE_LOCATIONS = self.browse_locations
+        self.server.__exit__()
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def run_app(self, *argv):
+        App(stdout=self.stdout).run(list(argv))
+        return self.stdout.getvalue()
+
+    def test_build_and_search(self):
+        """ Test index is built by crawling the browse tree once.
+        """
+
+        output = self.run_app('locations', 'build', 'accu')
+        self.assertIn('3 locations of AccuWeather are indexed', output)
+
+        self.server.requests.clear()
+        output = self.run_app('locations', 'search', 'accu', 'kr')
+        self.assertIn(f'Krakow (Poland): {self.server.url("/krakow")}',
+                      output)
+        self.assertEqual(self.server.requests, [])
+
+    def test_configurate_by_name(self):
+        """ Test configuration by name does not need network.
+        """
+
+        self.run_app('locations', 'build', 'accu')
+        self.server.requests.clear()
+        self.run_app('configurate', 'accu', '--name', 'dnipro')
+
+        parser = configparser.ConfigParser()
+        parser.read(config.CONFIG_FILE)
+        self.assertEqual(dict(parser['accu']),
+                         {'name': 'Dnipro', 'url': self.server.url('/dnipro')})
+        self.assertEqual(self.server.requests, [])
+
+    def test_configurate_prefetch(self):
+        """ Test next levels are prefetched during interactive configuration.
+        """
+
+        with mock.patch('builtins.input', side_effect=['2', '1']):
+            self.run_app('configurate', 'accu')
+
+        parser = configparser.ConfigParser()
+        parser.read(config.CONFIG_FILE)
+        self.assertEqual(parser['accu']['name'], 'Krakow')
+
+        paths = [path for path, headers, client in self.server.requests]
+        self.assertIn('/ua', paths)
+        self.assertEqual(paths.count('/pl'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
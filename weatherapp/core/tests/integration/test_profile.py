@@ -0,0 +1,81 @@
+""" Integration tests for --profile option """
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from weatherapp.core import config
+from weatherapp.core.app import App
+from weatherapp.core.tests.server import StubServer
+
+FIXTURES = Path(__file__).parent.parent / 'fixtures'
+
+
+class ProfileTestCase(unittest.TestCase):
+
+    """ Test per provider breakdown of run time.
+    """
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        self.stdout = io.StringIO()
+        self.stderr = io.StringIO()
+
+        self.server = StubServer({
+            '/dnipro': (FIXTURES / 'rp5_current.html').read_bytes(),
+        }).__enter__()
+        Path(config.CONFIG_FILE).write_text(
+            f'[rp5]\nname = Dnipro\nurl = {self.server.url("/dnipro")}\n',
+            encoding='utf-8')
+
+    def tearDown(self):
+        self.server.__exit__()
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def run_app(self, *argv):
+        App(stdout=self.stdout, stderr=self.stderr).run(list(argv))
+
+    def test_profile(self):
+        """ Test breakdown is printed and saved.
+        """
+
+        self.run_app('rp5', '--profile', '--profile-json', 'profile.json')
+
+        self.assertIn('+11 °C', self.stdout.getvalue())
+        self.assertIn('Profile of rp5:', self.stderr.getvalue())
+
+        report = json.loads(Path('profile.json').read_text())['rp5']
+        self.assertEqual(set(report['stages']),
+                         {'run', 'cache read', 'fetch', 'cache write',
+                          'parse', 'output'})
+        self.assertEqual(report['counters']['cache misses'], 1)
+        self.assertGreater(report['counters']['fetched bytes'], 0)
+
+    def test_warm_profile(self):
+        """ Test cached run is accounted as parsed cache hit.
+        """
+
+        self.run_app('rp5')
+        self.run_app('rp5', '--profile-json', 'profile.json')
+
+        report = json.loads(Path('profile.json').read_text())['rp5']
+        self.assertEqual(report['counters'], {'parsed hits': 1})
+        self.assertEqual(self.stderr.getvalue(), '')
+
+    def test_disabled(self):
+        """ Test nothing is reported without the option.
+        """
+
+        self.run_app('rp5')
+
+        self.assertEqual(self.stderr.getvalue(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+""" Integration tests for conditional revalidation of cached pages """
+
+import io
+import os
+import tempfile
+import unittest
+
+from weatherapp.core.app import App
+from weatherapp.core.providers import RP5Provider
+from weatherapp.core.tests.server import StubServer
+
+
+class RevalidationTestCase(unittest.TestCase):
+
+    """ Test expired pages are revalidated with conditional requests.
+    """
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+        self.app = App(stdout=io.StringIO())
+        self.app.options = App._arg_parse().parse_args(['-s', '0'])
+        self.provider = RP5Provider(self.app)
+
+    def tearDown(self):
+        self.app.close()
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def expire(self, url):
+        """ Make cached page expired keeping its validators.
+        """
+
+        entry = self.app.cache.get_entry(url)
+        self.app.cache.set(url, entry.value, ttl=0, headers=entry.headers)
+
+    def test_not_modified(self):
+        """ Test 304 response renews expired cache entry.
+        """
+
+        with StubServer({'/': b'page'}, etags={'/': '"v1"'}) as server:
+            url = server.url()
+            self.assertEqual(self.provider.get_page_source(url), 'page')
+            self.assertEqual(self.app.cache.get_entry(url).headers,
+                             {'ETag': '"v1"'})
+
+            self.expire(url)
+            self.assertEqual(self.provider.get_page_source(url), 'page')
+
+        request_headers = server.requests[1][1]
+        self.assertEqual(request_headers['If-None-Match'], '"v1"')
+        self.assertTrue(self.app.cache.get_entry(url).is_valid())
+
+    def test_modified(self):
+        """ Test changed page replaces expired cache entry.
+        """
+
+        with StubServer({'/': b'page'}, etags={'/': '"v1"'}) as server:
+            url = server.url()
+            self.provider.get_page_source(url)
+
+            self.expire(url)
+            server.pages['/'], server.etags['/'] = b'new page', '"v2"'
+            self.assertEqual(self.provider.get_page_source(url), 'new page')
+
+        self.assertEqual(self.app.cache.get_entry(url).headers,
+                         {'ETag': '"v2"'})
+
+    def test_refresh_is_unconditional(self):
+        """ Test --refresh always downloads the whole page.
+        """
+
+        self.app.options.refresh = True
+        with StubServer({'/': b'page'}, etags={'/': '"v1"'}) as server:
+            self.provider.get_page_source(server.url())
+            self.provider.get_page_source(server.url())
+
+        self.assertNotIn('If-None-Match', server.requests[1][1])
+
+    def test_refresh_lead(self):
+        """ Test page about to expire is revalidated ahead of time.
+        """
+
+        self.provider.refresh_lead = 600
+        with StubServer({'/': b'page'}, etags={'/': '"v1"'}) as server:
+            url = server.url()
+            self.provider.get_page_source(url)
+            self.provider.get_page_source(url)
+
+        self.assertEqual(server.requests[1][1]['If-None-Match'], '"v1"')
+
+
+if __name__ == '__main__':
+    unittest.main()
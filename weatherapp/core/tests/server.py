@@ -0,0 +1,138 @@
+""" Local HTTP stand-in for weather sites used in tests """
+
+import asyncio
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """ Serves pages registered in the server by path """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, dict(self.headers),
+                                self.client_address))
+        time.sleep(server.delay)
+
+        body = server.pages.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        etag = server.etags.get(self.path)
+        if etag and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        if etag:
+            self.send_header('ETag', etag)
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """ Keep test output clean """
+
+
+class StubServer(ThreadingHTTPServer):
+    """ HTTP server running in a background thread.
+
+    :param pages: page bodies by request path
+    :type pages: dict
+    :param delay: time to sleep before every response (in seconds)
+    :type delay: float
+    :param etags: page validators by request path, matching conditional
+                  requests get 304 Not Modified
+    :type etags: dict
+    """
+
+    daemon_threads = True
+
+    def __init__(self, pages=None, delay=0, etags=None,
+                 handler=StubRequestHandler):
+        super().__init__(('127.0.0.1', 0), handler)
+        self.pages = pages or {}
+        self.etags = etags or {}
+        self.delay = delay
+        self.requests = []
+        self._thread = threading.Thread(target=self.serve_forever,
+                                        daemon=True)
+
+    def url(self, path='/'):
+        """ Absolute URL of the path on this server """
+
+        host, port = self.server_address
+        return f'http://{host}:{port}{path}'
+
+    def handle_error(self, request, client_address):
+        """ Clients which gave up on the response are expected """
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+class AsyncStubServer:
+    """ HTTP stand-in running on the event loop of the test.
+
+    :param pages: page bodies by request path
+    :type pages: dict
+    """
+
+    def __init__(self, pages=None):
+        self.pages = pages or {}
+        self.requests = []
+        self._server = None
+
+    def url(self, path='/'):
+        """ Absolute URL of the path on this server """
+
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f'http://{host}:{port}{path}'
+
+    async def handle(self, reader, writer):
+        """ Serve keep-alive connection until client closes it """
+
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            path = request_line.decode('latin-1').split(' ')[1]
+            while (await reader.readline()) not in (b'\r\n', b''):
+                pass
+            self.requests.append(path)
+
+            body = self.pages.get(path)
+            status = '200 OK' if body is not None else '404 Not Found'
+            body = body or b''
+            writer.write(f'HTTP/1.1 {status}\r\n'
+                         'Content-Type: text/html; charset=utf-8\r\n'
+                         f'Content-Length: {len(body)}\r\n\r\n'
+                         .encode('latin-1') + body)
+            await writer.drain()
+        writer.close()
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._server.close()
+        await self._server.wait_closed()
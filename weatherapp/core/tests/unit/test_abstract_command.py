@@ -1,6 +1,8 @@
 """ Unit tests for abstract command class """
 
 import argparse
+import asyncio
+import threading
 import unittest
 
 from weatherapp.core.abstract import Command
@@ -15,6 +17,16 @@ class AbstractCommandTestCase(unittest.TestCase):
         self.parser = Command.get_parser()
         self.assertIsInstance(self.parser, argparse.ArgumentParser)
 
+    def test_run_async(self):
+        """Test synchronous command is run in executor by run_async"""
+
+        class SyncCommand(Command):
+            def run(self, argv):
+                return argv, threading.current_thread()
+
+        argv, thread = asyncio.run(SyncCommand(None).run_async(['any']))
+        self.assertEqual(argv, ['any'])
+        self.assertIsNot(thread, threading.current_thread())
 
 
 
@@ -1,8 +1,52 @@
 """ Unit tests for abstract provider class """
 
+import argparse
+import os
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
+from types import SimpleNamespace
 
 from weatherapp.core.abstract import WeatherProvider
+from weatherapp.core.configstore import ConfigStore
+from weatherapp.core.tests.fakes import create_app
+
+
+class DummyProvider(WeatherProvider):
+    """Provider which counts pages fetched and parsed"""
+
+    name = title = 'dummy'
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.fetched = self.parsed = 0
+
+    def get_name(self):
+        return self.name
+
+    def get_default_location(self):
+        return 'Dnipro'
+
+    def get_default_url(self):
+        return 'http://dummy/dnipro'
+
+    def configurate(self):
+        pass
+
+    def get_page_source(self, url, section_id=None):
+        self.fetched += 1
+        return '+12°'
+
+    def get_weather_info(self, content):
+        self.parsed += 1
+        return {'temp': content}
+
+
+class CachedPageProvider(DummyProvider):
+    """Provider which reads its page through the page cache"""
+
+    get_page_source = WeatherProvider.get_page_source
 
 
 class AbstractProviderTestCase(unittest.TestCase):
@@ -16,6 +60,15 @@ class AbstractProviderTestCase(unittest.TestCase):
         self.assertEqual(self.headers, 
             {'User-Agent': 'Mozilla/5.0 (X11; Ubuntu; Linux x86_64)'})
         self.assertNotEqual(self.headers, {'User-Agent': 'Any'})
+    def test_no_browse_tree(self):
+        """ Test provider without browse tree has no locations to crawl """
+
+        provider = DummyProvider(SimpleNamespace(
+            configstore=ConfigStore(), options=argparse.Namespace()))
+
+        self.assertIsNone(provider.get_browse_root())
+        self.assertEqual(list(provider.crawl_locations()), [])
+
     def test_get_configuration_file(self):
         """ Test getting the path to the configuration file """
 
@@ -24,5 +77,138 @@ class AbstractProviderTestCase(unittest.TestCase):
 
 
 
+class ParsedCacheTestCase(unittest.TestCase):
+    """Unit test case for parsed weather info cache tier"""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        self.recorded = []
+        self.app = create_app(self.tmp_dir.name,
+                              record_history=self.recorded.extend)
+
+    def tearDown(self):
+        self.app.refresher.close()
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def test_warm_run_does_not_parse(self):
+        """Test second run is served from parsed cache"""
+
+        DummyProvider(self.app).run([])
+        provider = DummyProvider(self.app)
+
+        self.assertEqual(provider.run([]), {'temp': '+12°'})
+        self.assertEqual((provider.fetched, provider.parsed), (0, 0))
+        self.assertEqual(len(self.recorded), 1)
+
+    def test_refresh(self):
+        """Test --refresh bypasses parsed cache"""
+
+        DummyProvider(self.app).run([])
+        self.app.options.refresh = True
+        provider = DummyProvider(self.app)
+        provider.run([])
+
+        self.assertEqual((provider.fetched, provider.parsed), (1, 1))
+
+    def expire(self, provider):
+        """Make cached weather info expired"""
+
+        key = provider.get_parsed_cache_key(provider.url)
+        entry = self.app.cache.get_entry(key)
+        self.app.cache.set(key, entry.value, ttl=0)
+
+    def test_stale_while_revalidate(self):
+        """Test stale weather info is served and refreshed in background"""
+
+        provider = DummyProvider(self.app)
+        provider.run([])
+        self.expire(provider)
+
+        self.assertEqual(provider.run([]), {'temp': '+12°'})
+        self.app.refresher.wait()
+        self.assertEqual(provider.parsed, 2)
+        key = provider.get_parsed_cache_key(provider.url)
+        self.assertTrue(self.app.cache.get_entry(key).is_valid())
+
+    def test_stale_page_parsed_info_expired(self):
+        """Test info parsed from stale page expires with the page"""
+
+        provider = CachedPageProvider(self.app)
+        self.app.cache.set(provider.url, '+12°'.encode('utf-8'), ttl=-30)
+
+        self.assertEqual(provider.refresh_weather_info(provider.url),
+                         {'temp': '+12°'})
+        key = provider.get_parsed_cache_key(provider.url)
+        entry = self.app.cache.get_entry(key)
+        self.assertFalse(entry.is_valid())
+        self.assertTrue(entry.is_valid(self.app.options.stale_window))
+
+    def test_fresh_page_parsed_info_expiration(self):
+        """Test info parsed from cached page expires with the page"""
+
+        provider = CachedPageProvider(self.app)
+        self.app.cache.set(provider.url, '+12°'.encode('utf-8'), ttl=100)
+        provider.refresh_weather_info(provider.url)
+
+        key = provider.get_parsed_cache_key(provider.url)
+        entry = self.app.cache.get_entry(key)
+        page = self.app.cache.get_entry(provider.url)
+        self.assertAlmostEqual(entry.fetched + entry.ttl, page.fetched + 100,
+                               places=3)
+
+    def test_recorded_with_page_time(self):
+        """Test info parsed from cached page is recorded with page time"""
+
+        provider = CachedPageProvider(self.app)
+        self.app.cache.set(provider.url, '+12°'.encode('utf-8'), ttl=100)
+        provider.refresh_weather_info(provider.url)
+
+        reading, = self.recorded
+        self.assertEqual((reading.provider, reading.location, reading.temp),
+                         ('dummy', 'Dnipro', 12))
+        self.assertEqual(reading.timestamp,
+                         self.app.cache.get_entry(provider.url).fetched)
+
+    def test_stale_window_disabled(self):
+        """Test expired weather info is refreshed synchronously"""
+
+        self.app.options.stale_window = 0
+        provider = DummyProvider(self.app)
+        provider.run([])
+        self.expire(provider)
+        provider.run([])
+
+        self.assertEqual(provider.parsed, 2)
+        self.assertFalse(self.app.refresher._in_flight)
+
+    def test_parser_version_in_key(self):
+        """Test cache key depends on parser code version"""
+
+        provider = DummyProvider(self.app)
+        key = provider.get_parsed_cache_key(provider.url)
+
+        self.assertTrue(key.endswith(DummyProvider.get_parser_version()))
+        self.assertNotEqual(DummyProvider.get_parser_version(),
+                            WeatherProvider.get_parser_version())
+
+    def test_parser_version_of_helpers(self):
+        """Test parser version depends on shared parsing helpers"""
+
+        read_files = []
+        read_bytes = Path.read_bytes
+
+        def record_read(path):
+            read_files.append(path.name)
+            return read_bytes(path)
+
+        with mock.patch.object(Path, 'read_bytes', record_read):
+            DummyProvider.get_parser_version.__wrapped__(DummyProvider)
+
+        self.assertIn('parsers.py', read_files)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,11 @@
 """ Unit tests for App class """
 
-import unittest
 import argparse
+import io
+import threading
+import unittest
 
-from weatherapp.core.app import App
+from weatherapp.core.app import App, Job
 
 
 class AppTestCase(unittest.TestCase):
@@ -29,6 +31,20 @@ class AppTestCase(unittest.TestCase):
         self.assertFalse(parsed_args.debug)
         self.assertEqual(parsed_args.formatter, 'table')
 
+    def test_get_providers(self):
+        """ Test providers are created by their names.
+        """
+
+        app = App(stdout=io.StringIO())
+        app.options = self.parser.parse_args([])
+
+        self.assertEqual([provider.name for provider
+                          in app.get_providers(['rp5'])], ['rp5'])
+        self.assertEqual(sorted(provider.name for provider
+                                in app.get_providers()), ['accu', 'rp5'])
+        with self.assertRaises(ValueError):
+            app.get_providers(['unknown'])
+
     def test_arg_parser_arg(self):
         """ Test application argument parser.
         """
@@ -43,5 +59,88 @@ class AppTestCase(unittest.TestCase):
         self.assertEqual(parsed_args.verbose_level, 1)
 
 
+class FakeProvider:
+    """ Provider stand-in which returns fixed data after a delay.
+    """
+
+    def __init__(self, name, delay=0, error=False):
+        self.name = self.title = self.location = name
+        self.locations = [(name, None)]
+        self.delay = delay
+        self.error = error
+        self.released = threading.Event()
+
+    def run_location(self, url):
+        self.released.wait(self.delay)
+        if self.error:
+            raise RuntimeError(self.name)
+        return {'temp': self.name}
+
+
+def jobs(*providers):
+    """ Jobs running default location of every provider.
+    """
+
+    return [Job(provider, provider.location, None) for provider in providers]
+
+
+class AppRunConcurrentlyTestCase(unittest.TestCase):
+
+    """ Test concurrent providers execution.
+    """
+
+    def setUp(self):
+        self.stdout = io.StringIO()
+        self.app = App(stdout=self.stdout)
+        self.app.options = App._arg_parse().parse_args(['-t', '0.2'])
+
+    def test_results_printed_in_completion_order(self):
+        """ Fast provider output is not blocked by a slow one.
+        """
+
+        slow, fast = FakeProvider('slow', delay=0.1), FakeProvider('fast')
+        self.app.run_concurrently(jobs(slow, fast))
+
+        output = self.stdout.getvalue()
+        self.assertIn('slow', output)
+        self.assertLess(output.index('fast'), output.index('slow'))
+
+    def test_deadline(self):
+        """ Provider which misses its deadline is skipped.
+        """
+
+        hung, fast = FakeProvider('hung', delay=5), FakeProvider('fast')
+        with self.assertLogs('weatherapp.core.app', level='ERROR'):
+            self.app.run_concurrently(jobs(hung, fast))
+        hung.released.set()
+
+        output = self.stdout.getvalue()
+        self.assertIn('fast', output)
+        self.assertNotIn('hung', output)
+
+    def test_provider_error(self):
+        """ Failing provider does not stop the others.
+        """
+
+        broken, fast = FakeProvider('broken', error=True), FakeProvider('fast')
+        with self.assertLogs('weatherapp.core.app', level='ERROR'):
+            self.app.run_concurrently(jobs(broken, fast))
+
+        self.assertIn('fast', self.stdout.getvalue())
+
+    def test_collect_readings(self):
+        """ Readings are kept only while they are collected.
+        """
+
+        batch = self.app.collect_readings([FakeProvider('one')])
+        self.app.run_concurrently(jobs(FakeProvider('two')))
+        later = self.app.collect_readings([FakeProvider('three')])
+
+        self.assertEqual(batch.column('location'), ['one'])
+        self.assertEqual(later.column('location'), ['three'])
+        self.assertNotIn('one', self.stdout.getvalue())
+        self.assertIn('two', self.stdout.getvalue())
+
+
 if __name__ == '__main__':
     unittest.main()
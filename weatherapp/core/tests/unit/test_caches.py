@@ -0,0 +1,211 @@
+""" Unit tests for cache backends """
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from weatherapp.core.caches import (FileCache, MemoryCache, SQLiteCache,
+                                    ZlibFileCache)
+
+
+class CacheBackendTestMixin:
+    """Common behaviour of all cache backends"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = self.create_cache(Path(self.tmp_dir.name))
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp_dir.cleanup()
+
+    def test_get_missing(self):
+        """Test missing entry"""
+
+        self.assertIsNone(self.cache.get('http://any'))
+
+    def test_set_get(self):
+        """Test stored entry is returned"""
+
+        self.cache.set('http://any', b'page')
+        self.assertEqual(self.cache.get('http://any'), b'page')
+
+    def test_expired(self):
+        """Test expired entry is not returned and purged"""
+
+        self.cache.set('http://any', b'page', ttl=0)
+        self.assertIsNone(self.cache.get('http://any'))
+
+        self.cache.flush()
+        self.cache.purge()
+        self.cache.set('http://any', b'page', ttl=60)
+        self.assertEqual(self.cache.get('http://any'), b'page')
+
+    def test_expired_entry(self):
+        """Test expired entry is available with its metadata"""
+
+        self.cache.set('http://any', b'page', ttl=0, headers={'ETag': '"1"'})
+        entry = self.cache.get_entry('http://any')
+
+        self.assertEqual(entry.value, b'page')
+        self.assertEqual(entry.headers, {'ETag': '"1"'})
+        self.assertFalse(entry.is_valid())
+
+    def test_retention(self):
+        """Test expired entry is kept for retention time"""
+
+        self.cache.retention = 60
+        self.cache.set('http://any', b'page', ttl=0)
+        self.cache.flush()
+        self.cache.purge()
+
+        self.assertIsNotNone(self.cache.get_entry('http://any'))
+
+    def test_delete(self):
+        """Test entry removal"""
+
+        self.cache.set('http://any', b'page')
+        self.cache.delete('http://any')
+        self.assertIsNone(self.cache.get('http://any'))
+
+
+class FileCacheTestCase(CacheBackendTestMixin, unittest.TestCase):
+    """Unit test case for file cache backend"""
+
+    def create_cache(self, path):
+        return FileCache(path / 'cache', retention=0)
+
+    def test_purge(self):
+        """Test purge removes expired files only"""
+
+        self.cache.set('http://old', b'page', ttl=0)
+        self.cache.set('http://new', b'page')
+        self.cache.purge()
+
+        self.assertEqual(list(self.cache.directory.iterdir()),
+                         [self.cache.get_path('http://new')])
+
+
+class ZlibFileCacheTestCase(CacheBackendTestMixin, unittest.TestCase):
+    """Unit test case for compressed file cache backend"""
+
+    def create_cache(self, path):
+        return ZlibFileCache(path / 'cache', retention=0)
+
+    def test_compressed(self):
+        """Test value is stored compressed"""
+
+        page = b'<html>' + b'<p>weather</p>' * 1000 + b'</html>'
+        self.cache.set('http://any', page)
+
+        path = self.cache.get_path('http://any')
+        self.assertLess(path.stat().st_size, len(page) / 10)
+        self.assertEqual(self.cache.get('http://any'), page)
+
+    def test_read_by_file_cache(self):
+        """Test files of both storages are read by each other"""
+
+        plain_cache = FileCache(self.cache.directory)
+        plain_cache.set('http://plain', b'plain page')
+        self.cache.set('http://compressed', b'compressed page')
+
+        self.assertEqual(self.cache.get('http://plain'), b'plain page')
+        self.assertEqual(plain_cache.get('http://compressed'),
+                         b'compressed page')
+
+    def test_corrupted(self):
+        """Test damaged file is a miss"""
+
+        self.cache.set('http://any', b'page')
+        path = self.cache.get_path('http://any')
+        path.write_bytes(path.read_bytes()[:-4])
+
+        self.assertIsNone(self.cache.get_entry('http://any'))
+
+
+class SQLiteCacheTestCase(CacheBackendTestMixin, unittest.TestCase):
+    """Unit test case for SQLite cache backend"""
+
+    def create_cache(self, path):
+        return SQLiteCache(path / 'cache.sqlite', retention=0, max_size=10,
+                           batch_size=3)
+
+    def count(self):
+        return self.cache.connection.execute(
+            'SELECT COUNT(*) FROM cache').fetchone()[0]
+
+    def test_wal_mode(self):
+        """Test database works in WAL mode"""
+
+        mode, = self.cache.connection.execute(
+            'PRAGMA journal_mode').fetchone()
+        self.assertEqual(mode, 'wal')
+
+    def test_batched_writes(self):
+        """Test writes are committed when batch is full"""
+
+        self.cache.set('http://a', b'a')
+        self.cache.set('http://b', b'b')
+        self.assertEqual(self.count(), 0)
+
+        self.cache.set('http://c', b'c')
+        self.assertEqual(self.count(), 3)
+
+    def test_persistence(self):
+        """Test entries survive reopening the database"""
+
+        self.cache.set('http://any', b'page')
+        self.cache.close()
+
+        self.cache = self.create_cache(Path(self.tmp_dir.name))
+        self.assertEqual(self.cache.get('http://any'), b'page')
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted over size cap"""
+
+        self.cache.set('http://a', b'aaaa')
+        self.cache.set('http://b', b'bbbb')
+        self.cache.flush()
+        self.cache.get('http://a')
+        self.cache.set('http://c', b'cccc')
+        self.cache.flush()
+
+        self.assertEqual(self.cache.get('http://a'), b'aaaa')
+        self.assertIsNone(self.cache.get('http://b'))
+        self.assertEqual(self.cache.get('http://c'), b'cccc')
+
+
+class MemoryCacheTestCase(CacheBackendTestMixin, unittest.TestCase):
+    """Unit test case for in-memory cache layer"""
+
+    def create_cache(self, path):
+        return MemoryCache(FileCache(path / 'cache', retention=0),
+                           max_entries=2)
+
+    def test_served_from_memory(self):
+        """Test stored entry is read without the wrapped storage"""
+
+        self.cache.set('http://any', b'page')
+        self.cache.backend.delete('http://any')
+
+        self.assertEqual(self.cache.get('http://any'), b'page')
+
+    def test_read_through(self):
+        """Test missing entry is read from the wrapped storage"""
+
+        self.cache.backend.set('http://any', b'page')
+        self.assertEqual(self.cache.get('http://any'), b'page')
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are dropped from memory"""
+
+        self.cache.set('http://a', b'a')
+        self.cache.set('http://b', b'b')
+        self.cache.get('http://a')
+        self.cache.set('http://c', b'c')
+
+        self.assertEqual(list(self.cache._entries), ['http://a', 'http://c'])
+
+
+if __name__ == '__main__':
+    unittest.main()
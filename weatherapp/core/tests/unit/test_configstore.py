@@ -0,0 +1,123 @@
+""" Unit tests for configuration store """
+
+import configparser
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from weatherapp.core.configstore import ConfigStore, ProviderConfig
+
+
+class ConfigStoreTestCase(unittest.TestCase):
+    """Unit test case for configuration store"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / 'weatherapp.ini'
+        self.path.write_text('[rp5]\nname = Kyiv\nurl = http://rp5/kyiv\n',
+                             encoding='utf-8')
+        self.store = ConfigStore(self.path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_parsed_once(self):
+        """Test file is parsed again only when it is changed"""
+
+        parser = self.store.read()
+        self.assertIs(self.store.read(), parser)
+
+        self.path.write_text('[accu]\nname = Lviv\nurl = http://accu/lviv\n',
+                             encoding='utf-8')
+        self.assertEqual(self.store.read().sections(), ['accu'])
+
+    def test_provider_config(self):
+        """Test provider section and defaults"""
+
+        self.assertEqual(
+            self.store.get_provider_config('rp5', 'Dnipro', 'http://d'),
+            ProviderConfig('Kyiv', 'http://rp5/kyiv',
+                           [('Kyiv', 'http://rp5/kyiv')]))
+        self.assertEqual(
+            self.store.get_provider_config('accu', 'Dnipro', 'http://d'),
+            ProviderConfig('Dnipro', 'http://d', [('Dnipro', 'http://d')]))
+
+    def test_option_case(self):
+        """Test provider options are case-insensitive and location names
+        keep their case"""
+
+        self.path.write_text('[rp5]\nName = Kyiv\nURL = http://rp5/kyiv\n'
+                             '[rp5.locations]\nLviv = http://rp5/lviv\n',
+                             encoding='utf-8')
+
+        provider_config = self.store.get_provider_config('rp5', 'Dnipro',
+                                                         'http://d')
+        self.assertEqual(provider_config.location, 'Kyiv')
+        self.assertEqual(provider_config.locations,
+                         [('Lviv', 'http://rp5/lviv')])
+
+        self.store.save_location('accu', 'Lviv', 'http://accu/lviv')
+        self.assertIn('Lviv = http://rp5/lviv',
+                      self.path.read_text(encoding='utf-8'))
+
+    def test_locations_file(self):
+        """Test batch locations from extra file"""
+
+        locations_file = Path(self.tmp_dir.name) / 'cities.ini'
+        locations_file.write_text('[rp5.locations]\nLviv = http://rp5/lviv\n'
+                                  'Odesa = http://rp5/odesa\n',
+                                  encoding='utf-8')
+
+        provider_config = self.store.get_provider_config(
+            'rp5', 'Dnipro', 'http://d', str(locations_file))
+        self.assertEqual(provider_config.locations,
+                         [('Lviv', 'http://rp5/lviv'),
+                          ('Odesa', 'http://rp5/odesa')])
+
+    def test_save_location(self):
+        """Test location is saved keeping other sections"""
+
+        self.store.save_location('accu', 'Lviv', 'http://accu/lviv')
+
+        parser = configparser.ConfigParser()
+        parser.read(self.path)
+        self.assertEqual(parser.sections(), ['rp5', 'accu'])
+        self.assertEqual(self.store.get_provider_config(
+            'accu', 'Dnipro', 'http://d').location, 'Lviv')
+        self.assertEqual(sorted(path.name for path in self.path.parent
+                                .iterdir()),
+                         ['weatherapp.ini', 'weatherapp.ini.lock'])
+
+    def test_failed_write(self):
+        """Test failed write leaves configuration file intact"""
+
+        content = self.path.read_text(encoding='utf-8')
+        with mock.patch.object(configparser.ConfigParser, 'write',
+                               side_effect=OSError('No space left')):
+            with self.assertRaises(OSError):
+                self.store.save_location('accu', 'Lviv', 'http://accu/lviv')
+
+        self.assertEqual(self.path.read_text(encoding='utf-8'), content)
+        self.assertEqual(len(list(self.path.parent.iterdir())), 2)
+
+    def test_concurrent_saves(self):
+        """Test saves of independent stores do not lose each other"""
+
+        providers = [f'provider{index}' for index in range(8)]
+        threads = [threading.Thread(
+            target=ConfigStore(self.path).save_location,
+            args=(provider, provider, f'http://{provider}'))
+            for provider in providers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(set(self.store.read().sections()),
+                         set(providers) | {'rp5'})
+
+
+if __name__ == '__main__':
+    unittest.main()
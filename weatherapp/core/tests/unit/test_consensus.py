@@ -0,0 +1,54 @@
+""" Unit tests for comparison of providers """
+
+import math
+import unittest
+
+from weatherapp.core.consensus import compare
+from weatherapp.core.reading import ReadingBatch, WeatherReading
+
+
+class CompareTestCase(unittest.TestCase):
+    """Unit test case for vectorized comparison of readings"""
+
+    def test_locations(self):
+        """Test readings are grouped by location name"""
+
+        consensus = compare(ReadingBatch([
+            WeatherReading('RP5', 'Kyiv', temp=-3, wind_speed=22),
+            WeatherReading('RP5', 'Dnipro', temp=11, feels_like=9),
+            WeatherReading('AccuWeather', ' kyiv', temp=-2, wind_speed=19),
+            WeatherReading('AccuWeather', 'Dnipro', temp=12),
+        ]))
+
+        self.assertEqual(consensus.locations, ['Dnipro', 'Kyiv'])
+        self.assertEqual(consensus.counts.tolist(), [2, 2])
+        self.assertEqual(consensus.mean[0, :2].tolist(), [11.5, 9])
+        self.assertTrue(math.isnan(consensus.mean[0, 2]))
+        self.assertEqual(consensus.spread[1, ::2].tolist(), [1, 3])
+        self.assertTrue(math.isnan(consensus.spread[1, 1]))
+        self.assertFalse(consensus.disagree.any())
+
+    def test_disagreement(self):
+        """Test spread above threshold in metric units"""
+
+        consensus = compare(ReadingBatch([
+            WeatherReading('RP5', 'Kyiv', temp=5, wind_speed=16),
+            WeatherReading('AccuWeather', 'Kyiv', temp=50, wind_speed=5,
+                           units='imperial'),
+        ]), thresholds={'temp': 3, 'feels_like': 3, 'wind_speed': 10})
+
+        self.assertAlmostEqual(consensus.mean[0, 0], 7.5)
+        self.assertAlmostEqual(consensus.spread[0, 2], 16 - 5 * 1.609344)
+        self.assertEqual(consensus.disagree[0].tolist(), [True, False, False])
+
+    def test_empty(self):
+        """Test batch without readings"""
+
+        consensus = compare(ReadingBatch())
+
+        self.assertEqual(consensus.locations, [])
+        self.assertEqual(consensus.mean.shape, (0, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
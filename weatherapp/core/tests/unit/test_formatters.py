@@ -0,0 +1,104 @@
+""" Unit tests for output formatters """
+
+import io
+import json
+import unittest
+
+from weatherapp.core.formatters import (CombinedTableFormatter,
+                                        CSVFormatter, JSONFormatter,
+                                        NDJSONFormatter)
+
+DNIPRO = {'cond': 'хмарно', 'temp': '+11 °C', 'wind': '11 км/год, "пн"'}
+KYIV = {'temp': '-3 °C'}
+
+
+class StructuredFormattersTestCase(unittest.TestCase):
+    """Unit test case for machine readable formatters"""
+
+    def setUp(self):
+        self.stdout = io.StringIO()
+
+    def render(self, formatter_class):
+        formatter = formatter_class(self.stdout)
+        formatter.begin()
+        formatter.write('RP5', 'Dnipro', DNIPRO)
+        streamed = self.stdout.getvalue()
+        formatter.write('RP5', 'Kyiv', KYIV)
+        formatter.end()
+        return streamed, self.stdout.getvalue()
+
+    def test_json(self):
+        """Test readings as JSON array"""
+
+        streamed, output = self.render(JSONFormatter)
+
+        self.assertIn('Dnipro', streamed)
+        self.assertEqual(json.loads(output), [
+            {'provider': 'RP5', 'location': 'Dnipro', **DNIPRO},
+            {'provider': 'RP5', 'location': 'Kyiv', **KYIV}])
+
+    def test_json_empty(self):
+        """Test no readings is an empty array"""
+
+        formatter = JSONFormatter(self.stdout)
+        formatter.begin()
+        formatter.end()
+
+        self.assertEqual(json.loads(self.stdout.getvalue()), [])
+
+    def test_ndjson(self):
+        """Test reading per line"""
+
+        streamed, output = self.render(NDJSONFormatter)
+
+        self.assertEqual(json.loads(streamed)['location'], 'Dnipro')
+        self.assertEqual([json.loads(line)['temp']
+                          for line in output.splitlines()],
+                         ['+11 °C', '-3 °C'])
+
+    def test_csv(self):
+        """Test header and row per reading with missing fields empty"""
+
+        streamed, output = self.render(CSVFormatter)
+
+        self.assertEqual(output.splitlines(), [
+            'provider,location,cond,temp,feels_like,wind',
+            'RP5,Dnipro,хмарно,+11 °C,,"11 км/год, ""пн"""',
+            'RP5,Kyiv,,-3 °C,,'])
+        self.assertEqual(len(streamed.splitlines()), 2)
+
+
+class CombinedTableFormatterTestCase(unittest.TestCase):
+    """Unit test case for combined table formatter"""
+
+    def setUp(self):
+        self.stdout = io.StringIO()
+        self.formatter = CombinedTableFormatter(self.stdout)
+
+    def test_table(self):
+        """Test row per location aligned to the widest value"""
+
+        self.formatter.write('RP5', 'Dnipro', {'temp': '+11 °C'})
+        self.formatter.write('AccuWeather', 'Kyiv', {'temp': '-3 °C',
+                                                     'cond': 'сніг'})
+        self.assertEqual(self.stdout.getvalue(), '')
+        self.formatter.end()
+
+        self.assertEqual(self.stdout.getvalue().splitlines(), [
+            '+-------------+----------+-----------+-------------+',
+            '| Provider    | Location | Condition | Temperature |',
+            '+-------------+----------+-----------+-------------+',
+            '| RP5         | Dnipro   |           | +11 °C      |',
+            '| AccuWeather | Kyiv     | сніг      | -3 °C       |',
+            '+-------------+----------+-----------+-------------+'])
+
+    def test_empty(self):
+        """Test nothing is printed without readings"""
+
+        self.formatter.end()
+
+        self.assertEqual(self.stdout.getvalue(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
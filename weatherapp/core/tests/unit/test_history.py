@@ -0,0 +1,79 @@
+""" Unit tests for history of readings """
+
+import tempfile
+import unittest
+from argparse import ArgumentTypeError
+from datetime import datetime
+from pathlib import Path
+
+from weatherapp.core.history import HistoryStore, parse_time
+from weatherapp.core.reading import WeatherReading
+
+
+class HistoryStoreTestCase(unittest.TestCase):
+    """Unit test case for history store"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / 'history.sqlite'
+        self.history = HistoryStore(self.path)
+
+    def tearDown(self):
+        self.history.close()
+        self.tmp_dir.cleanup()
+
+    def test_query_range(self):
+        """Test readings of the location within time range in order"""
+
+        self.history.record(
+            WeatherReading(provider, location, temp=timestamp,
+                           timestamp=timestamp)
+            for timestamp in (30, 10, 20)
+            for provider, location in (('RP5', 'Kyiv'), ('RP5', 'Dnipro'),
+                                       ('AccuWeather', 'kyiv ')))
+
+        readings = self.history.query('KYIV', since=20)
+
+        self.assertEqual([(reading.timestamp, reading.provider)
+                          for reading in readings],
+                         [(20, 'AccuWeather'), (20, 'RP5'),
+                          (30, 'AccuWeather'), (30, 'RP5')])
+        self.assertEqual(len(self.history.query('Kyiv', 10, 20)), 2)
+
+    def test_reading_fields(self):
+        """Test readings are restored with all fields"""
+
+        reading = WeatherReading.from_info(
+            'RP5', 'Dnipro', {'cond': 'хмарно', 'temp': '+11 °C',
+                              'wind': 'Вітер11 км/год'}, timestamp=100)
+        self.assertEqual(self.history.record([reading]), 1)
+
+        self.assertEqual(list(self.history.query('Dnipro')), [reading])
+
+    def test_missing_store(self):
+        """Test query does not create the database"""
+
+        self.assertEqual(len(self.history.query('Kyiv')), 0)
+        self.assertFalse(self.path.exists())
+
+
+class ParseTimeTestCase(unittest.TestCase):
+    """Unit test case for time of history queries"""
+
+    def test_time_ago(self):
+        """Test durations before now"""
+
+        self.assertEqual(parse_time('30m', now=10000), 10000 - 30 * 60)
+        self.assertEqual(parse_time('2d', now=200000), 200000 - 2 * 86400)
+
+    def test_date(self):
+        """Test local date and time"""
+
+        self.assertEqual(parse_time('2019-03-25 12:00'),
+                         datetime(2019, 3, 25, 12).timestamp())
+        with self.assertRaises(ArgumentTypeError):
+            parse_time('yesterday')
+
+
+if __name__ == '__main__':
+    unittest.main()
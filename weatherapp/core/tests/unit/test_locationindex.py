@@ -0,0 +1,86 @@
+""" Unit tests for LocationIndex class """
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from weatherapp.core import config
+from weatherapp.core.locationindex import LocationIndex
+
+LOCATIONS = [
+    ('Dnipro', 'http://site/dnipro', ('Europe', 'Ukraine')),
+    ('Dniprorudne', 'http://site/dniprorudne', ('Europe', 'Ukraine')),
+    ('Kyiv', 'http://site/kyiv', ('Europe', 'Ukraine')),
+    ('Odesa', 'http://site/odesa-ua', ('Europe', 'Ukraine')),
+    ('Odesa', 'http://site/odesa-us', ('North America', 'USA')),
+]
+
+
+class LocationIndexTestCase(unittest.TestCase):
+    """Unit test case for locations index"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp_dir.name)
+        LocationIndex('any', self.directory).build(LOCATIONS)
+        self.index = LocationIndex('any', self.directory)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def names(self, query):
+        return [location.name for location in self.index.search(query)]
+
+    def test_exists(self):
+        """Test index file is written"""
+
+        self.assertTrue(self.index.exists())
+        self.assertFalse(LocationIndex('other', self.directory).exists())
+
+    def test_exact_match_first(self):
+        """Test exact match goes before other prefix matches"""
+
+        self.assertEqual(self.names('dnipro'), ['Dnipro', 'Dniprorudne'])
+
+    def test_prefix(self):
+        """Test lookup by name beginning"""
+
+        self.assertEqual(self.names('ky'), ['Kyiv'])
+
+    def test_same_names(self):
+        """Test locations with the same name are kept with their paths"""
+
+        paths = [location.path for location in self.index.search('Odesa')]
+        self.assertEqual(sorted(paths), ['Europe / Ukraine',
+                                         'North America / USA'])
+
+    def test_fuzzy(self):
+        """Test misspelled name"""
+
+        self.assertEqual(self.names('kiev'), ['Kyiv'])
+
+    def test_fuzzy_neighbourhood(self):
+        """Test fuzzy lookup compares only names around the query"""
+
+        with mock.patch.object(config, 'LOCATIONS_FUZZY_CANDIDATES', 2):
+            self.assertEqual(self.names('dniprorudnee'), ['Dniprorudne'])
+            self.assertEqual(self.names('dnipo'), ['Dnipro'])
+        # names starting with another character are not compared
+        self.assertEqual(self.names('tyiv'), [])
+
+    def test_empty(self):
+        """Test index without locations"""
+
+        LocationIndex('any', self.directory).build([])
+
+        self.assertEqual(self.names('kyiv'), [])
+
+    def test_not_found(self):
+        """Test unknown name"""
+
+        self.assertEqual(self.names('london'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
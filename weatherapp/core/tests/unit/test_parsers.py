@@ -0,0 +1,67 @@
+""" Parity tests for parser engines over saved pages """
+
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from weatherapp.core.config import PARSER_ENGINES
+from weatherapp.core.providers import AccuWeatherProvider, RP5Provider
+
+FIXTURES = Path(__file__).parent.parent / 'fixtures'
+
+
+def create_provider(provider_class, engine):
+    """Provider instance without configuration, using given engine"""
+
+    provider = provider_class.__new__(provider_class)
+    provider.app = SimpleNamespace(options=SimpleNamespace(parser=engine))
+    return provider
+
+
+class ParserEnginesTestCase(unittest.TestCase):
+    """All parser engines extract the same weather info"""
+
+    def assert_parity(self, provider_class, method, pattern):
+        pages = sorted(FIXTURES.glob(pattern))
+        self.assertTrue(pages)
+        for page in pages:
+            content = page.read_text(encoding='utf-8')
+            results = {engine: getattr(create_provider(provider_class,
+                                                       engine),
+                                       method)(content)
+                       for engine in PARSER_ENGINES}
+            with self.subTest(page=page.name):
+                self.assertTrue(results['soup'])
+                self.assertEqual(results['lxml'], results['soup'])
+
+    def test_accu_current_day_url(self):
+        """Test AccuWeather forecast pages"""
+
+        self.assert_parity(AccuWeatherProvider, 'get_current_day_url',
+                           'accu_forecast*.html')
+
+    def test_accu_current_day_info(self):
+        """Test AccuWeather current day pages"""
+
+        self.assert_parity(AccuWeatherProvider, 'get_current_day_info',
+                           'accu_current*.html')
+
+    def test_rp5_weather_info(self):
+        """Test RP5 pages"""
+
+        self.assert_parity(RP5Provider, 'get_weather_info', 'rp5_*.html')
+
+    def test_rp5_values(self):
+        """Test RP5 weather info content"""
+
+        content = (FIXTURES / 'rp5_current.html').read_text(encoding='utf-8')
+        provider = create_provider(RP5Provider, 'lxml')
+
+        self.assertEqual(provider.get_weather_info(content),
+                         {'cond': 'хмарно', 'temp': '+11 °C',
+                          'feels_like': '+9 °C',
+                          'wind': 'Вітер11 км/год, вітер північно-західний'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+""" Unit tests for plugin registry and lazy loading """
+
+import ast
+import subprocess
+import sys
+import unittest
+from importlib import metadata
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from weatherapp.core import plugins
+from weatherapp.core.commandmanager import CommandManager
+from weatherapp.core.commands import Providers
+from weatherapp.core.plugins import PluginSpec
+
+
+class AnyCommand:
+    """Class for tests"""
+
+    title = 'Any command'
+
+
+class PluginSpecTestCase(unittest.TestCase):
+    """Unit test case for plugin specs"""
+
+    def test_load(self):
+        """Test spec target is imported"""
+
+        spec = PluginSpec('providers', 'List providers',
+                          'weatherapp.core.commands.providers:Providers')
+        self.assertIs(spec.load(), Providers)
+        self.assertIs(PluginSpec('any', 'Any', AnyCommand).load(),
+                      AnyCommand)
+
+    def test_of_class(self):
+        """Test spec of plugin registered as a class"""
+
+        self.assertEqual(PluginSpec.of('any', AnyCommand),
+                         PluginSpec('any', 'Any command', AnyCommand))
+
+    def test_setup_entry_points(self):
+        """Test setup.py registers every built-in plugin"""
+
+        setup_file = Path(__file__).parents[4] / 'setup.py'
+        if not setup_file.exists():
+            self.skipTest('setup.py is not available')
+        setup = next(node for node in ast.walk(ast.parse(
+            setup_file.read_text(encoding='utf-8')))
+            if isinstance(node, ast.Call)
+            and getattr(node.func, 'id', None) == 'setup')
+        entry_points = ast.literal_eval(next(
+            keyword.value for keyword in setup.keywords
+            if keyword.arg == 'entry_points'))
+
+        names = {id(value): name for name, value in vars(plugins).items()}
+        for group, specs in plugins.BUILTIN_PLUGINS.items():
+            expected = [f'{spec.name}=weatherapp.core.plugins:'
+                        f'{names[id(spec)]}' for spec in specs]
+            with self.subTest(group=group):
+                self.assertEqual(sorted(entry_points[group]),
+                                 sorted(expected))
+
+
+class BuiltinPluginsTestCase(unittest.TestCase):
+    """Unit test case for plugins of this package"""
+
+    def test_installed(self):
+        """Test built-in plugins come from entry points of the package"""
+
+        entry_points = [
+            SimpleNamespace(name='providers', group=plugins.COMMANDS_GROUP,
+                            load=lambda: plugins.PROVIDERS_COMMAND),
+            SimpleNamespace(name='rp5', group=plugins.PROVIDERS_GROUP,
+                            load=lambda: plugins.RP5_PROVIDER)]
+        distribution = SimpleNamespace(entry_points=entry_points)
+        with mock.patch('importlib.metadata.distribution',
+                        return_value=distribution) as get_distribution:
+            specs = plugins.builtin_plugins(plugins.COMMANDS_GROUP)
+
+        get_distribution.assert_called_once_with(plugins.DISTRIBUTION)
+        self.assertEqual(specs, [plugins.PROVIDERS_COMMAND])
+
+    def test_source_tree(self):
+        """Test built-in specs are used when the package is not installed"""
+
+        with mock.patch('importlib.metadata.distribution',
+                        side_effect=metadata.PackageNotFoundError):
+            specs = plugins.builtin_plugins(plugins.FORMATTERS_GROUP)
+
+        self.assertEqual(specs,
+                         plugins.BUILTIN_PLUGINS[plugins.FORMATTERS_GROUP])
+
+
+class DiscoveryTestCase(unittest.TestCase):
+    """Unit test case for plugins of installed packages"""
+
+    def setUp(self):
+        entry_point = SimpleNamespace(name='any', load=lambda: AnyCommand)
+        patcher = mock.patch.object(plugins, 'get_entry_points',
+                                    return_value=[entry_point])
+        self.get_entry_points = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manager = CommandManager()
+
+    def test_builtin_without_discovery(self):
+        """Test built-in command is found without scanning entry points"""
+
+        self.assertIn('providers', self.manager)
+        self.get_entry_points.assert_not_called()
+
+    def test_discovered(self):
+        """Test command registered with entry point"""
+
+        self.assertIs(self.manager.get('any'), AnyCommand)
+        self.assertIn(PluginSpec('any', 'Any command', AnyCommand),
+                      list(self.manager.specs()))
+        self.get_entry_points.assert_called_once_with(
+            plugins.COMMANDS_GROUP)
+
+
+class LazyImportTestCase(unittest.TestCase):
+    """Unit test case for startup imports"""
+
+    def test_providers_command(self):
+        """Test listing providers does not import heavy libraries"""
+
+        code = ('import sys, io\n'
+                'from weatherapp.core.app import App\n'
+                'App(stdout=io.StringIO()).run(["providers"])\n'
+                'print(" ".join(name for name in ("lxml", "bs4", '
+                '"requests", "prettytable", "aiohttp", "asyncio", "numpy", '
+                '"weatherapp.core.providers.rp5") if name in sys.modules))')
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                stdout=subprocess.PIPE, text=True).stdout
+
+        self.assertEqual(output.strip(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
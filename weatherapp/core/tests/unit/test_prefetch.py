@@ -0,0 +1,80 @@
+""" Unit tests for Prefetcher class """
+
+import threading
+import time
+import unittest
+
+from weatherapp.core.prefetch import Prefetcher
+
+
+class FakeCache:
+    """Cache which records deleted keys"""
+
+    def __init__(self):
+        self.deleted = []
+        self.changed = threading.Event()
+
+    def delete(self, key):
+        self.deleted.append(key)
+        self.changed.set()
+
+
+class PrefetcherTestCase(unittest.TestCase):
+    """Unit test case for browse levels prefetcher"""
+
+    def setUp(self):
+        self.loaded = []
+        self.release = threading.Event()
+        self.cache = FakeCache()
+        self.prefetcher = Prefetcher(self.load, self.cache, workers=1)
+
+    def tearDown(self):
+        self.release.set()
+        self.prefetcher.close()
+
+    def load(self, url):
+        self.loaded.append(url)
+        if url == 'slow':
+            self.release.wait(5)
+        return [(url, url + '/child')]
+
+    def test_prefetched_level_is_loaded_once(self):
+        """Test prefetched level is returned without loading it again"""
+
+        self.prefetcher.prefetch(['a'])
+        self.assertEqual(self.prefetcher.get('a'), [('a', 'a/child')])
+        self.assertEqual(self.loaded, ['a'])
+
+    def test_not_started_level_is_loaded_at_once(self):
+        """Test level waiting in the queue is loaded by the caller"""
+
+        self.prefetcher.prefetch(['slow', 'b'])
+        self.assertEqual(self.prefetcher.get('b'), [('b', 'b/child')])
+
+    def test_discard(self):
+        """Test unused levels are cancelled or removed from cache"""
+
+        self.prefetcher.prefetch(['slow', 'b'])
+        self.prefetcher.discard()
+        self.prefetcher.close()
+        self.release.set()
+        self.cache.changed.wait(5)
+
+        self.assertEqual(self.loaded, ['slow'])
+        self.assertEqual(self.cache.deleted, ['slow'])
+
+    def test_close_does_not_wait(self):
+        """Test slow unused prefetch does not block the selection"""
+
+        self.prefetcher.prefetch(['slow', 'b'])
+        started = time.monotonic()
+        self.prefetcher.get('b')
+        self.prefetcher.discard()
+        self.prefetcher.close()
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(self.loaded, ['slow', 'b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+""" Unit tests for stage timing """
+
+import unittest
+
+from weatherapp.core.profiling import NULL_PROFILER, Profiler
+
+
+class FakeClock:
+    """Clock advancing by a second on every call"""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+class ProfilerTestCase(unittest.TestCase):
+    """Unit test case for profiler"""
+
+    def setUp(self):
+        self.profiler = Profiler(clock=FakeClock())
+
+    def test_span(self):
+        """Test time of stages is accounted to their owner"""
+
+        for _ in range(2):
+            with self.profiler.span('rp5', 'fetch') as span:
+                span.add('fetched bytes', 100)
+        with self.profiler.span('accu', 'parse'):
+            pass
+
+        self.assertEqual(self.profiler.report(), {
+            'accu': {'stages': {'parse': {'calls': 1, 'total': 1,
+                                          'max': 1}},
+                     'counters': {}},
+            'rp5': {'stages': {'fetch': {'calls': 2, 'total': 2, 'max': 1}},
+                    'counters': {'fetched bytes': 200}},
+        })
+
+    def test_span_error(self):
+        """Test failed stage is measured and error is not hidden"""
+
+        with self.assertRaises(ValueError):
+            with self.profiler.span('rp5', 'parse'):
+                raise ValueError
+
+        self.assertEqual(
+            self.profiler.report()['rp5']['stages']['parse']['calls'], 1)
+
+    def test_format_report(self):
+        """Test report as text"""
+
+        with self.profiler.span('rp5', 'fetch'):
+            pass
+        self.profiler.count('rp5', 'cache misses')
+
+        report = self.profiler.format_report()
+        self.assertIn('Profile of rp5:', report)
+        self.assertRegex(report, r'fetch\s+1\s+1000\.0\s+1000\.0')
+        self.assertRegex(report, r'cache misses\s+1')
+
+    def test_null_profiler(self):
+        """Test disabled profiler shares a single span"""
+
+        with NULL_PROFILER.span('rp5', 'fetch') as span:
+            span.add('fetched bytes', 100)
+
+        self.assertFalse(NULL_PROFILER.enabled)
+        self.assertIs(NULL_PROFILER.span('accu', 'parse'), span)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+""" Unit tests for request rate limits """
+
+import unittest
+
+from weatherapp.core.ratelimit import HostRateLimiter, TokenBucket
+
+
+class FakeClock:
+    """Time source moved by tests"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TokenBucketTestCase(unittest.TestCase):
+    """Unit test case for token bucket"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(rate=2, burst=2, clock=self.clock)
+
+    def test_burst(self):
+        """Test burst is allowed, then requests are spaced by rate"""
+
+        delays = [self.bucket.reserve() for _ in range(4)]
+        self.assertEqual(delays, [0, 0, 0.5, 1.0])
+
+    def test_refill(self):
+        """Test tokens come back with time up to capacity"""
+
+        self.bucket.reserve()
+        self.bucket.reserve()
+        self.clock.now = 10
+
+        delays = [self.bucket.reserve() for _ in range(3)]
+        self.assertEqual(delays, [0, 0, 0.5])
+
+
+class HostRateLimiterTestCase(unittest.TestCase):
+    """Unit test case for per host limits"""
+
+    def test_shared_by_subdomains(self):
+        """Test host limit applies to its subdomains"""
+
+        limiter = HostRateLimiter({'accuweather.com': (1, 1)})
+
+        self.assertIs(limiter.get_bucket('https://www.accuweather.com/uk'),
+                      limiter.get_bucket('http://accuweather.com/'))
+        self.assertEqual(limiter.reserve('https://www.accuweather.com/'), 0)
+        self.assertAlmostEqual(limiter.reserve('https://accuweather.com/'), 1,
+                               places=2)
+
+    def test_other_hosts(self):
+        """Test other hosts follow default limit"""
+
+        self.assertIsNone(HostRateLimiter({}).get_bucket('http://rp5.ua/'))
+
+        limiter = HostRateLimiter({}, default=(1, 1))
+        self.assertIsNot(limiter.get_bucket('http://rp5.ua/'),
+                         limiter.get_bucket('http://accuweather.com/'))
+        self.assertIsNot(limiter.get_bucket('http://notrp5.ua/'),
+                         limiter.get_bucket('http://rp5.ua/'))
+
+
+if __name__ == '__main__':
+    unittest.main()
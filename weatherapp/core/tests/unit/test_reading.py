@@ -0,0 +1,86 @@
+""" Unit tests for typed weather readings """
+
+import math
+import unittest
+
+from weatherapp.core.reading import ReadingBatch, WeatherReading, parse_number
+
+RP5_INFO = {'cond': 'хмарно', 'temp': '+11 °C', 'feels_like': '+9 °C',
+            'wind': 'Вітер11 км/год, вітер північно-західний'}
+ACCU_INFO = {'cond': 'Сніг', 'temp': '-2°', 'feels_like': '−7°',
+             'wind': 'Пд 19,5 км/год'}
+
+
+class WeatherReadingTestCase(unittest.TestCase):
+    """Unit test case for weather reading"""
+
+    def test_parse_number(self):
+        """Test numbers as sites show them"""
+
+        self.assertEqual(parse_number('+12°'), 12)
+        self.assertEqual(parse_number('−7°'), -7)
+        self.assertEqual(parse_number('Пд 19,5 км/год'), 19.5)
+        self.assertIsNone(parse_number('штиль'))
+        self.assertIsNone(parse_number(None))
+
+    def test_from_info(self):
+        """Test numeric fields are parsed from weather info"""
+
+        reading = WeatherReading.from_info('AccuWeather', 'Kyiv', ACCU_INFO,
+                                           timestamp=100)
+
+        self.assertEqual(
+            (reading.temp, reading.feels_like, reading.wind_speed),
+            (-2, -7, 19.5))
+        self.assertEqual(reading.units, 'metric')
+        self.assertEqual(reading.timestamp, 100)
+
+    def test_as_info(self):
+        """Test weather info is shown the same way for every site"""
+
+        reading = WeatherReading.from_info('AccuWeather', 'Kyiv',
+                                           {'temp': '0°F', 'feels_like': '-3°F'})
+
+        self.assertEqual(reading.as_info(),
+                         {'temp': '0 °F', 'feels_like': '-3 °F'})
+        self.assertEqual(
+            WeatherReading.from_info('RP5', 'Dnipro', RP5_INFO).as_info(),
+            RP5_INFO)
+
+    def test_slots(self):
+        """Test reading has no instance dictionary"""
+
+        with self.assertRaises(AttributeError):
+            WeatherReading('RP5', 'Dnipro').humidity = 80
+
+
+class ReadingBatchTestCase(unittest.TestCase):
+    """Unit test case for columnar batch of readings"""
+
+    def setUp(self):
+        self.readings = [
+            WeatherReading.from_info('RP5', 'Dnipro', RP5_INFO, timestamp=1),
+            WeatherReading.from_info('AccuWeather', 'Kyiv', {'cond': 'Сніг'},
+                                     timestamp=2)]
+        self.batch = ReadingBatch(self.readings)
+
+    def test_columns(self):
+        """Test numeric columns with NaN for missing values"""
+
+        temp = self.batch.column('temp')
+
+        self.assertEqual(temp.typecode, 'd')
+        self.assertEqual(temp[0], 11)
+        self.assertTrue(math.isnan(temp[1]))
+        self.assertEqual(self.batch.column('location'), ['Dnipro', 'Kyiv'])
+
+    def test_readings(self):
+        """Test readings are restored from columns"""
+
+        self.assertEqual(len(self.batch), 2)
+        self.assertEqual(list(self.batch), self.readings)
+        self.assertIsNone(self.batch[1].temp)
+
+
+if __name__ == '__main__':
+    unittest.main()
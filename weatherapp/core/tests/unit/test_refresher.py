@@ -0,0 +1,53 @@
+""" Unit tests for background refresher """
+
+import threading
+import time
+import unittest
+
+from weatherapp.core.refresher import BackgroundRefresher
+
+
+class BackgroundRefresherTestCase(unittest.TestCase):
+    """Unit test case for background refresh jobs"""
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.refresher = BackgroundRefresher(workers=1)
+
+    def tearDown(self):
+        self.release.set()
+
+    def test_one_job_per_key(self):
+        """Test repeated submission returns the running job"""
+
+        first = self.refresher.submit('key', self.release.wait, 5)
+        self.assertIs(self.refresher.submit('key', self.release.wait, 5),
+                      first)
+        self.release.set()
+        self.refresher.wait()
+
+        self.assertTrue(first.result())
+        self.refresher.close()
+
+    def test_close_does_not_wait(self):
+        """Test closing does not wait for running refresh"""
+
+        running_started = threading.Event()
+
+        def slow():
+            running_started.set()
+            self.release.wait(5)
+
+        running = self.refresher.submit('slow', slow)
+        pending = self.refresher.submit('next', self.release.wait, 5)
+        running_started.wait(5)
+        started = time.monotonic()
+        self.refresher.close()
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertTrue(pending.cancelled())
+        self.assertFalse(running.done())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+""" Unit tests for refresh scheduler """
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from weatherapp.core.caches import FileCache
+from weatherapp.core.scheduler import RefreshScheduler
+from weatherapp.core.tests.fakes import create_app
+from weatherapp.core.tests.unit.test_abstract_provider import (
+    CachedPageProvider, DummyProvider)
+from weatherapp.core.transport import Response
+
+
+class FailingProvider(DummyProvider):
+    """Provider which can not get its page"""
+
+    def get_page_source(self, url, section_id=None):
+        raise ConnectionError(url)
+
+
+class RefreshSchedulerTestCase(unittest.TestCase):
+    """Unit test case for refresh scheduler"""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        self.recorded = []
+        self.app = create_app(
+            self.tmp_dir.name,
+            cache=FileCache(Path(self.tmp_dir.name), ttl=300),
+            record_history=self.recorded.extend)
+
+    def tearDown(self):
+        self.app.refresher.close()
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def test_missing_refreshed_at_once(self):
+        """Test location without cached info is due within jitter"""
+
+        provider = DummyProvider(self.app)
+        now = time.time()
+        scheduler = RefreshScheduler(self.app, [provider], jitter=5)
+
+        due, index = scheduler._queue[0]
+        self.assertEqual(index, 0)
+        self.assertTrue(now <= due <= now + 5 + 1)
+        self.assertEqual(provider.refresh_lead, scheduler.lead + 5)
+
+    def test_refreshed_before_expiration(self):
+        """Test next refresh is queued ahead of expiration"""
+
+        provider = DummyProvider(self.app)
+        scheduler = RefreshScheduler(self.app, [provider], lead=30,
+                                     jitter=10)
+        futures = scheduler.run_pending(now=time.time() + 10)
+        self.app.refresher.wait()
+
+        self.assertEqual(len(futures), 1)
+        self.assertEqual(provider.parsed, 1)
+        self.assertEqual([reading.temp for reading in self.recorded], [12])
+        expiration = scheduler.get_expiration(scheduler.jobs[0])
+        due, _ = scheduler._queue[0]
+        self.assertTrue(expiration - 40 <= due <= expiration - 30)
+
+    def test_failed_retried(self):
+        """Test failed refresh is retried after delay"""
+
+        scheduler = RefreshScheduler(self.app, [FailingProvider(self.app)],
+                                     jitter=0, retry=120)
+        now = time.time()
+        scheduler.run_pending(now=now)
+        self.app.refresher.wait()
+
+        due, _ = scheduler._queue[0]
+        self.assertGreaterEqual(due, now + 120)
+        self.assertEqual(self.recorded, [])
+        self.assertEqual(scheduler.run_pending(now=now + 60), [])
+
+    def test_page_in_lead_refetched(self):
+        """Test page due for refresh is downloaded by the refresh job"""
+
+        fetched = []
+
+        def get(url, headers=None, until=None):
+            fetched.append(url)
+            return Response(url, 200, {}, '+13°'.encode('utf-8'))
+
+        self.app.transport = SimpleNamespace(get=get)
+        provider = CachedPageProvider(self.app)
+        self.app.cache.set(provider.url, '+12°'.encode('utf-8'), ttl=10)
+        scheduler = RefreshScheduler(self.app, [provider], lead=30,
+                                     jitter=0)
+        scheduler.run_pending(now=time.time() + 1)
+        self.app.refresher.wait()
+
+        self.assertEqual(fetched, [provider.url])
+        self.assertEqual([reading.temp for reading in self.recorded], [13])
+        due, _ = scheduler._queue[0]
+        self.assertGreater(due, time.time() + 200)
+
+    def test_stop(self):
+        """Test run loop ends when scheduler is stopped"""
+
+        provider = DummyProvider(self.app)
+        scheduler = RefreshScheduler(self.app, [provider], jitter=0)
+        scheduler.stop()
+        scheduler.run()
+
+        self.assertEqual(provider.fetched, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+""" Unit tests for HttpTransport class """
+
+import os
+import time
+import unittest
+from pathlib import Path
+
+import requests
+
+from weatherapp.core.parsers import SectionWatcher
+from weatherapp.core.ratelimit import HostRateLimiter
+from weatherapp.core.tests.server import StubServer
+from weatherapp.core.transport import HttpTransport
+
+FIXTURES = Path(__file__).parent.parent / 'fixtures'
+
+
+class HttpTransportTestCase(unittest.TestCase):
+    """Unit test case for shared HTTP transport"""
+
+    def setUp(self):
+        self.transport = HttpTransport(read_timeout=0.5)
+
+    def tearDown(self):
+        self.transport.close()
+
+    def test_keep_alive(self):
+        """Test connection is reused between requests to the same host"""
+
+        with StubServer({'/a': b'first', '/b': b'second'}) as server:
+            first = self.transport.get(server.url('/a'))
+            second = self.transport.get(server.url('/b'))
+
+        self.assertEqual(first.content, b'first')
+        self.assertEqual(second.content, b'second')
+        clients = {client for path, headers, client in server.requests}
+        self.assertEqual(len(clients), 1)
+
+    def test_compressed_transfer(self):
+        """Test gzip encoding is requested and decoded"""
+
+        with StubServer({'/': b'page' * 100}) as server:
+            page = self.transport.get(server.url())
+
+        headers = server.requests[0][1]
+        self.assertIn('gzip', headers['Accept-Encoding'])
+        self.assertEqual(page.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(page.content, b'page' * 100)
+
+    def test_stop_after_section(self):
+        """Test streamed download stops once the section is received"""
+
+        page = (FIXTURES / 'rp5_current.html').read_bytes().replace(
+            b'</body>', b'<p>%s</p></body>' % os.urandom(512 * 1024).hex()
+            .encode())
+        with StubServer({'/': page}) as server:
+            watcher = SectionWatcher('archiveString')
+            response = self.transport.get(server.url(), until=watcher)
+
+        self.assertTrue(watcher.complete)
+        self.assertIn(b'wv_1', response.content)
+        self.assertLess(len(response.content), len(page) // 4)
+
+    def test_section_missing(self):
+        """Test whole page is downloaded if the section is not found"""
+
+        page = b'<html><body>%s</body></html>' % (b'x' * 100000)
+        with StubServer({'/': page}) as server:
+            watcher = SectionWatcher('archiveString')
+            response = self.transport.get(server.url(), until=watcher)
+
+        self.assertFalse(watcher.complete)
+        self.assertEqual(response.content, page)
+
+    def test_read_timeout(self):
+        """Test stalled server does not hang the client"""
+
+        with StubServer({'/': b'late'}, delay=1) as server:
+            with self.assertRaises(requests.Timeout):
+                self.transport.get(server.url())
+
+    def test_rate_limit(self):
+        """Test requests over host limit wait for their turn"""
+
+        self.transport.rate_limiter = HostRateLimiter({'127.0.0.1': (20, 1)})
+        with StubServer({'/': b'page'}) as server:
+            start = time.monotonic()
+            for _ in range(3):
+                self.transport.get(server.url())
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+if __name__ == '__main__':
+    unittest.main()
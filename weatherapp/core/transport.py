@@ -0,0 +1,194 @@
+""" HTTP transport shared by all weather providers.
+"""
+import asyncio
+import logging
+import time
+from collections import namedtuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from weatherapp.core import config
+
+# response with the body read completely or up to the point the reader
+# decided to stop
+Response = namedtuple('Response', ['url', 'status_code', 'headers', 'content'])
+
+
+class HttpTransport:
+    """ Pooled HTTP client owned by the application.
+
+    Wraps single ``requests.Session`` so every provider reuses kept-alive
+    connections to the same host instead of doing new TCP and TLS
+    handshakes for every page. All requests ask for compressed transfer
+    and have explicit connect and read timeouts. Requests wait for their
+    turn when the host is over its rate limit.
+
+    :param pool_size: number of kept-alive connections per host
+    :type pool_size: int
+    :param connect_timeout: time to establish connection (in seconds)
+    :type connect_timeout: float
+    :param read_timeout: time to wait for server response (in seconds)
+    :type read_timeout: float
+    :param rate_limiter: per host request limits, none if not given
+    :type rate_limiter: weatherapp.core.ratelimit.HostRateLimiter
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, pool_size=config.HTTP_POOL_SIZE,
+                 connect_timeout=config.HTTP_CONNECT_TIMEOUT,
+                 read_timeout=config.HTTP_READ_TIMEOUT, rate_limiter=None):
+        self.rate_limiter = rate_limiter
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = requests.Session()
+        self.session.headers.update(self.get_default_headers())
+
+        adapter = HTTPAdapter(pool_connections=pool_size,
+                              pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    @staticmethod
+    def get_default_headers():
+        """ Headers sent with every request.
+        """
+
+        return {'User-Agent': config.FAKE_MOZILLA_AGENT,
+                'Accept-Encoding': 'gzip, deflate',
+                'Connection': 'keep-alive'}
+
+    def get_delay(self, url):
+        """ How long the request to the url has to wait for its turn
+        (in seconds).
+        """
+
+        if self.rate_limiter is None:
+            return 0.0
+        delay = self.rate_limiter.reserve(url)
+        if delay:
+            self.logger.debug('Waiting %.2f seconds before requesting %s',
+                              delay, url)
+        return delay
+
+    def get(self, url, headers=None, until=None):
+        """ Send GET request through the connection pool.
+
+        When ``until`` callback is given the body is streamed and the
+        connection is closed as soon as the callback returns True for
+        received chunk, so the rest of the page is never transferred.
+
+        :param url: page address
+        :type url: str
+        :param headers: extra request headers
+        :type headers: dict
+        :param until: called with every received chunk of the body,
+                      returns True when no more data is needed
+        :type until: callable
+        :return: server response
+        :rtype: Response
+        """
+
+        delay = self.get_delay(url)
+        if delay:
+            time.sleep(delay)
+
+        self.logger.debug('GET %s', url)
+        with self.session.get(url, headers=headers, timeout=self.timeout,
+                              stream=until is not None) as page:
+            if until is None:
+                content = page.content
+            else:
+                content = self._read_until(page, until)
+            return Response(page.url, page.status_code, page.headers,
+                            content)
+
+    def _read_until(self, page, until):
+        chunks = []
+        for chunk in page.iter_content(config.HTTP_CHUNK_SIZE):
+            chunks.append(chunk)
+            if until(chunk):
+                self.logger.debug('Stopped reading %s after %d bytes',
+                                  page.url, sum(map(len, chunks)))
+                break
+        return b''.join(chunks)
+
+    def close(self):
+        """ Close all pooled connections.
+        """
+
+        self.session.close()
+
+
+class AsyncHttpTransport:
+    """ Asynchronous counterpart of ``HttpTransport``.
+
+    Runs on the event loop of the application so many pages can be
+    fetched at the same time from a single thread. Has the same
+    pooling, compression and timeout settings as the sync transport.
+    Should be created and closed inside the running event loop.
+
+    :param pool_size: number of kept-alive connections per host
+    :type pool_size: int
+    :param connect_timeout: time to establish connection (in seconds)
+    :type connect_timeout: float
+    :param read_timeout: time to wait for server response (in seconds)
+    :type read_timeout: float
+    :param rate_limiter: per host request limits, none if not given
+    :type rate_limiter: weatherapp.core.ratelimit.HostRateLimiter
+    """
+
+    logger = logging.getLogger(__name__)
+    get_delay = HttpTransport.get_delay
+
+    def __init__(self, pool_size=config.HTTP_POOL_SIZE,
+                 connect_timeout=config.HTTP_CONNECT_TIMEOUT,
+                 read_timeout=config.HTTP_READ_TIMEOUT, rate_limiter=None):
+        import aiohttp
+
+        self.rate_limiter = rate_limiter
+        self.session = aiohttp.ClientSession(
+            headers=HttpTransport.get_default_headers(),
+            connector=aiohttp.TCPConnector(limit_per_host=pool_size),
+            timeout=aiohttp.ClientTimeout(sock_connect=connect_timeout,
+                                          sock_read=read_timeout))
+
+    async def get(self, url, headers=None, until=None):
+        """ Send GET request through the connection pool.
+
+        :param url: page address
+        :type url: str
+        :param headers: extra request headers
+        :type headers: dict
+        :param until: called with every received chunk of the body,
+                      returns True when no more data is needed
+        :type until: callable
+        :return: server response
+        :rtype: Response
+        """
+
+        delay = self.get_delay(url)
+        if delay:
+            await asyncio.sleep(delay)
+
+        self.logger.debug('GET %s', url)
+        async with self.session.get(url, headers=headers) as page:
+            if until is None:
+                content = await page.read()
+            else:
+                chunks = []
+                async for chunk in page.content.iter_chunked(
+                        config.HTTP_CHUNK_SIZE):
+                    chunks.append(chunk)
+                    if until(chunk):
+                        page.close()
+                        break
+                content = b''.join(chunks)
+            return Response(str(page.url), page.status, dict(page.headers),
+                            content)
+
+    async def close(self):
+        """ Close all pooled connections.
+        """
+
+        await self.session.close()